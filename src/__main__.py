@@ -3,11 +3,19 @@ Main entry point for SocketIO Server/Client
 
 Usage:
     python -m src --server  # Run server
-    python -m src --client  # Run client
+    python -m src --server --workers 4  # Run 4 server workers sharing events through a broker
+    python -m src --receiver  # Run receiver client
+    python -m src --sender  # Run sender client
+    python -m src --sender --source synthetic  # Stream frames (synthetic/camera index/video file)
+    python -m src --sender --upload video.mp4  # Upload a file in resumable chunks
+    python -m src --bench  # Run relay benchmark (BENCH_* environment variables)
 """
 import argparse
 import asyncio
 
+from src.config import config
+from src.observability.logger import setup_logging
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="SocketIO Server/Client Demo")
@@ -17,15 +25,40 @@ if __name__ == "__main__":
     group.add_argument("--server", action="store_true", help="Run SocketIO server")
     group.add_argument("--receiver", action="store_true", help="Run SocketIO receiver client")
     group.add_argument("--sender", action="store_true", help="Run SocketIO sender client")
+    group.add_argument("--bench", action="store_true", help="Run relay benchmark with N senders and M receivers")
+
+    # Server options
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Number of server worker processes behind a sticky-session proxy (uses SERVER_BROKER_URL or a local broker)",
+    )
+
+    # Sender options
+    parser.add_argument(
+        "--source",
+        help="Sender streams frames from this source: 'synthetic', camera index or video file path",
+    )
+    parser.add_argument(
+        "--upload",
+        help="Sender uploads this file to its stream in resumable chunks, then exits",
+    )
 
     options = parser.parse_args()
 
-    if options.server:
+    setup_logging(config)
+
+    if options.server and options.workers > 1:
+        from src.run_server import run_workers
+        run_workers(options.workers)
+
+    elif options.server:
         import uvicorn
 
         from src.run_server import create_app
+        from src.transport import TransportSettings
+        transport = TransportSettings.from_config(config)
         app = create_app()
-        uvicorn.run(app, host="0.0.0.0", port=5000)
+        uvicorn.run(app, host=transport.host, port=transport.port, **transport.uvicorn_options())
 
     elif options.receiver:
         from src.run_receiver import run_client as run_receiver
@@ -33,4 +66,8 @@ if __name__ == "__main__":
 
     elif options.sender:
         from src.run_sender import run_client as run_sender
-        asyncio.run(run_sender())
\ No newline at end of file
+        asyncio.run(run_sender(source=options.source, upload=options.upload))
+
+    elif options.bench:
+        from src.run_bench import run_bench
+        asyncio.run(run_bench())
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+latency - Latency histogram kiểu HDR và phát hiện handler chậm
+
+Trách nhiệm:
+- LatencyHistogram: log-linear buckets cố định trên nanoseconds, tính bucket
+  index bằng phép toán bit, counts preallocated; record() không tạo object
+  container nào trên hot path
+- SlowCallDetector: báo các call chặn event loop lâu hơn ngưỡng, rate-limit
+  theo key để không spam log
+
+Usage:
+    histogram = LatencyHistogram()
+    start = time.monotonic_ns()
+    ...
+    histogram.record(time.monotonic_ns() - start)
+    histogram.percentile(99.0)  # nanoseconds
+"""
+import time
+from logging import Logger
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram (HDR-style) cho latency tính bằng nanoseconds.
+
+    Mỗi octave (2^k) chia thành 2^SUB_BUCKET_BITS sub-buckets, sai số tương
+    đối tối đa ~1/2^SUB_BUCKET_BITS. Giá trị dưới 1 unit rơi vào bucket 0,
+    giá trị vượt range rơi vào bucket cuối.
+    """
+
+    # 1 unit = 2^10 ns (~1µs)
+    UNIT_SHIFT = 10
+    # 8 sub-buckets mỗi octave -> sai số <= 12.5%
+    SUB_BUCKET_BITS = 3
+    # Range tới 2^26 units (~69 giây)
+    MAX_MAGNITUDE = 26
+
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    BUCKET_COUNT = (MAX_MAGNITUDE - SUB_BUCKET_BITS + 2) * SUB_BUCKET_COUNT
+
+    __slots__ = ("counts", "count", "sum_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    @classmethod
+    def bucket_index(cls, value_ns: int) -> int:
+        """
+        Tính bucket index cho một giá trị
+
+        Args:
+            value_ns: Latency (nanoseconds)
+
+        Returns:
+            Index trong counts
+        """
+        units = value_ns >> cls.UNIT_SHIFT
+        if units < cls.SUB_BUCKET_COUNT:
+            # Vùng tuyến tính: mỗi unit một bucket
+            return units if units > 0 else 0
+
+        magnitude = units.bit_length() - 1
+        shift = magnitude - cls.SUB_BUCKET_BITS
+        index = (shift + 1) * cls.SUB_BUCKET_COUNT + (units >> shift) - cls.SUB_BUCKET_COUNT
+        return index if index < cls.BUCKET_COUNT else cls.BUCKET_COUNT - 1
+
+    @classmethod
+    def bucket_upper_bound(cls, index: int) -> int:
+        """
+        Giá trị lớn nhất (nanoseconds, exclusive) của một bucket
+
+        Args:
+            index: Bucket index
+
+        Returns:
+            Upper bound (nanoseconds)
+        """
+        if index < cls.SUB_BUCKET_COUNT:
+            return (index + 1) << cls.UNIT_SHIFT
+
+        shift = index // cls.SUB_BUCKET_COUNT - 1
+        sub = index % cls.SUB_BUCKET_COUNT + cls.SUB_BUCKET_COUNT
+        return ((sub + 1) << shift) << cls.UNIT_SHIFT
+
+    def record(self, value_ns: int) -> None:
+        """
+        Ghi nhận một latency
+
+        Args:
+            value_ns: Latency (nanoseconds)
+        """
+        self.counts[self.bucket_index(value_ns)] += 1
+        self.count += 1
+        self.sum_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, percent: float) -> int:
+        """
+        Ước lượng percentile (upper bound của bucket chứa percentile)
+
+        Args:
+            percent: 0-100
+
+        Returns:
+            Latency (nanoseconds), 0 nếu chưa có dữ liệu
+        """
+        if self.count == 0:
+            return 0
+
+        target = max(1, round(self.count * percent / 100.0))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(self.bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    def cumulative_counts(self, upper_bounds_ns: tuple[int, ...]) -> list[int]:
+        """
+        Gộp buckets thành cumulative counts theo các ngưỡng cho trước
+
+        Dùng khi export sang Prometheus histogram (chỉ chạy lúc scrape).
+
+        Args:
+            upper_bounds_ns: Các ngưỡng tăng dần (nanoseconds)
+
+        Returns:
+            Cumulative count cho từng ngưỡng
+        """
+        result = []
+        cumulative = 0
+        index = 0
+        for bound in upper_bounds_ns:
+            while index < self.BUCKET_COUNT and self.bucket_upper_bound(index) <= bound:
+                cumulative += self.counts[index]
+                index += 1
+            result.append(cumulative)
+        return result
+
+    def snapshot(self) -> dict:
+        """
+        Tóm tắt histogram (milliseconds)
+
+        Returns:
+            Dict gồm count, mean, p50, p90, p99, p999, max
+        """
+        to_ms = 1e-6
+        return {
+            "count": self.count,
+            "mean_ms": (self.sum_ns / self.count) * to_ms if self.count else 0.0,
+            "p50_ms": self.percentile(50.0) * to_ms,
+            "p90_ms": self.percentile(90.0) * to_ms,
+            "p99_ms": self.percentile(99.0) * to_ms,
+            "p999_ms": self.percentile(99.9) * to_ms,
+            "max_ms": self.max_ns * to_ms,
+        }
+
+
+class SlowCallDetector:
+    """
+    Báo các call vượt ngưỡng thời gian, tối đa một log mỗi `report_interval`
+    giây cho mỗi key (các lần bị gộp được đếm và báo kèm).
+
+    Usage:
+        if elapsed_ns > detector.threshold_ns:
+            detector.report(key, elapsed_ns)
+    """
+
+    def __init__(self, logger: Logger, threshold_ms: float, report_interval: float = 1.0):
+        """
+        Args:
+            logger: Logger để báo call chậm
+            threshold_ms: Ngưỡng (milliseconds), <= 0 để tắt
+            report_interval: Khoảng cách tối thiểu (giây) giữa hai log cho cùng key
+        """
+        self._logger = logger
+        # Tắt bằng ngưỡng vô cực để wrapper chỉ cần một phép so sánh
+        self.threshold_ns = int(threshold_ms * 1_000_000) if threshold_ms > 0 else float("inf")
+        self._interval_ns = int(report_interval * 1_000_000_000)
+        self._last_report_ns: dict = {}
+        self._suppressed: dict = {}
+
+        # Tổng số call chậm theo key
+        self.slow_counts: dict = {}
+
+    def report(self, key, elapsed_ns: int) -> None:
+        """
+        Ghi nhận một call chậm
+
+        Args:
+            key: Key của call (ví dụ (namespace, event))
+            elapsed_ns: Thời gian thực thi (nanoseconds)
+        """
+        self.slow_counts[key] = self.slow_counts.get(key, 0) + 1
+
+        now = time.monotonic_ns()
+        last = self._last_report_ns.get(key)
+        if last is not None and now - last < self._interval_ns:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+
+        suppressed = self._suppressed.pop(key, 0)
+        self._last_report_ns[key] = now
+        self._logger.warning(
+            "Slow handler %s took %.1f ms (threshold %.1f ms, %d more since last report)",
+            key, elapsed_ns / 1e6, self.threshold_ns / 1e6, suppressed,
+        )
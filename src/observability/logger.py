@@ -0,0 +1,119 @@
+"""
+logger - Logging subsystem dùng chung cho server và clients
+
+Trách nhiệm:
+- Cấu hình logger gốc "src" với level từ Config
+- Non-blocking backend: QueueHandler đẩy record vào queue, QueueListener
+  (background thread) ghi ra stderr, event loop không bao giờ chờ I/O
+- EventSampler: chỉ log 1/N events cho mỗi (namespace, event) trên hot path
+
+Usage:
+    setup_logging(config)           # một lần, trong entry point
+    logger = get_logger(__name__)   # trong từng module
+"""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from src.config import Config, ConfigInvalidValueError
+
+# Logger gốc của project, mọi module dưới package `src` kế thừa
+ROOT_LOGGER_NAME = "src"
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(name)s] %(message)s"
+
+# Log 1/N events cho mỗi key trên hot path (thay đổi bởi setup_logging)
+DEFAULT_SAMPLE_EVERY = 100
+
+_listener: QueueListener | None = None
+_sample_every = DEFAULT_SAMPLE_EVERY
+
+
+def setup_logging(config: Config) -> None:
+    """
+    Cấu hình logging cho process hiện tại (idempotent)
+
+    Config keys:
+        LOG_LEVEL: DEBUG, INFO, WARNING, ERROR (mặc định INFO)
+        LOG_EVENT_SAMPLE_EVERY: Log 1/N events cho mỗi event (mặc định 100)
+
+    Args:
+        config: Config instance
+
+    Raises:
+        ConfigInvalidValueError: Nếu LOG_LEVEL không hợp lệ
+    """
+    global _listener, _sample_every
+
+    if _listener is not None:
+        return
+
+    level_name = config.get_config("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        raise ConfigInvalidValueError(f"value of LOG_LEVEL is not valid level: '{level_name}'")
+
+    _sample_every = max(1, config.get_int("LOG_EVENT_SAMPLE_EVERY", DEFAULT_SAMPLE_EVERY))
+
+    # Handler thật chạy trong listener thread
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    root.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Lấy logger cho một module
+
+    Args:
+        name: Tên module (thường là __name__)
+
+    Returns:
+        Logger instance
+    """
+    return logging.getLogger(name)
+
+
+class EventSampler:
+    """
+    Per-event sampling cho log trên hot path.
+
+    Event đầu tiên của mỗi key luôn được log, sau đó cứ mỗi N events log một lần.
+
+    Usage:
+        if logger.isEnabledFor(logging.DEBUG) and sampler.should_log(key):
+            logger.debug(...)
+    """
+
+    def __init__(self, every: int | None = None):
+        """
+        Args:
+            every: Log 1/every events cho mỗi key (mặc định theo setup_logging)
+        """
+        self.every = every or _sample_every
+        self._counts: dict = {}
+
+    def should_log(self, key) -> bool:
+        """
+        Đếm một event và cho biết có nên log event này không
+
+        Args:
+            key: Key để đếm riêng (ví dụ (namespace, event))
+
+        Returns:
+            True nếu event này được chọn để log
+        """
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        return count % self.every == 0
@@ -0,0 +1,156 @@
+"""
+loop_monitor - Đo asyncio scheduling lag và bắt stack của code chặn event loop
+
+Hai thành phần:
+- Heartbeat task trong event loop: sleep `interval`, đo độ trễ khi được
+  đánh thức lại (lag) và ghi vào histogram
+- Watchdog thread: nếu heartbeat không chạy quá `interval + threshold`,
+  event loop đang bị chặn; thread chụp stack hiện tại của loop thread
+  (sys._current_frames) nên log chỉ đúng code đang chặn, không phải code
+  chạy sau khi loop đã thoát khỏi đoạn blocking
+
+Usage:
+    monitor = LoopLagMonitor.from_config(config)
+    monitor.start()        # trong coroutine đang chạy trên loop
+    ...
+    await monitor.stop()
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from src.config import Config
+from src.observability import metrics
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Event-loop lag monitor cho server và client processes.
+    """
+
+    def __init__(self, interval_ms: float = 100.0, threshold_ms: float = 100.0):
+        """
+        Args:
+            interval_ms: Chu kỳ heartbeat (milliseconds)
+            threshold_ms: Lag tối đa cho phép trước khi báo và chụp stack
+        """
+        self._interval = interval_ms / 1000.0
+        self._threshold = threshold_ms / 1000.0
+
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+        self._loop_thread_id: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # time.monotonic() của heartbeat gần nhất, đọc từ watchdog thread
+        self._last_beat = 0.0
+        # Watchdog chỉ báo một lần cho mỗi lần bị chặn
+        self._stall_reported = False
+
+        self._lag = metrics.LOOP_LAG.labels()
+        self._stalls = metrics.LOOP_STALLS.labels()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "LoopLagMonitor | None":
+        """
+        Tạo monitor từ Config
+
+        Config keys:
+            LOOP_MONITOR_ENABLED: Bật/tắt (mặc định true)
+            LOOP_MONITOR_INTERVAL_MS: Chu kỳ heartbeat (mặc định 100)
+            LOOP_LAG_THRESHOLD_MS: Ngưỡng báo lag (mặc định 100)
+
+        Args:
+            config: Config instance
+
+        Returns:
+            LoopLagMonitor hoặc None nếu bị tắt
+        """
+        if not config.get_bool("LOOP_MONITOR_ENABLED", True):
+            return None
+        return cls(
+            interval_ms=config.get_float("LOOP_MONITOR_INTERVAL_MS", 100.0),
+            threshold_ms=config.get_float("LOOP_LAG_THRESHOLD_MS", 100.0),
+        )
+
+    def start(self) -> None:
+        """
+        Start heartbeat task và watchdog thread trên event loop hiện tại
+        """
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+
+        self._task = self._loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Dừng heartbeat task và watchdog thread"""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._thread = None
+
+    async def _heartbeat(self) -> None:
+        """Đo lag mỗi chu kỳ: thời gian thức dậy thực tế trừ thời gian sleep"""
+        interval = self._interval
+        while True:
+            before = time.monotonic_ns()
+            await asyncio.sleep(interval)
+            now = time.monotonic_ns()
+
+            lag_ns = max(0, now - before - int(interval * 1_000_000_000))
+            self._lag.record(lag_ns)
+            self._last_beat = now / 1_000_000_000
+            self._stall_reported = False
+
+    def _watchdog(self) -> None:
+        """Chạy trong thread riêng, chụp stack của loop thread khi loop bị chặn"""
+        poll = min(self._interval, self._threshold) / 2
+        limit = self._interval + self._threshold
+
+        while not self._stopped.wait(poll):
+            stalled_for = time.monotonic() - self._last_beat
+            if stalled_for <= limit or self._stall_reported:
+                continue
+
+            self._stall_reported = True
+            self._stalls.inc()
+            logger.warning(
+                "Event loop blocked for %.0f ms (threshold %.0f ms)%s\n%s",
+                stalled_for * 1000, self._threshold * 1000,
+                self._describe_current_task(), self._capture_loop_stack(),
+            )
+
+    def _capture_loop_stack(self) -> str:
+        """Stack hiện tại của loop thread"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return "<loop thread not found>"
+        return "".join(traceback.format_stack(frame))
+
+    def _describe_current_task(self) -> str:
+        """Tên coroutine đang chạy trên loop (nếu có)"""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return ""
+        if task is None:
+            return ""
+        return f" in task {task.get_name()} ({task.get_coro()!r})"
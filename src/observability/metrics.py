@@ -0,0 +1,446 @@
+"""
+metrics - Prometheus-style metrics không cần thư viện ngoài
+
+Trách nhiệm:
+- Counter, Gauge, Histogram với labels
+- LatencyMetric: histogram family dựa trên LatencyHistogram (HDR-style),
+  hot path ghi nanoseconds, chỉ quy đổi sang Prometheus buckets lúc scrape
+- Render text exposition format (version 0.0.4) cho endpoint /metrics
+- Metric families dùng chung cho SocketIO registries
+
+Hot path nên resolve child một lần rồi giữ lại:
+    received = EVENTS_RECEIVED.labels("/", "publish")
+    received.inc()
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable
+
+from src.observability.latency import LatencyHistogram
+
+# Buckets mặc định cho latency (giây)
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape label value theo text exposition format"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Render {name="value",...}"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Render số theo format Prometheus"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def payload_size(data) -> int:
+    """
+    Ước lượng kích thước payload (bytes) mà không serialize
+
+    Đếm bytes/str và duyệt dict/list; các kiểu khác tính là 0.
+
+    Args:
+        data: Event data
+
+    Returns:
+        Số bytes ước lượng
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(len(key) + payload_size(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return sum(payload_size(item) for item in data)
+    return 0
+
+
+# ----------
+# Metric primitives
+# ----------
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        # counts[i] = số observation rơi vào bucket i (không cumulative), cuối cùng là +Inf
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric(ABC):
+    """
+    Base class cho một metric family (tên + labels).
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        """
+        Args:
+            name: Tên metric
+            documentation: Mô tả (HELP)
+            labelnames: Tên các labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _new_child(self):
+        """Tạo child cho một bộ label values (subclass PHẢI implement)"""
+
+    def labels(self, *values: str):
+        """
+        Lấy (hoặc tạo) child cho bộ label values
+
+        Args:
+            *values: Label values theo thứ tự labelnames
+
+        Returns:
+            Child metric
+
+        Raises:
+            ValueError: Nếu số label values không khớp
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric '{self.name}' cần {len(self.labelnames)} labels, nhận {len(values)}"
+                )
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _render_samples(self) -> list[str]:
+        """Các dòng sample theo text exposition format (subclass PHẢI implement)"""
+
+    def render(self) -> list[str]:
+        """
+        Render metric family thành các dòng text exposition
+
+        Returns:
+            List các dòng
+        """
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._render_samples(),
+        ]
+
+
+class Counter(Metric):
+    """Counter chỉ tăng"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Tăng counter không có labels"""
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._children.items()
+        ]
+
+
+class Gauge(Metric):
+    """Gauge có thể tăng/giảm, hoặc tính giá trị lúc scrape qua set_function()"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Callable[[], float] | None = None
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set gauge không có labels"""
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Tính giá trị gauge (không labels) lúc scrape
+
+        Args:
+            function: Callable trả về giá trị hiện tại
+        """
+        self._function = function
+
+    def _render_samples(self) -> list[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self._function())}"]
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._children.items()
+        ]
+
+
+class Histogram(Metric):
+    """Histogram với fixed buckets"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe cho histogram không có labels"""
+        self.labels().observe(value)
+
+    def _render_samples(self) -> list[str]:
+        lines = []
+        for values, child in self._children.items():
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                le = f'le="{_format_value(upper_bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class LatencyMetric(Metric):
+    """
+    Histogram family mà mỗi child là một LatencyHistogram (nanoseconds).
+
+    Hot path:
+        child = HANDLER_DURATION.labels("/", "publish")
+        child.record(elapsed_ns)
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            name: Tên metric (đơn vị giây khi export)
+            documentation: Mô tả (HELP)
+            labelnames: Tên các labels
+            buckets: Prometheus buckets (giây) dùng khi export
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._bounds_ns = tuple(int(bound * 1_000_000_000) for bound in self.buckets)
+
+    def _new_child(self):
+        return LatencyHistogram()
+
+    def _render_samples(self) -> list[str]:
+        lines = []
+        for values, child in self._children.items():
+            cumulative = child.cumulative_counts(self._bounds_ns) + [child.count]
+            for upper_bound, count in zip(self.buckets + (float("inf"),), cumulative):
+                le = f'le="{_format_value(upper_bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {count}"
+                )
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum_ns / 1_000_000_000)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Tập hợp các metric families của một process.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Đăng ký metric family
+
+        Args:
+            metric: Metric instance
+
+        Returns:
+            Chính metric đó
+
+        Raises:
+            ValueError: Nếu tên metric đã tồn tại
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric đã tồn tại: '{metric.name}'")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def latency(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> LatencyMetric:
+        return self.register(LatencyMetric(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Render toàn bộ metrics theo text exposition format
+
+        Returns:
+            Text cho response /metrics
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Content-Type của text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Registry mặc định của process
+REGISTRY = MetricsRegistry()
+
+# ----------
+# SocketIO metric families
+# ----------
+
+EVENT_LABELS = ("namespace", "event")
+
+CONNECTED_CLIENTS = REGISTRY.gauge(
+    "socketio_connected_clients", "Number of connected clients", ("namespace",)
+)
+EVENTS_RECEIVED = REGISTRY.counter(
+    "socketio_events_received_total", "Events received from peers", EVENT_LABELS
+)
+EVENTS_EMITTED = REGISTRY.counter(
+    "socketio_events_emitted_total", "Events emitted (one per emit call, not per recipient)", EVENT_LABELS
+)
+BYTES_RECEIVED = REGISTRY.counter(
+    "socketio_received_bytes_total", "Estimated payload bytes received", EVENT_LABELS
+)
+BYTES_EMITTED = REGISTRY.counter(
+    "socketio_emitted_bytes_total", "Estimated payload bytes emitted (one per emit call)", EVENT_LABELS
+)
+HANDLER_DURATION = REGISTRY.latency(
+    "socketio_handler_duration_seconds", "Event handler execution time", EVENT_LABELS
+)
+SLOW_HANDLERS = REGISTRY.counter(
+    "socketio_slow_handlers_total", "Handler calls slower than the configured threshold", EVENT_LABELS
+)
+HANDLER_ERRORS = REGISTRY.counter(
+    "socketio_handler_errors_total", "Exceptions raised by event handlers", EVENT_LABELS
+)
+OUTBOUND_BATCHES = REGISTRY.counter(
+    "socketio_outbound_batches_total", "Packets emitted by the outbound batcher", ("namespace",)
+)
+OUTBOUND_BATCHED_EVENTS = REGISTRY.counter(
+    "socketio_outbound_batched_events_total", "Events carried by outbound batcher packets", ("namespace",)
+)
+RELAY_LAGGING_RECEIVERS = REGISTRY.gauge(
+    "relay_lagging_receivers", "Receivers currently skipped by the relay because they lag"
+)
+CONNECTIONS_REFUSED = REGISTRY.counter(
+    "socketio_connections_refused_total", "Connections refused by the connect handshake", ("namespace",)
+)
+RELAY_PUBLISH_DENIED = REGISTRY.counter(
+    "relay_publish_denied_total", "Publishes rejected because the session may not publish the stream"
+)
+RELAY_SESSIONS = REGISTRY.gauge(
+    "relay_sessions", "Sessions connected to this worker", ("role",)
+)
+
+# ----------
+# Event loop metric families
+# ----------
+
+LOOP_LAG = REGISTRY.latency(
+    "asyncio_loop_lag_seconds", "Delay between scheduled and actual heartbeat wake-up"
+)
+LOOP_STALLS = REGISTRY.counter(
+    "asyncio_loop_stalls_total", "Times the event loop was blocked longer than the threshold"
+)
@@ -0,0 +1,266 @@
+"""
+Benchmark entry point - N senders, M receivers qua server relay
+
+Start server từ `create_app` trong cùng process (hoặc dùng server có sẵn qua
+BENCH_URL), tạo senders/receivers bằng SenderEventRegistry/ReceiverEventRegistry,
+publish payload với kích thước và rate cấu hình được, rồi báo cáo throughput,
+end-to-end latency percentiles, CPU và RSS.
+
+Config (environment):
+    BENCH_SENDERS: Số senders (mặc định 1)
+    BENCH_RECEIVERS: Số receivers (mặc định 10)
+    BENCH_PAYLOAD_BYTES: Kích thước payload binary (mặc định 65536)
+    BENCH_RATE: Messages/giây của mỗi sender (mặc định 30.0)
+    BENCH_DURATION: Thời gian đo (giây, mặc định 10.0)
+    BENCH_WARMUP: Thời gian warmup không tính (giây, mặc định 1.0)
+    BENCH_PORT: Port cho server in-process (mặc định 5001)
+    BENCH_URL: Nếu set, dùng server có sẵn thay vì start in-process
+"""
+import asyncio
+import json
+import os
+import resource
+import time
+from dataclasses import asdict, dataclass
+
+from socketio import AsyncClient
+
+from src.config import Config, ConfigInvalidValueError, config
+from src.observability.latency import LatencyHistogram
+from src.observability.logger import get_logger
+from src.socketio_client.receiver.registry import ReceiverEventRegistry
+from src.socketio_client.sender.enum.SenderEvent import SenderEvent
+from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
+from src.socketio_client.sender.registry import SenderEventRegistry
+from src.serializer import SerializerSettings
+from src.transport import TransportSettings
+
+logger = get_logger(__name__)
+
+BENCH_STREAM_ID = "bench"
+
+
+@dataclass(frozen=True)
+class BenchSettings:
+    """
+    Immutable dataclass chứa cấu hình benchmark.
+    """
+    senders: int = 1
+    receivers: int = 10
+    payload_bytes: int = 65536
+    rate: float = 30.0
+    duration: float = 10.0
+    warmup: float = 1.0
+    port: int = 5001
+    url: str = ""
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.senders < 1 or self.receivers < 1:
+            raise ConfigInvalidValueError("senders and receivers must be positive")
+        if self.rate <= 0 or self.duration <= 0:
+            raise ConfigInvalidValueError("rate and duration must be positive")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "BenchSettings":
+        return cls(
+            senders=config.get_int("BENCH_SENDERS", cls.senders),
+            receivers=config.get_int("BENCH_RECEIVERS", cls.receivers),
+            payload_bytes=config.get_int("BENCH_PAYLOAD_BYTES", cls.payload_bytes),
+            rate=config.get_float("BENCH_RATE", cls.rate),
+            duration=config.get_float("BENCH_DURATION", cls.duration),
+            warmup=config.get_float("BENCH_WARMUP", cls.warmup),
+            port=config.get_int("BENCH_PORT", cls.port),
+            url=config.get_config("BENCH_URL", cls.url),
+        )
+
+
+class BenchStats:
+    """Counters của một lần benchmark, chỉ đếm khi `measuring` bật"""
+
+    def __init__(self):
+        self.measuring = False
+        self.sent = 0
+        self.received = 0
+        self.received_bytes = 0
+        self.latency = LatencyHistogram()
+
+    def on_relay(self, data: dict) -> None:
+        """Relay listener của receivers"""
+        if not self.measuring:
+            return
+        self.received += 1
+        self.received_bytes += len(data["data"])
+        self.latency.record(time.time_ns() - data["ts"])
+
+
+def _process_usage() -> tuple[float, int]:
+    """
+    CPU time (user + system, giây) và RSS hiện tại (bytes) của process
+    """
+    cpu = time.process_time()
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Fallback: peak RSS (KB trên Linux)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return cpu, rss
+
+
+async def _start_server(port: int, transport: TransportSettings):
+    """
+    Start server từ create_app trong event loop hiện tại
+
+    Returns:
+        (uvicorn.Server, serve task)
+    """
+    import uvicorn
+
+    from src.run_server import create_app
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(), host="127.0.0.1", port=port, log_level="warning", **transport.uvicorn_options()
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            # Raise lỗi start server (ví dụ port đã bị dùng)
+            await task
+            raise RuntimeError("Benchmark server stopped before starting")
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+def _create_client(transport: TransportSettings) -> AsyncClient:
+    return AsyncClient(
+        logger=False,
+        engineio_logger=False,
+        **transport.client_options(),
+        **SerializerSettings.from_config(config).socketio_options(),
+    )
+
+
+def _auth(registry) -> dict:
+    token = config.get_config("CLIENT_AUTH_TOKEN", "")
+    return {**registry.get_auth(), "token": token} if token else registry.get_auth()
+
+
+async def _connect_receiver(url: str, transport: TransportSettings, stats: BenchStats) -> AsyncClient:
+    sio = _create_client(transport)
+    registry = ReceiverEventRegistry(sio)
+    registry.add_relay_listener(stats.on_relay)
+
+    # Stream được khai báo trong auth payload, server subscribe lúc connect
+    await registry.subscribe(BENCH_STREAM_ID)
+    await sio.connect(url, namespaces=['/'], transports=list(transport.transports), auth=_auth(registry))
+    return sio
+
+
+async def _connect_sender(url: str, transport: TransportSettings) -> AsyncClient:
+    sio = _create_client(transport)
+    registry = SenderEventRegistry(sio)
+
+    auth = {**_auth(registry), "streams": [BENCH_STREAM_ID]}
+    await sio.connect(url, namespaces=['/'], transports=list(transport.transports), auth=auth)
+    return sio
+
+
+async def _sender_loop(sio: AsyncClient, settings: BenchSettings, payload: bytes, stats: BenchStats):
+    """Publish payload với rate cố định cho tới khi bị cancel"""
+    loop = asyncio.get_running_loop()
+    interval = 1.0 / settings.rate
+    deadline = loop.time()
+    seq = 0
+
+    while True:
+        await sio.emit(
+            SenderEvent.PUBLISH.value,
+            {"stream": BENCH_STREAM_ID, "seq": seq, "ts": time.time_ns(), "data": payload},
+            namespace=SenderNamespace.ROOT.value,
+        )
+        seq += 1
+        if stats.measuring:
+            stats.sent += 1
+
+        deadline = max(deadline + interval, loop.time())
+        await asyncio.sleep(deadline - loop.time())
+
+
+async def run_bench(settings: BenchSettings | None = None) -> dict:
+    """
+    Chạy benchmark và trả về report
+
+    Args:
+        settings: Cấu hình benchmark (mặc định đọc từ config)
+
+    Returns:
+        Report dict (cũng được in ra stdout dạng JSON)
+    """
+    settings = settings or BenchSettings.from_config(config)
+    transport = TransportSettings.from_config(config)
+    stats = BenchStats()
+
+    server = server_task = None
+    url = settings.url
+    if not url:
+        server, server_task = await _start_server(settings.port, transport)
+        url = f"http://127.0.0.1:{settings.port}"
+
+    clients: list[AsyncClient] = []
+    sender_tasks: list[asyncio.Task] = []
+    try:
+        receivers = await asyncio.gather(
+            *(_connect_receiver(url, transport, stats) for _ in range(settings.receivers))
+        )
+        senders = await asyncio.gather(*(_connect_sender(url, transport) for _ in range(settings.senders)))
+        clients.extend(receivers)
+        clients.extend(senders)
+
+        # Payload dùng chung, không tạo bytes mới mỗi message
+        payload = os.urandom(settings.payload_bytes)
+        sender_tasks = [
+            asyncio.create_task(_sender_loop(sio, settings, payload, stats)) for sio in senders
+        ]
+
+        logger.info("Warming up for %.1fs", settings.warmup)
+        await asyncio.sleep(settings.warmup)
+
+        cpu_start, _ = _process_usage()
+        wall_start = time.monotonic()
+        stats.measuring = True
+
+        await asyncio.sleep(settings.duration)
+
+        stats.measuring = False
+        elapsed = time.monotonic() - wall_start
+        cpu_end, rss = _process_usage()
+
+    finally:
+        for task in sender_tasks:
+            task.cancel()
+        await asyncio.gather(*sender_tasks, return_exceptions=True)
+        await asyncio.gather(*(sio.disconnect() for sio in clients), return_exceptions=True)
+        if server is not None:
+            server.should_exit = True
+            await server_task
+
+    expected = stats.sent * settings.receivers
+    report = {
+        "settings": asdict(settings),
+        "in_process_server": not settings.url,
+        "elapsed_s": elapsed,
+        "sent": stats.sent,
+        "received": stats.received,
+        "delivery_ratio": stats.received / expected if expected else 0.0,
+        "sent_per_s": stats.sent / elapsed,
+        "received_per_s": stats.received / elapsed,
+        "received_mb_per_s": stats.received_bytes / elapsed / 1e6,
+        "latency": stats.latency.snapshot(),
+        "cpu_percent": 100.0 * (cpu_end - cpu_start) / elapsed,
+        "rss_mb": rss / 1e6,
+    }
+    print(json.dumps(report, indent=2))
+    return report
@@ -4,25 +4,95 @@ Main client entry point - DDD Architecture Demo
 import asyncio
 from socketio import AsyncClient
 
+from src.config import config
+from src.observability.logger import get_logger
+from src.observability.loop_monitor import LoopLagMonitor
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
 from src.socketio_client.receiver.registry import ReceiverEventRegistry
+from src.socketio_client.receiver.service.AssemblySettings import AssemblySettings
+from src.socketio_client.receiver.service.DecodeSettings import DecodeSettings
+from src.socketio_client.receiver.service.FeedbackReporter import FeedbackReporter
+from src.socketio_client.shared.service.ConnectionSupervisor import ConnectionSupervisor
+from src.socketio_client.shared.service.ReconnectPolicy import ReconnectPolicy
+from src.serializer import SerializerSettings
+from src.transport import TransportSettings
+
+logger = get_logger(__name__)
 
 
 async def run_client():
     """Run SocketIO Client"""
     # Create SocketIO client
-    sio = AsyncClient(logger=False, engineio_logger=False)
-    ReceiverEventRegistry(sio)
+    transport = TransportSettings.from_config(config)
+    sio = AsyncClient(
+        # Reconnect do ConnectionSupervisor quản lý (jitter + session resumption)
+        reconnection=False,
+        logger=False,
+        engineio_logger=False,
+        **transport.client_options(),
+        **SerializerSettings.from_config(config).socketio_options(),
+    )
+    registry = ReceiverEventRegistry(sio, AssemblySettings.from_config(config))
+    registry.transfers.add_listener(
+        lambda transfer, payload: logger.info(
+            "Received transfer %s on '%s': %d bytes, meta=%s",
+            transfer.id, transfer.stream, transfer.size, transfer.meta,
+        )
+    )
+    token = config.get_config("CLIENT_AUTH_TOKEN", "")
+    supervisor = ConnectionSupervisor(
+        sio, registry, transport, ReconnectPolicy.from_config(config),
+        auth={"token": token} if token else None,
+    )
 
-    try:
-        await sio.connect('http://localhost:5000', namespaces=['/'])
+    # Streams cần nhận, khai báo trong auth payload nên server subscribe ngay
+    # lúc connect (kể cả mỗi lần reconnect)
+    for stream_id in config.get_list("RECEIVER_STREAMS", ",", ["default"]):
+        await registry.subscribe(stream_id)
+
+    # Decode frames ngoài event loop vào ring buffer (cần opencv hoặc Pillow)
+    pipeline = None
+    decode = DecodeSettings.from_config(config)
+    if decode.enabled:
+        from src.socketio_client.receiver.service.DecodePipeline import DecodePipeline
+        pipeline = DecodePipeline(decode)
+        registry.add_relay_listener(pipeline.on_relay)
+        if decode.shm_name:
+            logger.info("Publishing decoded frames to shared memory '%s'", decode.shm_name)
 
-        # Do something here
+    # Report tình trạng định kỳ, server tổng hợp về sender để điều chỉnh quality
+    feedback_task = None
+    feedback_interval = config.get_float("RECEIVER_FEEDBACK_INTERVAL_S", 1.0)
+    if feedback_interval > 0:
+        reporter = FeedbackReporter(sio, ReceiverNamespace.ROOT, feedback_interval, pipeline, registry.hop_latency)
+        feedback_task = asyncio.create_task(reporter.run())
 
-        # Keep client running
-        await sio.wait()
+    async def on_connected(resumed: bool) -> None:
+        # Lấy lại các payload relay và chunks bị lỡ trong lúc mất kết nối
+        await registry.request_replay()
+        await registry.transfers.resume()
+
+    # Event-loop lag monitor
+    monitor = LoopLagMonitor.from_config(config)
+    if monitor is not None:
+        monitor.start()
+
+    try:
+        # Keep client running, reconnect khi mất kết nối
+        await supervisor.run(on_connected)
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-        print("Make sure the server is running!")
+        logger.error("❌ Error: %s", e)
+        logger.error("Make sure the server is running!")
     finally:
-        await sio.disconnect()
\ No newline at end of file
+        if feedback_task is not None:
+            feedback_task.cancel()
+        await sio.disconnect()
+        registry.transfers.close()
+        if pipeline is not None:
+            pipeline.close()
+            logger.info("Decode stats: %s", pipeline.get_stats())
+        if registry.hop_latency.traced:
+            logger.info("Hop latency: %s", registry.get_hop_latency())
+        if monitor is not None:
+            await monitor.stop()
\ No newline at end of file
@@ -2,27 +2,126 @@
 Main client entry point - DDD Architecture Demo
 """
 import asyncio
+import os
+from dataclasses import replace
 from socketio import AsyncClient
 
+from src.observability.logger import get_logger
+from src.observability.loop_monitor import LoopLagMonitor
+from src.config import config
+from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
 from src.socketio_client.sender.registry import SenderEventRegistry
+from src.socketio_client.sender.service.FrameStreamer import FrameStreamer
+from src.socketio_client.sender.service.QualityController import QualityController
+from src.socketio_client.sender.service.QualitySettings import QualitySettings
+from src.socketio_client.sender.service.StreamSettings import StreamSettings
+from src.socketio_client.sender.service.UploadSettings import UploadSettings
+from src.socketio_client.shared.service.BatchEmitter import BatchEmitter
+from src.socketio_client.shared.service.BatchSettings import BatchSettings
+from src.socketio_client.shared.service.ConnectionSupervisor import ConnectionSupervisor
+from src.socketio_client.shared.service.ReconnectPolicy import ReconnectPolicy
+from src.serializer import SerializerSettings
+from src.transport import TransportSettings
 
+logger = get_logger(__name__)
+
+
+async def run_client(source: str | None = None, upload: str | None = None):
+    """
+    Run SocketIO Client
+
+    Args:
+        source: Nếu có, stream frames từ source này ("synthetic",
+                camera index hoặc video file) thay vì chỉ connect
+        upload: Nếu có, upload file này lên stream theo chunks rồi thoát
+    """
+    settings = StreamSettings.from_config(config)
 
-async def run_client():
-    """Run SocketIO Client"""
     # Create SocketIO client
-    sio = AsyncClient(logger=False, engineio_logger=False)
-    SenderEventRegistry(sio)
+    transport = TransportSettings.from_config(config)
+    sio = AsyncClient(
+        # Reconnect do ConnectionSupervisor quản lý (jitter + session resumption)
+        reconnection=False,
+        logger=False,
+        engineio_logger=False,
+        **transport.client_options(),
+        **SerializerSettings.from_config(config).socketio_options(),
+    )
+    # Adaptive quality: quality/scale/fps trong StreamSettings là mức tối đa
+    quality_settings = QualitySettings.from_config(config)
+    quality = None
+    if quality_settings.enabled:
+        quality = QualityController(quality_settings, settings.quality, settings.scale, settings.fps)
+    registry = SenderEventRegistry(
+        sio, frame_queue_size=settings.queue_size, upload_settings=UploadSettings.from_config(config),
+        quality=quality,
+    )
+    # Khai báo stream sẽ publish, server xác thực một lần lúc connect
+    auth = {"streams": [settings.stream_id]}
+    token = config.get_config("CLIENT_AUTH_TOKEN", "")
+    if token:
+        auth["token"] = token
+    supervisor = ConnectionSupervisor(sio, registry, transport, ReconnectPolicy.from_config(config), auth)
 
-    try:
-        await sio.connect('http://localhost:5000', namespaces=['/'])
+    # Event-loop lag monitor
+    monitor = LoopLagMonitor.from_config(config)
+    if monitor is not None:
+        monitor.start()
+
+    async def on_connected(resumed: bool) -> None:
+        # Upload tiếp các chunks server chưa nhận
+        await registry.uploader.resume()
 
-        # Do something here
+    supervisor_task = asyncio.create_task(supervisor.run(on_connected))
+    try:
+        if source is not None or upload is not None:
+            # Chờ connect lần đầu, sau đó streamer/upload chạy song song với supervisor
+            confirmed = asyncio.ensure_future(registry.session_confirmed.wait())
+            await asyncio.wait([supervisor_task, confirmed], return_when=asyncio.FIRST_COMPLETED)
+            confirmed.cancel()
+            if supervisor_task.done():
+                await supervisor_task
 
-        # Keep client running
-        await sio.wait()
+            if upload is not None:
+                result = await registry.uploader.upload(
+                    settings.stream_id, upload, meta={"name": os.path.basename(upload)}
+                )
+                logger.info("Uploaded %s: %s", upload, result)
+            else:
+                # Gộp publish events thành batch packet (server unpack qua BatchHandler)
+                batch = BatchSettings.from_config(config)
+                batcher = None
+                if batch.enabled:
+                    batcher = BatchEmitter(
+                        sio, SenderNamespace.ROOT, batch.max_items, batch.max_bytes, batch.max_delay_ms
+                    )
+                streamer = FrameStreamer(
+                    sio, replace(settings, source=source), SenderNamespace.ROOT, registry.frame_queue,
+                    registry.clock, registry.quality, batcher,
+                )
+                await streamer.run()
+                logger.info(
+                    "Stream stats: %s (dropped while disconnected: %d)",
+                    registry.get_stream_stats(), streamer.frames_dropped,
+                )
+                if registry.quality is not None:
+                    logger.info("Adaptive quality: %s", registry.quality.get_stats())
+                if batcher is not None:
+                    logger.info("Batching: %s", batcher.get_stats())
+        else:
+            # Keep client running, reconnect khi mất kết nối
+            await supervisor_task
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-        print("Make sure the server is running!")
+        logger.error("❌ Error: %s", e)
+        logger.error("Make sure the server is running!")
     finally:
-        await sio.disconnect()
\ No newline at end of file
+        # Disconnect qua supervisor thay vì cancel task đang chờ trong sio.wait()
+        await supervisor.stop()
+        try:
+            await supervisor_task
+        except Exception:
+            # Lỗi của supervisor đã được log ở trên
+            pass
+        if monitor is not None:
+            await monitor.stop()
@@ -1,29 +1,89 @@
 """
 Main server entry point
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from socketio import AsyncServer, ASGIApp
 
+from src.config import config
+from src.observability.logger import setup_logging
+from src.observability import metrics
+from src.observability.loop_monitor import LoopLagMonitor
 from src.socketio_server.main.registry import MainEventRegistry as ServerRegistry
+from src.socketio_server.main.service.AuthSettings import AuthSettings
+from src.socketio_server.main.service.RelaySettings import RelaySettings
+from src.socketio_server.main.service.TransferSettings import TransferSettings
+from src.socketio_server.shared.broker.BrokerSettings import BrokerSettings
+from src.socketio_server.shared.service.OutboundBatcher import OutboundBatcher
+from src.socketio_server.shared.service.OutboundBatchSettings import OutboundBatchSettings
+from src.socketio_server.shared.sticky.WorkerSid import WorkerSid
+from src.serializer import SerializerSettings
+from src.transport import TransportSettings
+
+
+def create_app(worker_id: int | None = None) -> FastAPI:
+    """
+    Create FastAPI application with Socket.IO mounted
+
+    Khi SERVER_BROKER_URL được set, AsyncServer dùng pub/sub client manager
+    để nhiều worker processes chia sẻ rooms và events.
 
+    Args:
+        worker_id: Index của worker sau StickyProxy, được gắn vào engineio sid
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Event-loop lag monitor chạy trên loop của uvicorn
+        monitor = LoopLagMonitor.from_config(config)
+        if monitor is not None:
+            monitor.start()
+        try:
+            yield
+        finally:
+            if monitor is not None:
+                await monitor.stop()
 
-def create_app() -> FastAPI:
-    """Create FastAPI application with Socket.IO mounted"""
     # Create FastAPI app
-    app = FastAPI(title="SocketIO Server", version="1.0.0")
+    app = FastAPI(title="SocketIO Server", version="1.0.0", lifespan=lifespan)
 
     # Create SocketIO server
+    serializer_options = SerializerSettings.from_config(config).socketio_options()
     sio = AsyncServer(
         async_mode='asgi',
+        client_manager=BrokerSettings.from_config(config).create_client_manager(
+            json=serializer_options.get("json")
+        ),
         cors_allowed_origins='*',
         logger=False,
-        engineio_logger=False
+        engineio_logger=False,
+        **TransportSettings.from_config(config).server_options(),
+        **serializer_options,
     )
 
+    if worker_id is not None:
+        WorkerSid.install(sio, worker_id)
+
+    # Gộp outbound events theo room, trước registry để metrics đếm từng event
+    OutboundBatcher.install(sio, OutboundBatchSettings.from_config(config))
+
     # Register chat event handlers
-    ServerRegistry(sio)    
-    
+    registry = ServerRegistry(
+        sio,
+        RelaySettings.from_config(config),
+        AuthSettings.from_config(config),
+        TransferSettings.from_config(config),
+    )
+    metrics.RELAY_LAGGING_RECEIVERS.set_function(lambda: len(registry.get_lagging_receivers()))
+
+    # Metrics endpoint (text exposition format), phải khai báo trước mount "/"
+    @app.get("/metrics", include_in_schema=False)
+    async def get_metrics() -> PlainTextResponse:
+        return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
     # Create Socket.IO ASGI app
     socket_app = ASGIApp(sio, app)
 
@@ -38,3 +98,91 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     return app
+
+
+def _serve_worker(worker_id: int, path: str) -> None:
+    """
+    Chạy một worker trên Unix socket - target của worker process
+
+    Args:
+        worker_id: Index của worker
+        path: Unix socket mà StickyProxy kết nối tới
+    """
+    import uvicorn
+
+    setup_logging(config)
+    transport = TransportSettings.from_config(config)
+    uvicorn.run(create_app(worker_id=worker_id), uds=path, **transport.uvicorn_options())
+
+
+def run_workers(workers: int) -> None:
+    """
+    Chạy server với nhiều worker processes
+
+    Các workers chia sẻ events qua broker của SERVER_BROKER_URL. Nếu không
+    cấu hình, LocalBroker được start trong process riêng tại
+    SERVER_BROKER_SOCKET (mặc định /tmp/socketio-broker-<port>.sock).
+
+    Với SERVER_STICKY_SESSIONS (mặc định true), mỗi worker lắng nghe trên Unix
+    socket riêng và StickyProxy trong process hiện tại route mọi request của
+    một sid tới cùng worker, nên polling transport vẫn hoạt động. Khi tắt,
+    các workers dùng chung port qua uvicorn và clients phải dùng
+    websocket-only transport.
+
+    Host/port bind lấy từ TransportSettings (SERVER_HOST, SERVER_PORT).
+
+    Args:
+        workers: Số worker processes
+    """
+    import asyncio
+    import multiprocessing
+    import os
+
+    import uvicorn
+
+    from src.socketio_server.shared.broker.LocalBroker import LocalBroker
+    from src.socketio_server.shared.sticky.StickyProxy import StickyProxy
+
+    transport = TransportSettings.from_config(config)
+    host, port = transport.host, transport.port
+
+    broker = BrokerSettings.from_config(config)
+    if not broker.url:
+        path = config.get_config("SERVER_BROKER_SOCKET", f"/tmp/socketio-broker-{port}.sock")
+        broker = BrokerSettings.local(path)
+        # Worker processes đọc lại config từ environment
+        os.environ["SERVER_BROKER_URL"] = broker.url
+
+    broker_process = LocalBroker.spawn(broker.local_path) if broker.scheme == "local" else None
+    worker_processes: list[multiprocessing.Process] = []
+    try:
+        if not config.get_bool("SERVER_STICKY_SESSIONS", True):
+            uvicorn.run(
+                "src.run_server:create_app", factory=True, host=host, port=port, workers=workers,
+                **transport.uvicorn_options(),
+            )
+            return
+
+        socket_dir = config.get_config("SERVER_WORKER_SOCKET_DIR", "/tmp")
+        worker_paths = [os.path.join(socket_dir, f"socketio-worker-{port}-{index}.sock") for index in range(workers)]
+
+        context = multiprocessing.get_context("spawn")
+        for index, path in enumerate(worker_paths):
+            process = context.Process(
+                target=_serve_worker, args=(index, path), name=f"socketio-worker-{index}", daemon=True
+            )
+            process.start()
+            worker_processes.append(process)
+
+        try:
+            asyncio.run(StickyProxy(worker_paths).serve_forever(host, port))
+        except KeyboardInterrupt:
+            pass
+    finally:
+        for process in worker_processes:
+            process.terminate()
+        for process in worker_processes:
+            process.join()
+        if broker_process is not None:
+            broker_process.terminate()
+            broker_process.join()
@@ -0,0 +1,100 @@
+"""
+serializer - Chọn serializer cho Socket.IO packets của server và clients
+
+SOCKETIO_SERIALIZER:
+    json    -> stdlib json (mặc định của python-socketio)
+    orjson  -> JSON encode/decode bằng orjson, wire format không đổi nên
+               vẫn tương thích với clients dùng json
+    msgpack -> socketio MsgPackPacket, bytes nằm trực tiếp trong packet
+               (không tách binary attachments); server và mọi client phải
+               cùng dùng msgpack
+
+orjson và msgpack là optional dependencies (`pip install .[fast]`).
+
+Usage:
+    serializer = SerializerSettings.from_config(config)
+    sio = AsyncServer(**serializer.socketio_options())
+"""
+import json
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+SERIALIZERS = ("json", "orjson", "msgpack")
+
+
+class OrjsonAdapter:
+    """
+    Module-like adapter để dùng orjson ở vị trí `json` của socketio/engineio.
+
+    socketio gọi `json.dumps(data, separators=(',', ':'))` và cần str;
+    orjson luôn encode compact và trả về bytes. Giá trị orjson không hỗ trợ
+    (ví dụ int vượt 64 bit) fallback về stdlib json.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+        self.JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(self, obj, **kwargs) -> str:
+        try:
+            return self._orjson.dumps(obj, option=self._options).decode()
+        except TypeError:
+            return json.dumps(obj, **kwargs)
+
+    def loads(self, data, **kwargs):
+        return self._orjson.loads(data)
+
+
+@dataclass(frozen=True)
+class SerializerSettings:
+    """
+    Immutable dataclass chứa cấu hình serializer.
+
+    Attributes:
+        name: json, orjson hoặc msgpack
+    """
+    name: str = "json"
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.name not in SERIALIZERS:
+            raise ConfigInvalidValueError(f"serializer must be one of {SERIALIZERS}: '{self.name}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "SerializerSettings":
+        """
+        Tạo SerializerSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            SerializerSettings instance
+        """
+        return cls(name=config.get_config("SOCKETIO_SERIALIZER", cls.name).lower())
+
+    def socketio_options(self) -> dict:
+        """
+        Keyword arguments cho AsyncServer/AsyncClient
+
+        Returns:
+            Dict gồm `serializer` và/hoặc `json`
+
+        Raises:
+            ConfigInvalidValueError: Nếu package của serializer chưa được cài
+        """
+        try:
+            if self.name == "orjson":
+                return {"json": OrjsonAdapter()}
+            if self.name == "msgpack":
+                import msgpack  # noqa: F401 - báo lỗi sớm thay vì lúc connect
+                return {"serializer": "msgpack"}
+        except ImportError as error:
+            raise ConfigInvalidValueError(
+                f"SOCKETIO_SERIALIZER={self.name} requires the '{self.name}' package"
+            ) from error
+        return {}
@@ -14,4 +14,22 @@ class ReceiverEvent(BaseEvents):
     từ BaseEvents và thêm các events riêng cho chức năng chat client.
     """
 
-    pass
+    # Relay events - đăng ký / hủy đăng ký stream trên server
+    SUBSCRIBE = SocketEvent("subscribe")
+    UNSUBSCRIBE = SocketEvent("unsubscribe")
+
+    # Relay events - payload từ sender được server relay tới
+    RELAY = SocketEvent("relay")
+
+    # Relay events - xin lại / nhận lại payload bị lỡ khi mất kết nối
+    REPLAY = SocketEvent("replay")
+
+    # Transfer events - payload lớn theo chunks, xin lại chunks bị lỡ
+    TRANSFER_BEGIN = SocketEvent("transfer_begin")
+    TRANSFER_CHUNK = SocketEvent("transfer_chunk")
+    TRANSFER_END = SocketEvent("transfer_end")
+    TRANSFER_FETCH = SocketEvent("transfer_fetch")
+    TRANSFER_SYNC = SocketEvent("transfer_sync")
+
+    # Feedback events - report tình trạng định kỳ cho server tổng hợp về sender
+    FEEDBACK = SocketEvent("feedback")
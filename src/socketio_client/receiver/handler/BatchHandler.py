@@ -0,0 +1,63 @@
+"""
+BatchHandler - Unpack batch event từ server và dispatch từng event
+
+Server (OutboundBatcher) gộp nhiều events cùng room trong một tick thành một
+packet. Mỗi event trong batch được chạy qua registry như event nhận trực
+tiếp, theo đúng thứ tự.
+"""
+from socketio import AsyncClient
+
+from src.observability.logger import get_logger
+from src.socketio_client.shared.base.BaseEventRegistry import BaseEventRegistry
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+logger = get_logger(__name__)
+
+
+class BatchHandler(IEventHandler):
+    """Handler xử lý batch event từ server"""
+
+    event = ReceiverEvent.BATCH
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, registry: BaseEventRegistry):
+        """
+        Args:
+            registry: Registry dùng để dispatch các events trong batch
+        """
+        self._registry = registry
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server gửi một batch
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"events": [[event, data], ...]}
+
+        Returns:
+            None (không update session_id)
+        """
+        events = data.get("events") if isinstance(data, dict) else None
+        if not isinstance(events, list):
+            logger.warning("Invalid batch payload from server")
+            return None
+
+        namespace = self.namespace.value
+        for item in events:
+            if not isinstance(item, list) or len(item) != 2 or item[0] == self.event.value:
+                logger.warning("Invalid batch item from server")
+                continue
+
+            event, payload = item
+            try:
+                if not await self._registry.dispatch(namespace, event, payload):
+                    logger.warning("No handler for batched event '%s'", event)
+            except Exception:
+                # Wrapper đã log và đếm lỗi; các events còn lại vẫn được xử lý
+                continue
+
+        return None
@@ -5,10 +5,13 @@ Handler này nhận session ID từ server và trả về để registry cập n
 """
 from socketio import AsyncClient
 
+from src.observability.logger import get_logger
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
 from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
 from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
 
+logger = get_logger(__name__)
+
 
 class ConnectionConfirmedHandler(IEventHandler):
     """Handler xử lý CONNECTION_CONFIRMED event và lưu session ID"""
@@ -32,9 +35,9 @@ class ConnectionConfirmedHandler(IEventHandler):
         new_session_id = data.get("sid") if data else None
 
         if new_session_id:
-            print(f"[Receiver] Connection confirmed with session ID: {new_session_id}")
+            logger.info("Connection confirmed with session ID: %s", new_session_id)
             # Trả về session_id mới để wrapper cập nhật vào registry
             return new_session_id
         else:
-            print(f"[Receiver] Warning: CONNECTION_CONFIRMED received but no session ID in data")
+            logger.warning("CONNECTION_CONFIRMED received but no session ID in data")
             return None
@@ -5,10 +5,13 @@ Example handler cho disconnect event
 """
 from socketio import AsyncClient
 
+from src.observability.logger import get_logger
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
 from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
 from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
 
+logger = get_logger(__name__)
+
 
 class DisconnectHandler(IEventHandler):
     """Handler xử lý disconnect event"""
@@ -29,9 +32,9 @@ class DisconnectHandler(IEventHandler):
             None (không update session_id)
         """
         # Log disconnection
-        print(f"[Receiver] Disconnected from server")
+        logger.info("Disconnected from server")
         if session_id:
-            print(f"[Receiver] Session {session_id} ended")
+            logger.info("Session %s ended", session_id)
 
         # Cleanup (nếu cần)
         # - Clear local state
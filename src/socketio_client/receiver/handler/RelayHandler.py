@@ -0,0 +1,53 @@
+"""
+RelayHandler - Xử lý payload mà server relay từ sender
+
+Handler chuyển payload cho các listeners đã đăng ký trên registry.
+Không log mỗi message vì đây là hot path. Payload replay không đi qua
+handler này, nên `on_live` chỉ thấy payload relay trực tiếp (đo latency).
+"""
+from typing import Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+
+class RelayHandler(IEventHandler):
+    """Handler xử lý RELAY event và chuyển payload cho listeners"""
+
+    event = ReceiverEvent.RELAY
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(
+        self,
+        listeners: list[Callable[[dict], None]],
+        on_live: Callable[[dict], None] | None = None,
+    ):
+        """
+        Args:
+            listeners: List listeners dùng chung với registry (sync callables)
+            on_live: Gọi trước listeners với mỗi payload relay trực tiếp
+        """
+        self._listeners = listeners
+        self._on_live = on_live
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi nhận payload relay từ server
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"stream": "<stream_id>", "data": <bytes>, ...}
+
+        Returns:
+            None (không update session_id)
+        """
+        if self._on_live is not None:
+            self._on_live(data)
+        for listener in self._listeners:
+            listener(data)
+
+        return None
@@ -0,0 +1,49 @@
+"""
+ReplayHandler - Xử lý payload bị lỡ mà server gửi lại sau khi reconnect
+
+Handler chuyển response cho registry, registry bỏ các payload đã nhận
+và chuyển phần còn lại cho relay listeners.
+"""
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+
+from src.observability.logger import get_logger
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+logger = get_logger(__name__)
+
+
+class ReplayHandler(IEventHandler):
+    """Handler xử lý REPLAY response từ server"""
+
+    event = ReceiverEvent.REPLAY
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, apply_replay: Callable[[dict], Awaitable[None]]):
+        """
+        Args:
+            apply_replay: Callback của registry nhận replay response
+        """
+        self._apply_replay = apply_replay
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server gửi lại các payload bị lỡ
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"items": [payload, ...], "more": bool, "complete": bool, "epoch": str | None}
+
+        Returns:
+            None (không update session_id)
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+            logger.warning("Invalid replay payload from server")
+            return None
+
+        await self._apply_replay(data)
+        return None
@@ -0,0 +1,42 @@
+"""
+TransferBeginHandler - Xử lý khi một chunked transfer bắt đầu trên stream đã subscribe
+
+Handler chuyển header của transfer cho TransferAssembler của registry.
+"""
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+
+class TransferBeginHandler(IEventHandler):
+    """Handler xử lý TRANSFER_BEGIN event từ server"""
+
+    event = ReceiverEvent.TRANSFER_BEGIN
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, callback: Callable[[dict], Awaitable[None]]):
+        """
+        Args:
+            callback: TransferAssembler.on_begin
+        """
+        self._callback = callback
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server báo transfer mới
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"id", "stream", "size", "chunk_size", "meta"}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            await self._callback(data)
+        return None
@@ -0,0 +1,43 @@
+"""
+TransferChunkHandler - Xử lý một chunk của chunked transfer
+
+Handler chuyển chunk (forward trực tiếp hoặc được gửi lại) cho
+TransferAssembler của registry. Không log mỗi chunk vì đây là hot path.
+"""
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+
+class TransferChunkHandler(IEventHandler):
+    """Handler xử lý TRANSFER_CHUNK event từ server"""
+
+    event = ReceiverEvent.TRANSFER_CHUNK
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, callback: Callable[[dict], Awaitable[None]]):
+        """
+        Args:
+            callback: TransferAssembler.on_chunk
+        """
+        self._callback = callback
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi nhận một chunk
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"id", "stream", "size", "chunk_size", "index", "data": <bytes>}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            await self._callback(data)
+        return None
@@ -0,0 +1,43 @@
+"""
+TransferEndHandler - Xử lý khi server đã nhận đủ một chunked transfer
+
+Handler chuyển cho TransferAssembler của registry, assembler xin lại các
+chunks còn thiếu. Server cũng gửi event này kèm "error" khi transfer không còn.
+"""
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+
+class TransferEndHandler(IEventHandler):
+    """Handler xử lý TRANSFER_END event từ server"""
+
+    event = ReceiverEvent.TRANSFER_END
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, callback: Callable[[dict], Awaitable[None]]):
+        """
+        Args:
+            callback: TransferAssembler.on_end
+        """
+        self._callback = callback
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi transfer hoàn tất trên server (hoặc không còn)
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: Header của transfer, hoặc {"id", "error"}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            await self._callback(data)
+        return None
@@ -0,0 +1,43 @@
+"""
+TransferSyncHandler - Xử lý seq hiện tại của transfers mà server trả về sau sync
+
+Handler chuyển cho TransferAssembler của registry. Các transfers bị lỡ đã
+được server báo lại (transfer_begin/transfer_end) trước event này.
+"""
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+
+
+class TransferSyncHandler(IEventHandler):
+    """Handler xử lý TRANSFER_SYNC event từ server"""
+
+    event = ReceiverEvent.TRANSFER_SYNC
+    namespace = ReceiverNamespace.ROOT
+
+    def __init__(self, callback: Callable[[dict], Awaitable[None]]):
+        """
+        Args:
+            callback: TransferAssembler.on_sync
+        """
+        self._callback = callback
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server trả về seq hiện tại
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"seq": int}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            await self._callback(data)
+        return None
@@ -3,14 +3,44 @@ ReceiverEventRegistry - Registry cho Receiver Client
 
 Kế thừa từ BaseEventRegistry và implement _create_handlers()
 để định nghĩa các handlers riêng cho receiver client.
+
+Registry nhớ `relay_seq` cuối cùng đã nhận cùng `relay_epoch` (seq space của
+worker server đã relay); sau khi reconnect, `request_replay()` xin server gửi
+lại các payload bị lỡ. Seq chỉ so sánh trong cùng epoch.
+
+Payload có trace header được đo latency theo từng hop (HopLatencyTracker),
+chỉ với payload relay trực tiếp, không tính payload replay.
+
+Chunked transfers (payload lớn) được ghép bởi TransferAssembler; chunks bị
+lỡ được xin lại từ server qua `transfer_fetch`, transfers bị lỡ hoàn toàn
+được server báo lại qua `transfer_sync`.
 """
+from typing import Callable
+
+from socketio import AsyncClient
+
 from src.socketio_client.shared.base.BaseEventRegistry import BaseEventRegistry
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.receiver.handler.BatchHandler import BatchHandler
 from src.socketio_client.receiver.handler.ConnectHandler import ConnectHandler
 from src.socketio_client.receiver.handler.ConnectionConfirmedHandler import (
     ConnectionConfirmedHandler,
 )
 from src.socketio_client.receiver.handler.DisconnectHandler import DisconnectHandler
+from src.socketio_client.receiver.handler.RelayHandler import RelayHandler
+from src.socketio_client.receiver.handler.ReplayHandler import ReplayHandler
+from src.socketio_client.receiver.handler.TransferBeginHandler import TransferBeginHandler
+from src.socketio_client.receiver.handler.TransferChunkHandler import TransferChunkHandler
+from src.socketio_client.receiver.handler.TransferEndHandler import TransferEndHandler
+from src.socketio_client.receiver.handler.TransferSyncHandler import TransferSyncHandler
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.enum.ReceiverNamespace import ReceiverNamespace
+from src.socketio_client.receiver.service.AssemblySettings import AssemblySettings
+from src.socketio_client.receiver.service.HopLatencyTracker import HopLatencyTracker
+from src.socketio_client.receiver.service.TransferAssembler import TransferAssembler
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class ReceiverEventRegistry(BaseEventRegistry):
@@ -20,6 +50,226 @@ class ReceiverEventRegistry(BaseEventRegistry):
     Kế thừa từ BaseEventRegistry và implement abstract method _create_handlers().
     """
 
+    ROLE = "receiver"
+
+    # Key của sequence number mà server relay thêm vào payload
+    SEQ_KEY = "relay_seq"
+    # Key của epoch (seq space của worker) mà server relay thêm vào payload
+    EPOCH_KEY = "relay_epoch"
+
+    def __init__(self, sio: AsyncClient, assembly_settings: AssemblySettings | None = None):
+        """
+        Initialize ReceiverEventRegistry
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            assembly_settings: Cấu hình ghép chunked transfers (mặc định nếu None)
+        """
+        # Listeners nhận payload relay, dùng chung với RelayHandler.
+        # Listener đầu tiên luôn là bộ đếm relay_seq của registry
+        self._relay_listeners: list[Callable[[dict], None]] = [self._track_relay_seq]
+
+        # relay_seq lớn nhất đã nhận trong relay_epoch (None nếu server không bật replay)
+        self.last_relay_seq: int | None = None
+        self.relay_epoch: str | None = None
+        # Seq của các payload đã nhận trong lúc replay, để bỏ bản trùng
+        self._replay_seen: set[int] | None = None
+
+        # Counters
+        self.replayed = 0
+        self.replay_incomplete = 0
+        # Streams đã subscribe, khai báo trong auth payload ở mỗi lần connect
+        self._streams: set[str] = set()
+
+        # Ghép chunked transfers, dùng chung với các Transfer*Handler
+        self.transfers = TransferAssembler(
+            assembly_settings or AssemblySettings(), self._fetch_chunks, self._sync_transfers
+        )
+
+        super().__init__(sio)
+
+        # Latency theo hop của payload có trace header (cần self.clock)
+        self.hop_latency = HopLatencyTracker(self.clock)
+
+    # ----------
+    # Public API: Relay
+    # ----------
+
+    def add_relay_listener(self, listener: Callable[[dict], None]) -> None:
+        """
+        Đăng ký listener nhận payload relay từ server
+
+        Listener chạy trong event loop nên phải nhanh và không blocking.
+
+        Args:
+            listener: Callable nhận payload dict
+        """
+        self._relay_listeners.append(listener)
+
+    @property
+    def streams(self) -> frozenset[str]:
+        """Streams đã subscribe"""
+        return frozenset(self._streams)
+
+    def get_auth(self) -> dict:
+        """
+        Auth payload kèm các streams cần nhận: server subscribe ngay lúc connect
+
+        Returns:
+            Dict auth payload
+        """
+        return {**super().get_auth(), "streams": sorted(self._streams)}
+
+    async def subscribe(self, stream_id: str) -> None:
+        """
+        Đăng ký nhận payload của một stream
+
+        Khi chưa connect, stream chỉ được ghi nhận và khai báo lúc connect.
+
+        Args:
+            stream_id: ID của stream
+        """
+        self._streams.add(stream_id)
+        if not self._sio.connected:
+            return
+        await self._sio.emit(
+            ReceiverEvent.SUBSCRIBE.value,
+            {"stream": stream_id},
+            namespace=ReceiverNamespace.ROOT.value,
+        )
+
+    async def unsubscribe(self, stream_id: str) -> None:
+        """
+        Hủy đăng ký stream
+
+        Args:
+            stream_id: ID của stream
+        """
+        self._streams.discard(stream_id)
+        if not self._sio.connected:
+            return
+        await self._sio.emit(
+            ReceiverEvent.UNSUBSCRIBE.value,
+            {"stream": stream_id},
+            namespace=ReceiverNamespace.ROOT.value,
+        )
+
+    def get_hop_latency(self) -> dict:
+        """
+        Latency percentiles theo stream và hop (sender -> server -> receiver)
+
+        Returns:
+            Dict gồm clock (offset/rtt với server), traced, clock_skew và
+            streams: stream -> hop -> snapshot (ms)
+        """
+        tracker = self.hop_latency
+        return {
+            "clock": self.clock.get_stats(),
+            "traced": tracker.traced,
+            "clock_skew": tracker.clock_skew,
+            "streams": tracker.get_stats(),
+        }
+
+    # ----------
+    # Public API: Replay
+    # ----------
+
+    async def request_replay(self) -> bool:
+        """
+        Xin server gửi lại các payload relay sau `last_relay_seq`
+
+        Gọi sau khi reconnect; server đã subscribe lại các streams khai báo lúc connect.
+
+        Returns:
+            False nếu chưa nhận payload nào có relay_seq
+        """
+        if self.last_relay_seq is None:
+            return False
+
+        self._replay_seen = set()
+        await self._request_replay_after(self.last_relay_seq)
+        return True
+
+    async def apply_replay(self, data: dict) -> None:
+        """
+        Chuyển các payload được replay cho listeners, bỏ các payload đã nhận
+
+        Args:
+            data: {"items": [payload, ...], "more": bool, "complete": bool, "epoch": str | None}
+        """
+        seen = self._replay_seen if self._replay_seen is not None else set()
+        last_seq = None
+
+        for payload in data.get("items") or ():
+            if not isinstance(payload, dict):
+                continue
+            last_seq = payload.get(self.SEQ_KEY)
+            if last_seq in seen:
+                continue
+            for listener in self._relay_listeners:
+                listener(payload)
+            self.replayed += 1
+
+        if data.get("more") and isinstance(last_seq, int):
+            await self._request_replay_after(last_seq)
+            return
+
+        self._replay_seen = None
+        if not data.get("complete"):
+            self.replay_incomplete += 1
+            if data.get("epoch") != self.relay_epoch:
+                logger.warning("Replay incomplete, relayed by another server worker or run")
+            else:
+                logger.warning("Replay incomplete, some relayed payloads were lost")
+
+    async def _request_replay_after(self, seq: int) -> None:
+        await self._sio.emit(
+            ReceiverEvent.REPLAY.value,
+            {"after": seq, "epoch": self.relay_epoch},
+            namespace=ReceiverNamespace.ROOT.value,
+        )
+
+    async def _fetch_chunks(self, transfer_id: str, indices: list[int]) -> None:
+        """Xin server gửi lại các chunks của một transfer"""
+        if not self._sio.connected:
+            return
+        await self._sio.emit(
+            ReceiverEvent.TRANSFER_FETCH.value,
+            {"id": transfer_id, "indices": indices},
+            namespace=ReceiverNamespace.ROOT.value,
+        )
+
+    async def _sync_transfers(self, after: int | None) -> None:
+        """Hỏi server các transfers có seq > after (None = chỉ lấy seq hiện tại)"""
+        if not self._sio.connected:
+            return
+        await self._sio.emit(
+            ReceiverEvent.TRANSFER_SYNC.value,
+            {"after": after},
+            namespace=ReceiverNamespace.ROOT.value,
+        )
+
+    def _track_relay_seq(self, payload: dict) -> None:
+        """Relay listener ghi nhận relay_seq của mỗi payload"""
+        seq = payload.get(self.SEQ_KEY) if isinstance(payload, dict) else None
+        if not isinstance(seq, int):
+            return
+
+        epoch = payload.get(self.EPOCH_KEY)
+        if epoch != self.relay_epoch or self.last_relay_seq is None:
+            # Worker khác hoặc server restart: seq space mới
+            self.relay_epoch = epoch
+            self.last_relay_seq = seq
+        elif seq > self.last_relay_seq:
+            # Payload live và replay có thể đan xen, giữ seq lớn nhất
+            self.last_relay_seq = seq
+
+        if self._replay_seen is not None:
+            self._replay_seen.add(seq)
+
+    def _record_hop_latency(self, payload: dict) -> None:
+        self.hop_latency.record(payload)
+
     def _create_handlers(self) -> list[IEventHandler]:
         """
         Tạo và trả về danh sách các event handlers cho Receiver Client.
@@ -31,4 +281,11 @@ class ReceiverEventRegistry(BaseEventRegistry):
             ConnectHandler(),
             ConnectionConfirmedHandler(),
             DisconnectHandler(),
+            RelayHandler(self._relay_listeners, self._record_hop_latency),
+            ReplayHandler(self.apply_replay),
+            TransferBeginHandler(self.transfers.on_begin),
+            TransferChunkHandler(self.transfers.on_chunk),
+            TransferEndHandler(self.transfers.on_end),
+            TransferSyncHandler(self.transfers.on_sync),
+            BatchHandler(self),
         ]
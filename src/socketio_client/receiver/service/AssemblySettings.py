@@ -0,0 +1,52 @@
+"""
+AssemblySettings - Cấu hình ghép chunked transfers cho Receiver Client
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class AssemblySettings:
+    """
+    Immutable dataclass chứa cấu hình ghép chunked transfers.
+
+    Attributes:
+        memory_limit: Transfer nhỏ hơn ngưỡng này được ghép vào bytearray
+                      cấp phát trước, lớn hơn thì vào SpooledTemporaryFile
+        max_size: Kích thước tối đa của một transfer (lớn hơn thì bỏ qua)
+        fetch_batch: Số chunks tối đa xin lại trong một request
+                     (phải <= TRANSFER_FETCH_BATCH của server)
+        ttl: Thời gian (giây) giữ transfer chưa hoàn tất không có hoạt động
+    """
+    memory_limit: int = 16 * 1024 * 1024
+    max_size: int = 1024 * 1024 * 1024
+    fetch_batch: int = 8
+    ttl: float = 300.0
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.max_size < 1 or self.fetch_batch < 1:
+            raise ConfigInvalidValueError("max_size and fetch_batch must be positive")
+        if self.memory_limit < 0 or self.ttl < 0:
+            raise ConfigInvalidValueError("memory_limit and ttl must not be negative")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "AssemblySettings":
+        """
+        Tạo AssemblySettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            AssemblySettings instance
+        """
+        return cls(
+            memory_limit=config.get_int("RECEIVER_TRANSFER_MEMORY", cls.memory_limit),
+            max_size=config.get_int("RECEIVER_TRANSFER_MAX_SIZE", cls.max_size),
+            fetch_batch=config.get_int("RECEIVER_TRANSFER_FETCH_BATCH", cls.fetch_batch),
+            ttl=config.get_float("RECEIVER_TRANSFER_TTL_S", cls.ttl),
+        )
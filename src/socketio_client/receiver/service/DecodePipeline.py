@@ -0,0 +1,175 @@
+"""
+DecodePipeline - Decode frames nhận được ngoài event loop vào FrameRingBuffer
+
+Pipeline:
+    relay listener: payload -> reserve slot -> submit decode vào executor
+    done callback:  commit các slot theo thứ tự nhận -> frame listeners
+
+Decode là CPU-bound; chạy trong event loop sẽ chặn ping/pong, ack và các
+payload tiếp theo. Listener không bao giờ chờ: khi pool đã đủ max_in_flight
+frame mới bị bỏ (với live video, frame mới sẽ tới ngay sau đó).
+
+Ở thread mode worker ghi thẳng vào slot của ring. Ở process mode worker trả
+về frame đã decode và slot được copy trong event loop.
+
+Khi có `shm_name`, ring nằm trong shared memory (SharedFrameRing) để
+consumer processes đọc frames qua SharedFrameReader mà không copy.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+from src.observability.logger import EventSampler, get_logger
+from src.socketio_client.receiver.service.DecodeSettings import DecodeSettings
+from src.socketio_client.receiver.service.FrameDecoder import FrameDecoder, PillowFrameDecoder
+from src.socketio_client.receiver.service.FrameRingBuffer import DecodedFrame, FrameRingBuffer
+
+logger = get_logger(__name__)
+
+
+class DecodePipeline:
+    """
+    Bounded decoder pool ghi vào ring buffer, commit theo thứ tự nhận.
+
+    Usage:
+        pipeline = DecodePipeline(DecodeSettings.from_config(config))
+        registry.add_relay_listener(pipeline.on_relay)
+        pipeline.add_frame_listener(lambda frame: ...)
+        frame = pipeline.ring.latest()
+        pipeline.close()
+    """
+
+    def __init__(self, settings: DecodeSettings):
+        """
+        Args:
+            settings: Cấu hình decode pipeline
+        """
+        workers = settings.pool_workers or os.cpu_count() or 1
+        self.max_in_flight = settings.max_in_flight or 2 * workers
+        # Slot đang decode không bao giờ trùng slot vừa commit
+        capacity = max(settings.ring_size or self.max_in_flight + 4, self.max_in_flight + 2)
+
+        if settings.shm_name:
+            from src.socketio_client.receiver.service.SharedFrameRing import SharedFrameRing
+            self.ring = SharedFrameRing(settings.shm_name, capacity, settings.max_height, settings.max_width)
+        else:
+            self.ring = FrameRingBuffer(capacity, settings.max_height, settings.max_width)
+        self._decoder = PillowFrameDecoder() if settings.decoder == "pillow" else FrameDecoder()
+        self._in_worker = settings.pool_mode == "thread"
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="decoder")
+            if self._in_worker
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+
+        # (future, index, stream, sender_seq, ts, submitted_ns) theo thứ tự nhận
+        self._pending: deque[tuple[asyncio.Future, int, str, object, object, int]] = deque()
+        self._frame_listeners: list[Callable[[DecodedFrame], None]] = []
+        self._log_sampler = EventSampler()
+
+        # Counters
+        self.received = 0
+        self.decoded = 0
+        self.dropped = 0
+        self.failed = 0
+        # Tổng thời gian từ lúc submit tới lúc commit của các frame đã decode
+        self.decode_ns = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Số frame đang decode hoặc chờ commit"""
+        return len(self._pending)
+
+    def add_frame_listener(self, listener: Callable[[DecodedFrame], None]) -> None:
+        """
+        Đăng ký listener nhận mỗi frame đã decode
+
+        Listener chạy trong event loop và nhận view của slot (không copy),
+        nên phải nhanh và không blocking.
+
+        Args:
+            listener: Callable nhận DecodedFrame
+        """
+        self._frame_listeners.append(listener)
+
+    def on_relay(self, payload: dict) -> None:
+        """
+        Relay listener: submit frame trong payload để decode (không chờ)
+
+        Args:
+            payload: {"stream": ..., "seq": ..., "ts": ..., "data": <bytes>}
+        """
+        data = payload.get("data")
+        if not isinstance(data, (bytes, bytearray)):
+            return
+
+        self.received += 1
+        if len(self._pending) >= self.max_in_flight:
+            self.dropped += 1
+            return
+
+        index, slot = self.ring.reserve()
+        loop = asyncio.get_running_loop()
+        if self._in_worker:
+            future = loop.run_in_executor(self._executor, self._decoder.decode_into, data, slot)
+        else:
+            future = loop.run_in_executor(self._executor, self._decoder.decode, data)
+
+        self._pending.append(
+            (future, index, payload.get("stream"), payload.get("seq"), payload.get("ts"), time.monotonic_ns())
+        )
+        future.add_done_callback(self._commit_ready)
+
+    def get_stats(self) -> dict:
+        """
+        Counters của pipeline
+
+        Returns:
+            Dict gồm received, decoded, dropped, failed, in_flight, decode_ms (trung bình)
+        """
+        return {
+            "received": self.received,
+            "decoded": self.decoded,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "decode_ms": round(self.decode_ns / self.decoded / 1e6, 3) if self.decoded else None,
+        }
+
+    def close(self) -> None:
+        """Hủy các frame đang chờ, shutdown executor và giải phóng ring"""
+        for future, *_ in self._pending:
+            future.cancel()
+        self._pending.clear()
+        # Thread workers có thể vẫn đang ghi vào slot
+        self._executor.shutdown(wait=self._in_worker, cancel_futures=True)
+        self.ring.close()
+
+    def _commit_ready(self, _future: asyncio.Future) -> None:
+        """Done callback: commit các frame đầu hàng đã decode xong, theo thứ tự"""
+        pending = self._pending
+        while pending and pending[0][0].done():
+            future, index, stream, sender_seq, ts, submitted_ns = pending.popleft()
+            if future.cancelled():
+                continue
+
+            try:
+                result = future.result()
+                if self._in_worker:
+                    height, width = result
+                else:
+                    height, width = FrameDecoder.copy_into(result, self.ring.slots[index])
+            except Exception as e:
+                self.failed += 1
+                if self._log_sampler.should_log(stream):
+                    logger.warning("Decode frame of stream '%s' failed: %s", stream, e)
+                continue
+
+            frame = self.ring.commit(index, height, width, stream, sender_seq, ts)
+            self.decoded += 1
+            self.decode_ns += time.monotonic_ns() - submitted_ns
+            for listener in self._frame_listeners:
+                listener(frame)
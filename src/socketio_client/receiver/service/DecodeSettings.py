@@ -0,0 +1,74 @@
+"""
+DecodeSettings - Cấu hình decode pipeline cho Receiver Client
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class DecodeSettings:
+    """
+    Immutable dataclass chứa cấu hình decode pipeline.
+
+    Attributes:
+        enabled: Decode frames nhận được (False = chỉ chuyển payload cho listeners)
+        decoder: "opencv" hoặc "pillow"
+        pool_mode: "thread" hoặc "process" cho decoder pool
+        pool_workers: Số worker của decoder pool (0 = số CPU)
+        max_in_flight: Số frame decode đồng thời tối đa (0 = 2 * workers);
+                       frame đến khi pool đã đầy bị bỏ
+        ring_size: Số slot của FrameRingBuffer (0 = max_in_flight + 4)
+        max_width: Chiều rộng tối đa của frame (kích thước slot)
+        max_height: Chiều cao tối đa của frame (kích thước slot)
+        shm_name: Tên shared memory block để consumer processes trên cùng host
+                  đọc frames (rỗng = ring trong memory của receiver)
+    """
+    enabled: bool = False
+    decoder: str = "opencv"
+    pool_mode: str = "thread"
+    pool_workers: int = 0
+    max_in_flight: int = 0
+    ring_size: int = 0
+    max_width: int = 1920
+    max_height: int = 1080
+    shm_name: str = ""
+
+    DECODERS = ("opencv", "pillow")
+    POOL_MODES = ("thread", "process")
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.decoder not in self.DECODERS:
+            raise ConfigInvalidValueError(f"decoder must be one of {self.DECODERS}: '{self.decoder}'")
+        if self.pool_mode not in self.POOL_MODES:
+            raise ConfigInvalidValueError(f"pool_mode must be one of {self.POOL_MODES}: '{self.pool_mode}'")
+        if self.pool_workers < 0 or self.max_in_flight < 0 or self.ring_size < 0:
+            raise ConfigInvalidValueError("pool_workers, max_in_flight and ring_size must not be negative")
+        if self.max_width < 1 or self.max_height < 1:
+            raise ConfigInvalidValueError("max_width and max_height must be positive")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "DecodeSettings":
+        """
+        Tạo DecodeSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            DecodeSettings instance
+        """
+        return cls(
+            enabled=config.get_bool("RECEIVER_DECODE", cls.enabled),
+            decoder=config.get_config("RECEIVER_DECODER", cls.decoder).lower(),
+            pool_mode=config.get_config("RECEIVER_DECODER_POOL", cls.pool_mode).lower(),
+            pool_workers=config.get_int("RECEIVER_DECODER_WORKERS", cls.pool_workers),
+            max_in_flight=config.get_int("RECEIVER_DECODER_MAX_IN_FLIGHT", cls.max_in_flight),
+            ring_size=config.get_int("RECEIVER_RING_SIZE", cls.ring_size),
+            max_width=config.get_int("RECEIVER_MAX_WIDTH", cls.max_width),
+            max_height=config.get_int("RECEIVER_MAX_HEIGHT", cls.max_height),
+            shm_name=config.get_config("RECEIVER_SHM_NAME", cls.shm_name),
+        )
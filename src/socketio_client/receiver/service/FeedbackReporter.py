@@ -0,0 +1,117 @@
+"""
+FeedbackReporter - Report tình trạng của receiver định kỳ cho server
+
+Mỗi `interval` giây receiver gửi (feedback event):
+    {"queue": int, "decode_ms": float | None, "drop_rate": float,
+     "latency_ms": {stream: float}}
+
+- queue: số frame đang decode hoặc chờ commit (DecodePipeline)
+- decode_ms: thời gian trung bình từ lúc nhận tới lúc commit frame, trong interval
+- drop_rate: tỉ lệ frame bị bỏ hoặc decode lỗi trên số frame nhận, trong interval
+- latency_ms: end-to-end latency lớn nhất theo stream trong interval
+  (chỉ khi sender bật trace)
+
+Server tổng hợp report của mọi receivers của stream và gửi cho sender, sender
+điều chỉnh quality/resolution/frame rate theo đó. Report chỉ dựa trên
+counters sẵn có nên không tốn gì trên hot path.
+"""
+import asyncio
+from typing import TYPE_CHECKING
+
+from socketio import AsyncClient
+from socketio.exceptions import BadNamespaceError
+
+from src.socketio_client.shared.enum.BaseNamespace import Namespace
+from src.socketio_client.receiver.enum.ReceiverEvent import ReceiverEvent
+from src.socketio_client.receiver.service.HopLatencyTracker import HopLatencyTracker
+
+if TYPE_CHECKING:
+    # DecodePipeline cần opencv hoặc Pillow, chỉ import khi decode được bật
+    from src.socketio_client.receiver.service.DecodePipeline import DecodePipeline
+
+
+class FeedbackReporter:
+    """
+    Gửi report định kỳ từ counters của DecodePipeline và HopLatencyTracker.
+
+    Usage:
+        reporter = FeedbackReporter(sio, ReceiverNamespace.ROOT, 1.0, pipeline, registry.hop_latency)
+        task = asyncio.create_task(reporter.run())
+    """
+
+    def __init__(
+        self,
+        sio: AsyncClient,
+        namespace: Namespace,
+        interval: float,
+        pipeline: "DecodePipeline | None" = None,
+        hop_latency: HopLatencyTracker | None = None,
+    ):
+        """
+        Args:
+            sio: SocketIO AsyncClient instance
+            namespace: Namespace để gửi report
+            interval: Khoảng thời gian (giây) giữa hai report
+            pipeline: Decode pipeline (None nếu receiver không decode)
+            hop_latency: Latency theo hop của registry
+
+        Raises:
+            ValueError: Nếu interval không dương
+        """
+        if interval <= 0:
+            raise ValueError(f"interval phải > 0: '{interval}'")
+
+        self._sio = sio
+        self._namespace = namespace
+        self._interval = interval
+        self._pipeline = pipeline
+        self._hop_latency = hop_latency
+        # (received, decoded, lost, decode_ns) của pipeline ở report trước
+        self._last = (0, 0, 0, 0)
+
+        # Counters
+        self.sent = 0
+
+    def snapshot(self) -> dict:
+        """
+        Report của interval hiện tại (bắt đầu interval mới)
+
+        Returns:
+            Dict gồm queue, decode_ms, drop_rate, latency_ms
+        """
+        report = {
+            "queue": 0,
+            "decode_ms": None,
+            "drop_rate": 0.0,
+            "latency_ms": self._hop_latency.take_window_max() if self._hop_latency is not None else {},
+        }
+
+        pipeline = self._pipeline
+        if pipeline is not None:
+            current = (pipeline.received, pipeline.decoded, pipeline.dropped + pipeline.failed, pipeline.decode_ns)
+            received, decoded, lost, decode_ns = (now - last for now, last in zip(current, self._last))
+            self._last = current
+
+            report["queue"] = pipeline.in_flight
+            if decoded:
+                report["decode_ms"] = round(decode_ns / decoded / 1e6, 3)
+            if received:
+                report["drop_rate"] = round(lost / received, 4)
+        return report
+
+    async def run(self) -> None:
+        """
+        Gửi report mỗi interval cho tới khi task bị cancel
+
+        Khi mất kết nối report bị bỏ qua (interval mới bắt đầu sau reconnect).
+        """
+        while True:
+            await asyncio.sleep(self._interval)
+            report = self.snapshot()
+            if not self._sio.connected:
+                continue
+            try:
+                await self._sio.emit(ReceiverEvent.FEEDBACK.value, report, namespace=self._namespace.value)
+            except BadNamespaceError:
+                continue
+            self.sent += 1
@@ -0,0 +1,91 @@
+"""
+FrameDecoder - Decode JPEG/WebP bytes thành BGR frame
+
+Decoders không giữ state nên pickle được, dùng được với cả
+ThreadPoolExecutor và ProcessPoolExecutor.
+
+`decode_into` ghi thẳng kết quả vào slot của FrameRingBuffer (chạy trong
+worker thread), nên event loop không phải copy frame.
+"""
+from io import BytesIO
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+class FrameDecoder:
+    """Decode bằng OpenCV (giải phóng GIL, phù hợp thread pool)"""
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """
+        Decode một frame (blocking, CPU-bound)
+
+        Args:
+            data: Encoded bytes (JPEG/WebP)
+
+        Returns:
+            BGR frame (H, W, 3) uint8
+
+        Raises:
+            ValueError: Nếu data không decode được
+        """
+        frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError("Decode frame thất bại")
+        return frame
+
+    def decode_into(self, data: bytes, out: np.ndarray) -> tuple[int, int]:
+        """
+        Decode một frame và ghi vào góc trên trái của `out`
+
+        Args:
+            data: Encoded bytes
+            out: Slot (max_height, max_width, 3) uint8
+
+        Returns:
+            (height, width) của frame
+
+        Raises:
+            ValueError: Nếu data không decode được hoặc frame lớn hơn slot
+        """
+        return self.copy_into(self.decode(data), out)
+
+    @staticmethod
+    def copy_into(frame: np.ndarray, out: np.ndarray) -> tuple[int, int]:
+        """
+        Copy frame đã decode vào slot
+
+        Args:
+            frame: BGR frame
+            out: Slot (max_height, max_width, 3) uint8
+
+        Returns:
+            (height, width) của frame
+
+        Raises:
+            ValueError: Nếu frame lớn hơn slot
+        """
+        height, width = frame.shape[:2]
+        if height > out.shape[0] or width > out.shape[1]:
+            raise ValueError(f"Frame {width}x{height} lớn hơn slot {out.shape[1]}x{out.shape[0]}")
+        np.copyto(out[:height, :width], frame)
+        return height, width
+
+
+class PillowFrameDecoder(FrameDecoder):
+    """
+    Decode bằng Pillow.
+
+    Pillow giữ GIL trong phần lớn decode, nên decoder này nên chạy
+    trong process pool.
+    """
+
+    def decode(self, data: bytes) -> np.ndarray:
+        try:
+            with Image.open(BytesIO(data)) as image:
+                rgb = np.asarray(image.convert("RGB"))
+        except (OSError, SyntaxError) as error:
+            raise ValueError("Decode frame thất bại") from error
+        # RGB -> BGR (view, copy_into mới copy)
+        return rgb[:, :, ::-1]
@@ -0,0 +1,141 @@
+"""
+FrameRingBuffer - Ring buffer preallocated chứa các frame đã decode
+
+Toàn bộ slots là một NumPy array (capacity, max_height, max_width, 3) cấp
+phát một lần. Decoder ghi thẳng vào slot; consumer nhận view của slot
+(không copy). Một view hợp lệ cho tới khi slot đó được ghi lại, tức là sau
+ít nhất `capacity - max_in_flight` frame tiếp theo; consumer kiểm tra bằng
+`is_current(frame)` hoặc tự copy nếu cần giữ lâu hơn.
+"""
+import numpy as np
+
+
+class DecodedFrame:
+    """View (không copy) của một frame trong ring"""
+
+    __slots__ = ("seq", "stream", "sender_seq", "ts", "index", "image")
+
+    def __init__(self, seq: int, stream: str, sender_seq, ts, index: int, image: np.ndarray):
+        # Seq trong ring, tăng dần theo thứ tự commit
+        self.seq = seq
+        self.stream = stream
+        # seq và ts (ns) mà sender gắn vào payload
+        self.sender_seq = sender_seq
+        self.ts = ts
+        self.index = index
+        self.image = image
+
+
+class FrameRingBuffer:
+    """
+    Single-writer ring buffer các frame BGR uint8.
+
+    Usage:
+        index, slot = ring.reserve()
+        height, width = decoder.decode_into(data, slot)   # trong worker
+        frame = ring.commit(index, height, width, stream, sender_seq, ts)
+        latest = ring.latest()
+    """
+
+    CHANNELS = 3
+
+    def __init__(self, capacity: int, max_height: int, max_width: int):
+        """
+        Args:
+            capacity: Số slot
+            max_height: Chiều cao tối đa của frame
+            max_width: Chiều rộng tối đa của frame
+
+        Raises:
+            ValueError: Nếu kích thước không hợp lệ
+        """
+        if capacity < 2 or max_height < 1 or max_width < 1:
+            raise ValueError("capacity phải >= 2, max_height và max_width phải > 0")
+
+        self.capacity = capacity
+        self.slots = self._allocate_slots((capacity, max_height, max_width, self.CHANNELS))
+        # Seq của frame đang nằm trong mỗi slot, -1 nếu slot trống/đang ghi
+        self._slot_seq = np.full(capacity, -1, dtype=np.int64)
+        self._frames: list[DecodedFrame | None] = [None] * capacity
+
+        self._next_index = 0
+        self._latest: DecodedFrame | None = None
+        self.committed = 0
+
+    def _allocate_slots(self, shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Cấp phát memory cho slots (subclass override để dùng shared memory)
+
+        Args:
+            shape: (capacity, max_height, max_width, channels)
+
+        Returns:
+            uint8 array
+        """
+        return np.zeros(shape, dtype=np.uint8)
+
+    def reserve(self) -> tuple[int, np.ndarray]:
+        """
+        Lấy slot kế tiếp để ghi, frame cũ trong slot bị vô hiệu
+
+        Returns:
+            (index, slot view (max_height, max_width, 3))
+        """
+        index = self._next_index
+        self._next_index = (index + 1) % self.capacity
+        self._slot_seq[index] = -1
+        self._frames[index] = None
+        # Frame mới nhất nằm trong slot sắp ghi: không trả view đang bị ghi đè
+        if self._latest is not None and self._latest.index == index:
+            self._latest = None
+        return index, self.slots[index]
+
+    def commit(self, index: int, height: int, width: int, stream: str, sender_seq=None, ts=None) -> DecodedFrame:
+        """
+        Đánh dấu slot đã ghi xong
+
+        Args:
+            index: Index từ reserve()
+            height: Chiều cao frame
+            width: Chiều rộng frame
+            stream: Stream của frame
+            sender_seq: seq sender gắn vào payload
+            ts: Timestamp (ns) sender gắn vào payload
+
+        Returns:
+            DecodedFrame view của slot
+        """
+        seq = self.committed
+        self.committed += 1
+
+        frame = DecodedFrame(seq, stream, sender_seq, ts, index, self.slots[index, :height, :width])
+        self._slot_seq[index] = seq
+        self._frames[index] = frame
+        self._latest = frame
+        return frame
+
+    def latest(self) -> DecodedFrame | None:
+        """
+        Frame mới nhất đã commit mà slot chưa bị reserve lại
+
+        Returns:
+            DecodedFrame hoặc None nếu chưa có frame (hoặc slot của nó đang được ghi)
+        """
+        return self._latest
+
+    def is_current(self, frame: DecodedFrame) -> bool:
+        """
+        View của frame còn hợp lệ (slot chưa bị ghi lại)
+
+        Args:
+            frame: DecodedFrame nhận được trước đó
+
+        Returns:
+            True nếu slot vẫn chứa frame đó
+        """
+        return self._slot_seq[frame.index] == frame.seq
+
+    def close(self) -> None:
+        """Giải phóng ring (subclass dùng shared memory override)"""
+        self._frames = [None] * self.capacity
+        self._latest = None
@@ -0,0 +1,109 @@
+"""
+HopLatencyTracker - Latency theo từng hop của payload có trace header
+
+Trace header (sender bật SENDER_TRACE, relay ghi thêm timestamps):
+    {"sent": ..., "srv_recv": ..., "srv_emit": ...}
+
+Mọi timestamp đều theo wall clock của server: sender và receiver quy đổi
+clock của mình bằng ClockSync, nên các hop so sánh được với nhau:
+    sender_server   = srv_recv - sent
+    relay           = srv_emit - srv_recv
+    server_receiver = received - srv_emit
+    end_to_end      = received - sent
+
+`take_window_max()` trả về end_to_end lớn nhất theo stream kể từ lần gọi
+trước, dùng cho feedback định kỳ gửi về sender.
+
+Sai số của ClockSync (tối đa rtt / 2) có thể làm một hop âm; giá trị âm
+được tính là 0 và đếm trong `clock_skew`.
+"""
+import time
+
+from src.observability.latency import LatencyHistogram
+from src.socketio_client.shared.service.ClockSync import ClockSync
+
+HOPS = ("sender_server", "relay", "server_receiver", "end_to_end")
+
+
+class HopLatencyTracker:
+    """
+    LatencyHistogram cho mỗi (stream, hop).
+
+    Usage:
+        tracker = HopLatencyTracker(registry.clock)
+        tracker.record(payload)
+        tracker.get_stats()  # {stream: {hop: snapshot}}
+    """
+
+    # Key của trace header trong payload
+    TRACE_KEY = "trace"
+
+    def __init__(self, clock: ClockSync):
+        """
+        Args:
+            clock: Offset clock server - receiver
+        """
+        self._clock = clock
+        # stream -> histograms theo thứ tự HOPS
+        self._histograms: dict[str, tuple[LatencyHistogram, ...]] = {}
+        # stream -> end_to_end lớn nhất (ns) kể từ take_window_max() trước
+        self._window_max: dict[str, int] = {}
+
+        # Counters
+        self.traced = 0
+        self.clock_skew = 0
+
+    def record(self, payload) -> None:
+        """
+        Ghi nhận latency của một payload vừa nhận (bỏ qua nếu không có trace)
+
+        Args:
+            payload: Payload relay từ server
+        """
+        received = time.time_ns()
+        trace = payload.get(self.TRACE_KEY) if isinstance(payload, dict) else None
+        if not isinstance(trace, dict):
+            return
+
+        sent, srv_recv, srv_emit = trace.get("sent"), trace.get("srv_recv"), trace.get("srv_emit")
+        if not (isinstance(sent, int) and isinstance(srv_recv, int) and isinstance(srv_emit, int)):
+            return
+
+        stream_id = payload.get("stream")
+        histograms = self._histograms.get(stream_id)
+        if histograms is None:
+            histograms = self._histograms[stream_id] = tuple(LatencyHistogram() for _ in HOPS)
+
+        received = self._clock.to_server(received)
+        values = (srv_recv - sent, srv_emit - srv_recv, received - srv_emit, received - sent)
+        for histogram, value in zip(histograms, values):
+            if value < 0:
+                self.clock_skew += 1
+                value = 0
+            histogram.record(value)
+        end_to_end = max(values[-1], 0)
+        if end_to_end > self._window_max.get(stream_id, -1):
+            self._window_max[stream_id] = end_to_end
+        self.traced += 1
+
+    def take_window_max(self) -> dict[str, float]:
+        """
+        End-to-end latency lớn nhất theo stream kể từ lần gọi trước (rồi reset)
+
+        Returns:
+            Dict stream -> latency (ms); stream không có payload traced thì không có mặt
+        """
+        window, self._window_max = self._window_max, {}
+        return {stream_id: round(value / 1e6, 3) for stream_id, value in window.items()}
+
+    def get_stats(self) -> dict[str, dict[str, dict]]:
+        """
+        Latency percentiles theo stream và hop
+
+        Returns:
+            Dict stream -> hop -> snapshot (count, mean, p50, p90, p99, p999, max tính bằng ms)
+        """
+        return {
+            stream_id: {hop: histogram.snapshot() for hop, histogram in zip(HOPS, histograms)}
+            for stream_id, histograms in self._histograms.items()
+        }
@@ -0,0 +1,179 @@
+"""
+SharedFrameReader - Đọc frames từ SharedFrameRing trong một process khác
+
+Consumer (ví dụ inference process trên cùng host) attach vào shared memory
+block theo tên và nhận view (không copy) của slot. Vì writer có thể ghi lại
+slot bất cứ lúc nào sau đó, consumer kiểm tra `is_current(frame)` sau khi
+dùng xong view (seqlock); kết quả tính trên frame đã bị ghi lại phải bỏ.
+`copy_latest()` trả về một bản copy đã được kiểm tra.
+
+Usage:
+    reader = SharedFrameReader("receiver-frames")
+    frame = await reader.wait_next(last_seq)
+    result = model(frame.image)
+    if reader.is_current(frame):
+        publish(result)
+    reader.close()
+"""
+import asyncio
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from src.socketio_client.receiver.service.SharedFrameRing import (
+    GLOBAL_HEADER,
+    MAGIC,
+    SLOT_HEADER,
+    VERSION,
+    layout,
+)
+
+
+class SharedFrame:
+    """View (không copy) của một slot trong shared memory"""
+
+    __slots__ = ("seq", "stream", "sender_seq", "ts", "index", "gen", "image")
+
+    def __init__(self, seq: int, stream: str, sender_seq: int, ts: int, index: int, gen: int, image: np.ndarray):
+        self.seq = seq
+        self.stream = stream
+        self.sender_seq = sender_seq
+        self.ts = ts
+        self.index = index
+        # gen của slot lúc đọc (seqlock)
+        self.gen = gen
+        self.image = image
+
+
+class SharedFrameReader:
+    """
+    Read-only view của một SharedFrameRing.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Tên shared memory block của receiver
+
+        Raises:
+            FileNotFoundError: Nếu block chưa được tạo
+            ValueError: Nếu block không phải SharedFrameRing
+        """
+        self._shm = self._attach(name)
+        buffer = self._shm.buf
+
+        self._header = np.ndarray((1,), dtype=GLOBAL_HEADER, buffer=buffer)
+        header = self._header[0]
+        if header["magic"] != MAGIC or header["version"] != VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory '{name}' không phải frame ring (version {VERSION})")
+
+        self.capacity = int(header["capacity"])
+        self.max_height = int(header["max_height"])
+        self.max_width = int(header["max_width"])
+        self.channels = int(header["channels"])
+
+        headers_offset, data_offset, _ = layout(self.capacity, self.max_height, self.max_width, self.channels)
+        self._slot_headers = np.ndarray(
+            (self.capacity,), dtype=SLOT_HEADER, buffer=buffer, offset=headers_offset
+        )
+        self._slots = np.ndarray(
+            (self.capacity, self.max_height, self.max_width, self.channels),
+            dtype=np.uint8, buffer=buffer, offset=data_offset,
+        )
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        try:
+            # Python >= 3.13: không để resource tracker của reader unlink block
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")
+            return shm
+
+    @property
+    def write_count(self) -> int:
+        """Số frame writer đã commit"""
+        return int(self._header["write_count"][0])
+
+    def latest(self) -> SharedFrame | None:
+        """
+        Frame mới nhất (view, không copy)
+
+        Returns:
+            SharedFrame, hoặc None nếu chưa có frame hoặc slot đang bị ghi lại
+        """
+        index = int(self._header["latest_index"][0])
+        if index < 0:
+            return None
+
+        gen = int(self._slot_headers["gen"][index])
+        if gen % 2:
+            return None
+
+        header = self._slot_headers[index]
+        frame = SharedFrame(
+            int(header["seq"]),
+            bytes(header["stream"]).decode(errors="replace"),
+            int(header["sender_seq"]),
+            int(header["ts"]),
+            index,
+            gen,
+            self._slots[index, :int(header["height"]), :int(header["width"]), :int(header["channels"])],
+        )
+        # Header có thể đã đổi trong lúc đọc
+        return frame if self.is_current(frame) else None
+
+    def is_current(self, frame: SharedFrame) -> bool:
+        """
+        View của frame còn hợp lệ (slot chưa bị ghi lại)
+
+        Args:
+            frame: Frame từ latest()/wait_next()
+
+        Returns:
+            True nếu gen của slot không đổi
+        """
+        return int(self._slot_headers["gen"][frame.index]) == frame.gen
+
+    def copy_latest(self) -> SharedFrame | None:
+        """
+        Copy frame mới nhất ra memory riêng của process
+
+        Returns:
+            SharedFrame với image là bản copy, None nếu không đọc được
+            frame nhất quán
+        """
+        frame = self.latest()
+        if frame is None:
+            return None
+
+        frame.image = frame.image.copy()
+        return frame if self.is_current(frame) else None
+
+    async def wait_next(self, after_seq: int = -1, poll_interval: float = 0.002) -> SharedFrame:
+        """
+        Chờ tới khi có frame mới hơn after_seq
+
+        Args:
+            after_seq: Seq của frame cuối cùng đã xử lý
+            poll_interval: Chu kỳ kiểm tra (giây)
+
+        Returns:
+            SharedFrame mới nhất (các frame ở giữa có thể bị bỏ qua)
+        """
+        while True:
+            frame = self.latest()
+            if frame is not None and frame.seq > after_seq:
+                return frame
+            await asyncio.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Detach khỏi shared memory (không unlink)"""
+        self._header = self._slot_headers = self._slots = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Còn view của frame đang được giữ, memory được giải phóng khi GC
+            pass
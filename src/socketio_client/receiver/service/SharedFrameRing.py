@@ -0,0 +1,170 @@
+"""
+SharedFrameRing - FrameRingBuffer đặt trong multiprocessing.shared_memory
+
+Decoder workers ghi thẳng vào shared memory, nên consumer processes trên
+cùng host (ví dụ inference) đọc frame mà không qua pickle/queue và không
+copy thêm lần nào (xem SharedFrameReader).
+
+Layout (little-endian):
+    [global header 64 B][slot headers capacity * 96 B][slot data capacity * H * W * C]
+
+Global header: magic, version, capacity, max_height, max_width, channels,
+write_count (số frame đã commit), latest_index (slot mới nhất, -1 nếu chưa có).
+
+Slot header là một seqlock: `gen` lẻ trong lúc slot đang được ghi, chẵn khi
+đã commit. Reader đọc `gen` trước và sau khi dùng frame; khác nhau (hoặc lẻ)
+nghĩa là slot đã bị ghi lại và frame phải bỏ. Chỉ có một writer (event loop
+của receiver), nên không cần lock giữa các processes.
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.socketio_client.receiver.service.FrameRingBuffer import DecodedFrame, FrameRingBuffer
+
+MAGIC = b"FRMR"
+VERSION = 1
+
+GLOBAL_HEADER = np.dtype([
+    ("magic", "S4"),
+    ("version", "<u4"),
+    ("capacity", "<u4"),
+    ("max_height", "<u4"),
+    ("max_width", "<u4"),
+    ("channels", "<u4"),
+    ("write_count", "<u8"),
+    ("latest_index", "<i8"),
+])
+GLOBAL_HEADER_SIZE = 64
+
+SLOT_HEADER = np.dtype([
+    ("gen", "<u8"),
+    ("seq", "<u8"),
+    ("sender_seq", "<i8"),
+    ("ts", "<i8"),
+    ("height", "<u4"),
+    ("width", "<u4"),
+    ("channels", "<u4"),
+    ("dtype", "S4"),
+    ("stream", "S48"),
+])
+
+
+def encode_stream(stream: str | None) -> bytes:
+    """
+    Stream ID dạng UTF-8 vừa field `stream` của slot header
+
+    Args:
+        stream: Stream ID
+
+    Returns:
+        Tối đa 48 bytes, cắt ở ranh giới ký tự để reader decode được
+    """
+    encoded = (stream or "").encode()
+    size = SLOT_HEADER["stream"].itemsize
+    if len(encoded) <= size:
+        return encoded
+    return encoded[:size].decode(errors="ignore").encode()
+
+
+def layout(capacity: int, max_height: int, max_width: int, channels: int) -> tuple[int, int, int]:
+    """
+    Offsets của shared memory block
+
+    Args:
+        capacity: Số slot
+        max_height: Chiều cao tối đa của frame
+        max_width: Chiều rộng tối đa của frame
+        channels: Số channel
+
+    Returns:
+        (offset slot headers, offset slot data, tổng kích thước)
+    """
+    headers_offset = GLOBAL_HEADER_SIZE
+    # Slot data căn theo 64 bytes (cache line)
+    data_offset = -(-(headers_offset + capacity * SLOT_HEADER.itemsize) // 64) * 64
+    size = data_offset + capacity * max_height * max_width * channels
+    return headers_offset, data_offset, size
+
+
+class SharedFrameRing(FrameRingBuffer):
+    """
+    Single-writer ring buffer trong shared memory, đọc được từ processes khác.
+
+    Usage:
+        ring = SharedFrameRing("receiver-frames", capacity, max_height, max_width)
+        ...
+        ring.close()  # unlink shared memory
+    """
+
+    def __init__(self, name: str, capacity: int, max_height: int, max_width: int):
+        """
+        Args:
+            name: Tên shared memory block (consumers attach theo tên này)
+            capacity: Số slot
+            max_height: Chiều cao tối đa của frame
+            max_width: Chiều rộng tối đa của frame
+
+        Raises:
+            FileExistsError: Nếu block cùng tên đang tồn tại
+        """
+        self.name = name
+        self._shm: shared_memory.SharedMemory | None = None
+        super().__init__(capacity, max_height, max_width)
+
+        self._header[0] = (MAGIC, VERSION, capacity, max_height, max_width, self.CHANNELS, 0, -1)
+
+    def _allocate_slots(self, shape: tuple[int, ...]) -> np.ndarray:
+        capacity, max_height, max_width, channels = shape
+        headers_offset, data_offset, size = layout(capacity, max_height, max_width, channels)
+
+        self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        buffer = self._shm.buf
+
+        self._header = np.ndarray((1,), dtype=GLOBAL_HEADER, buffer=buffer)
+        self._slot_headers = np.ndarray((capacity,), dtype=SLOT_HEADER, buffer=buffer, offset=headers_offset)
+        self._slot_headers[:] = np.zeros(capacity, dtype=SLOT_HEADER)
+        return np.ndarray(shape, dtype=np.uint8, buffer=buffer, offset=data_offset)
+
+    def reserve(self) -> tuple[int, np.ndarray]:
+        index, slot = super().reserve()
+
+        # gen lẻ: slot đang được ghi, readers bỏ qua
+        gen = self._slot_headers["gen"]
+        if gen[index] % 2 == 0:
+            gen[index] += 1
+        return index, slot
+
+    def commit(self, index: int, height: int, width: int, stream: str, sender_seq=None, ts=None) -> DecodedFrame:
+        frame = super().commit(index, height, width, stream, sender_seq, ts)
+
+        headers = self._slot_headers
+        headers["seq"][index] = frame.seq
+        headers["sender_seq"][index] = sender_seq if isinstance(sender_seq, int) else -1
+        headers["ts"][index] = ts if isinstance(ts, int) else 0
+        headers["height"][index] = height
+        headers["width"][index] = width
+        headers["channels"][index] = self.CHANNELS
+        headers["dtype"][index] = b"|u1"
+        headers["stream"][index] = encode_stream(stream)
+        # gen chẵn sau khi header và data đã ghi xong
+        headers["gen"][index] += 1
+
+        self._header["latest_index"][0] = index
+        self._header["write_count"][0] = self.committed
+        return frame
+
+    def close(self) -> None:
+        """Giải phóng và unlink shared memory (consumers đang attach vẫn đọc được tới khi detach)"""
+        if self._shm is None:
+            return
+        # Bỏ các views trước khi close buffer
+        super().close()
+        self.slots = self._header = self._slot_headers = None
+        self._shm.unlink()
+        try:
+            self._shm.close()
+        except BufferError:
+            # Consumer trong process này còn giữ view, memory được giải phóng khi GC
+            pass
+        self._shm = None
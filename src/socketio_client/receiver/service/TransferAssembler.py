@@ -0,0 +1,332 @@
+"""
+TransferAssembler - Ghép chunked transfers mà server forward tới receiver
+
+Chunk `i` được ghi thẳng vào offset `i * chunk_size` của buffer đích:
+bytearray cấp phát trước với transfer nhỏ, SpooledTemporaryFile với
+transfer lớn hơn `memory_limit` (rolls xuống disk). Không có bước nối
+chunks hay copy cả payload.
+
+Chunks bị lỡ (reconnect, subscribe giữa chừng, bị server skip vì lag) được
+xin lại từ server theo từng batch `fetch_batch`: sau transfer_end nếu còn
+thiếu, và sau mỗi lần reconnect (`resume()`). Mỗi chunk mang đủ header
+(id, seq, stream, size, chunk_size) nên transfer được tạo ngay cả khi lỡ
+transfer_begin. Transfers bắt đầu trong lúc mất kết nối được server báo lại
+qua transfer_sync (theo seq của transfer cuối cùng assembler biết).
+
+Khi đủ chunks, listeners nhận (transfer, payload): payload là memoryview
+của bytearray hoặc file object đã seek về đầu. Buffer được giải phóng sau
+khi listeners trả về, nên listener phải đọc/copy ngay.
+"""
+import time
+from collections import deque
+from tempfile import SpooledTemporaryFile
+from typing import Awaitable, Callable
+
+from src.observability.logger import get_logger
+from src.socketio_client.receiver.service.AssemblySettings import AssemblySettings
+
+logger = get_logger(__name__)
+
+
+class IncomingTransfer:
+    """Buffer và bitmap của một transfer đang ghép"""
+
+    __slots__ = (
+        "id", "stream", "size", "chunk_size", "chunk_count", "meta",
+        "_buffer", "_file", "_bitmap", "received", "fetching", "last_active",
+    )
+
+    def __init__(self, transfer_id: str, stream: str, size: int, chunk_size: int,
+                 meta: dict | None, memory_limit: int):
+        self.id = transfer_id
+        self.stream = stream
+        self.size = size
+        self.chunk_size = chunk_size
+        self.chunk_count = -(-size // chunk_size)
+        self.meta = meta
+        if size <= memory_limit:
+            self._buffer: bytearray | None = bytearray(size)
+            self._file = None
+        else:
+            self._buffer = None
+            self._file = SpooledTemporaryFile(max_size=memory_limit)
+        self._bitmap = bytearray(self.chunk_count)
+        self.received = 0
+        # Chunks đã xin lại và đang chờ, None nếu không fetch
+        self.fetching: set[int] | None = None
+        self.last_active = time.monotonic()
+
+    @property
+    def complete(self) -> bool:
+        """Đã nhận đủ mọi chunk"""
+        return self.received == self.chunk_count
+
+    def missing(self, limit: int | None = None) -> list[int]:
+        """
+        Các chunks chưa nhận, theo thứ tự
+
+        Args:
+            limit: Số chunks tối đa trả về (None = tất cả)
+
+        Returns:
+            List chunk indices
+        """
+        result = []
+        index = self._bitmap.find(0)
+        while index != -1 and (limit is None or len(result) < limit):
+            result.append(index)
+            index = self._bitmap.find(0, index + 1)
+        return result
+
+    def write(self, index: int, data: bytes) -> bool:
+        """
+        Ghi chunk vào offset của nó
+
+        Args:
+            index: Chunk index
+            data: Data của chunk
+
+        Returns:
+            False nếu chunk không hợp lệ hoặc đã nhận
+        """
+        offset = index * self.chunk_size
+        if not 0 <= index < self.chunk_count or len(data) != min(self.chunk_size, self.size - offset):
+            return False
+
+        self.last_active = time.monotonic()
+        if self._bitmap[index]:
+            return False
+
+        if self._buffer is not None:
+            self._buffer[offset:offset + len(data)] = data
+        else:
+            self._file.seek(offset)
+            self._file.write(data)
+        self._bitmap[index] = 1
+        self.received += 1
+        return True
+
+    def payload(self):
+        """
+        Payload đã ghép
+
+        Returns:
+            memoryview (transfer nhỏ) hoặc file object đã seek về đầu
+        """
+        if self._buffer is not None:
+            return memoryview(self._buffer)
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        """Giải phóng buffer"""
+        self._buffer = None
+        if self._file is not None:
+            self._file.close()
+
+
+class TransferAssembler:
+    """
+    Ghép các transfers đang tới, xin lại chunks bị lỡ.
+
+    Usage:
+        assembler = TransferAssembler(settings, fetch=registry_fetch, sync=registry_sync)
+        assembler.add_listener(lambda transfer, payload: save(transfer.meta, payload))
+        await assembler.on_chunk(data)
+    """
+
+    # Số transfer IDs đã hoàn tất được nhớ để bỏ chunks tới trễ
+    COMPLETED_HISTORY = 256
+
+    def __init__(
+        self,
+        settings: AssemblySettings,
+        fetch: Callable[[str, list[int]], Awaitable[None]],
+        sync: Callable[[int | None], Awaitable[None]],
+    ):
+        """
+        Args:
+            settings: Cấu hình ghép transfers
+            fetch: Coroutine xin server gửi lại (transfer_id, chunk indices)
+            sync: Coroutine hỏi server các transfers có seq > after
+        """
+        self._settings = settings
+        self._fetch = fetch
+        self._sync = sync
+        self._transfers: dict[str, IncomingTransfer] = {}
+        self._listeners: list[Callable[[IncomingTransfer, object], None]] = []
+        self._completed_ids: deque[str] = deque(maxlen=self.COMPLETED_HISTORY)
+        # Seq của transfer mới nhất đã biết, None trước lần sync đầu tiên
+        self.last_seq: int | None = None
+
+        # Counters
+        self.completed = 0
+        self.failed = 0
+        self.fetched = 0
+
+    @property
+    def active(self) -> int:
+        """Số transfers đang ghép"""
+        return len(self._transfers)
+
+    def add_listener(self, listener: Callable[[IncomingTransfer, object], None]) -> None:
+        """
+        Đăng ký listener nhận mỗi transfer đã ghép xong
+
+        Args:
+            listener: Callable nhận (IncomingTransfer, payload); chạy trong
+                      event loop, payload chỉ hợp lệ trong lúc listener chạy
+        """
+        self._listeners.append(listener)
+
+    async def on_begin(self, header: dict) -> None:
+        """
+        Transfer mới trên stream đã subscribe
+
+        Args:
+            header: {"id", "seq", "stream", "size", "chunk_size", "meta"}
+        """
+        self._expire()
+        transfer = self._get_or_create(header)
+        if transfer is not None and transfer.meta is None:
+            transfer.meta = header.get("meta")
+
+    async def on_chunk(self, data: dict) -> None:
+        """
+        Một chunk (forward trực tiếp hoặc được gửi lại)
+
+        Args:
+            data: {"id", "seq", "stream", "size", "chunk_size", "index", "data": <bytes>}
+        """
+        transfer = self._get_or_create(data)
+        index, chunk = data.get("index"), data.get("data")
+        if transfer is None or not isinstance(index, int) or not isinstance(chunk, (bytes, bytearray)):
+            return
+
+        transfer.write(index, chunk)
+        if transfer.complete:
+            self._deliver(transfer)
+            return
+
+        fetching = transfer.fetching
+        if fetching is not None:
+            fetching.discard(index)
+            if not fetching:
+                await self._fetch_next(transfer)
+
+    async def on_end(self, data: dict) -> None:
+        """
+        Server đã nhận đủ transfer (hoặc báo transfer không còn)
+
+        Args:
+            data: Header của transfer, hoặc {"id", "error"}
+        """
+        if data.get("error"):
+            transfer = self._transfers.pop(data.get("id"), None)
+            if transfer is not None:
+                self.failed += 1
+                logger.warning("Transfer %s dropped: %s", transfer.id, data["error"])
+                transfer.close()
+            return
+
+        transfer = self._get_or_create(data)
+        if transfer is None:
+            return
+        if transfer.meta is None:
+            transfer.meta = data.get("meta")
+        if not transfer.complete and not transfer.fetching:
+            await self._fetch_next(transfer)
+
+    async def on_sync(self, data: dict) -> None:
+        """
+        Seq hiện tại của server, sau các transfers được báo lại
+
+        Args:
+            data: {"seq": int}
+        """
+        self._note_seq(data.get("seq"))
+
+    async def resume(self) -> None:
+        """
+        Hỏi các transfers bị lỡ và xin lại chunks của transfers chưa hoàn tất
+
+        Gọi sau mỗi lần connect (chunks đang fetch trước đó coi như mất).
+        Lần đầu chỉ lấy seq hiện tại của server, không nhận transfers cũ.
+        """
+        self._expire()
+        await self._sync(self.last_seq)
+        for transfer in list(self._transfers.values()):
+            await self._fetch_next(transfer)
+
+    def close(self) -> None:
+        """Giải phóng mọi transfer đang ghép"""
+        for transfer in self._transfers.values():
+            transfer.close()
+        self._transfers.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Counters của assembler
+
+        Returns:
+            Dict gồm active, completed, failed, fetched
+        """
+        return {
+            "active": len(self._transfers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "fetched": self.fetched,
+        }
+
+    def _note_seq(self, seq) -> None:
+        if isinstance(seq, int) and (self.last_seq is None or seq > self.last_seq):
+            self.last_seq = seq
+
+    def _get_or_create(self, header: dict) -> IncomingTransfer | None:
+        self._note_seq(header.get("seq"))
+        transfer_id = header.get("id")
+        transfer = self._transfers.get(transfer_id)
+        if transfer is not None or transfer_id in self._completed_ids:
+            return transfer
+
+        stream_id, size, chunk_size = header.get("stream"), header.get("size"), header.get("chunk_size")
+        if not isinstance(transfer_id, str) or not isinstance(size, int) or not isinstance(chunk_size, int):
+            return None
+        if not 0 < size <= self._settings.max_size or chunk_size < 1:
+            logger.warning("Ignoring transfer %s of %r bytes", transfer_id, size)
+            self._completed_ids.append(transfer_id)
+            return None
+
+        transfer = IncomingTransfer(
+            transfer_id, stream_id, size, chunk_size, header.get("meta"), self._settings.memory_limit
+        )
+        self._transfers[transfer_id] = transfer
+        return transfer
+
+    async def _fetch_next(self, transfer: IncomingTransfer) -> None:
+        """Xin batch chunks còn thiếu kế tiếp"""
+        indices = transfer.missing(self._settings.fetch_batch)
+        transfer.fetching = set(indices) if indices else None
+        if indices:
+            self.fetched += len(indices)
+            await self._fetch(transfer.id, indices)
+
+    def _deliver(self, transfer: IncomingTransfer) -> None:
+        del self._transfers[transfer.id]
+        self._completed_ids.append(transfer.id)
+        self.completed += 1
+        try:
+            payload = transfer.payload()
+            for listener in self._listeners:
+                listener(transfer, payload)
+        finally:
+            transfer.close()
+
+    def _expire(self) -> None:
+        """Bỏ các transfers chưa hoàn tất không hoạt động quá ttl"""
+        deadline = time.monotonic() - self._settings.ttl
+        for transfer in [t for t in self._transfers.values() if t.last_active < deadline]:
+            del self._transfers[transfer.id]
+            self.failed += 1
+            logger.warning("Transfer %s expired (%d/%d chunks)", transfer.id, transfer.received, transfer.chunk_count)
+            transfer.close()
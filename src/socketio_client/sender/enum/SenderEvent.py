@@ -14,4 +14,13 @@ class SenderEvent(BaseEvents):
     từ BaseEvents và thêm các events riêng cho chức năng chat client.
     """
 
-    pass
\ No newline at end of file
+    # Stream events - sender publish frame lên server để relay
+    PUBLISH = SocketEvent("publish")
+
+    # Transfer events - upload payload lớn theo chunks, server ack từng chunk
+    TRANSFER_BEGIN = SocketEvent("transfer_begin")
+    TRANSFER_CHUNK = SocketEvent("transfer_chunk")
+    TRANSFER_ACK = SocketEvent("transfer_ack")
+
+    # Feedback events - server tổng hợp tình trạng receivers của stream
+    STREAM_FEEDBACK = SocketEvent("stream_feedback")
@@ -5,10 +5,13 @@ Example handler để demo cách implement IEventHandler cho client
 """
 from socketio import AsyncClient
 
+from src.observability.logger import get_logger
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
 from src.socketio_client.sender.enum.SenderEvent import SenderEvent
 from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
 
+logger = get_logger(__name__)
+
 
 class ConnectHandler(IEventHandler):
     """Handler xử lý sự kiện connect"""
@@ -29,9 +32,9 @@ class ConnectHandler(IEventHandler):
             None (không update session_id)
         """
         # Log connection
-        print(f"[Sender] Connected to server successfully!")
+        logger.info("Connected to server successfully!")
         if session_id:
-            print(f"[Sender] Current session: {session_id}")
+            logger.info("Current session: %s", session_id)
 
         # Optional: Send initial data to server
         # await sio.emit("join_room", {"room": "lobby"}, namespace=self.namespace)
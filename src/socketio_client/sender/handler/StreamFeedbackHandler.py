@@ -0,0 +1,43 @@
+"""
+StreamFeedbackHandler - Xử lý feedback của server về tình trạng receivers
+
+Handler chuyển feedback cho registry, registry chuyển tiếp cho
+QualityController nếu sender bật adaptive quality.
+"""
+from typing import Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.sender.enum.SenderEvent import SenderEvent
+from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
+
+
+class StreamFeedbackHandler(IEventHandler):
+    """Handler xử lý STREAM_FEEDBACK event từ server"""
+
+    event = SenderEvent.STREAM_FEEDBACK
+    namespace = SenderNamespace.ROOT
+
+    def __init__(self, on_feedback: Callable[[dict], None]):
+        """
+        Args:
+            on_feedback: Callback của registry nhận feedback
+        """
+        self._on_feedback = on_feedback
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server gửi tổng hợp tình trạng receivers của stream
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"stream", "receivers", "queue", "decode_ms", "drop_rate", "latency_ms", "relay"}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            self._on_feedback(data)
+        return None
@@ -0,0 +1,43 @@
+"""
+TransferAckHandler - Xử lý ack của server cho chunked upload
+
+Handler chuyển ack cho ChunkedUploader của registry. Không log mỗi ack vì
+đây là hot path của upload.
+"""
+from typing import Callable
+
+from socketio import AsyncClient
+
+from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.sender.enum.SenderEvent import SenderEvent
+from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
+
+
+class TransferAckHandler(IEventHandler):
+    """Handler xử lý TRANSFER_ACK event từ server"""
+
+    event = SenderEvent.TRANSFER_ACK
+    namespace = SenderNamespace.ROOT
+
+    def __init__(self, on_ack: Callable[[dict], None]):
+        """
+        Args:
+            on_ack: Callback của ChunkedUploader nhận ack
+        """
+        self._on_ack = on_ack
+
+    async def handle(self, sio: AsyncClient, session_id: str | None, data=None):
+        """
+        Xử lý khi server ack transfer_begin hoặc một chunk
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            session_id: Session ID hiện tại
+            data: {"id": ..., "missing"|"index"|"error": ..., "complete": bool}
+
+        Returns:
+            None (không update session_id)
+        """
+        if isinstance(data, dict):
+            self._on_ack(data)
+        return None
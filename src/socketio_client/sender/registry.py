@@ -4,6 +4,8 @@ SenderEventRegistry - Registry cho Sender Client
 Kế thừa từ BaseEventRegistry và implement _create_handlers()
 để định nghĩa các handlers riêng cho sender client.
 """
+from socketio import AsyncClient
+
 from src.socketio_client.shared.base.BaseEventRegistry import BaseEventRegistry
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
 from src.socketio_client.sender.handler.ConnectHandler import ConnectHandler
@@ -11,6 +13,13 @@ from src.socketio_client.sender.handler.ConnectionConfirmedHandler import (
     ConnectionConfirmedHandler,
 )
 from src.socketio_client.sender.handler.DisconnectHandler import DisconnectHandler
+from src.socketio_client.sender.handler.StreamFeedbackHandler import StreamFeedbackHandler
+from src.socketio_client.sender.handler.TransferAckHandler import TransferAckHandler
+from src.socketio_client.sender.enum.SenderNamespace import SenderNamespace
+from src.socketio_client.sender.service.ChunkedUploader import ChunkedUploader
+from src.socketio_client.sender.service.LatestFrameQueue import LatestFrameQueue
+from src.socketio_client.sender.service.QualityController import QualityController
+from src.socketio_client.sender.service.UploadSettings import UploadSettings
 
 
 class SenderEventRegistry(BaseEventRegistry):
@@ -20,6 +29,50 @@ class SenderEventRegistry(BaseEventRegistry):
     Kế thừa từ BaseEventRegistry và implement abstract method _create_handlers().
     """
 
+    ROLE = "sender"
+
+    def __init__(
+        self,
+        sio: AsyncClient,
+        frame_queue_size: int = 2,
+        upload_settings: UploadSettings | None = None,
+        quality: QualityController | None = None,
+    ):
+        """
+        Initialize SenderEventRegistry
+
+        Args:
+            sio: SocketIO AsyncClient instance
+            frame_queue_size: Số encoded frame tối đa chờ emit
+            upload_settings: Cấu hình chunked upload (mặc định nếu None)
+            quality: Controller điều chỉnh quality theo feedback (None = quality cố định)
+        """
+        # Queue giữa encode và emit của frame streaming
+        self.frame_queue = LatestFrameQueue(frame_queue_size)
+        # Upload payload lớn theo chunks, ack đi qua TransferAckHandler
+        self.uploader = ChunkedUploader(sio, SenderNamespace.ROOT, upload_settings or UploadSettings())
+        # Adaptive quality, dùng chung với FrameStreamer
+        self.quality = quality
+        # Feedback gần nhất của server về receivers của stream
+        self.last_feedback: dict | None = None
+
+        super().__init__(sio)
+
+    def get_stream_stats(self) -> dict:
+        """
+        Lấy counters của frame streaming (queue depth, dropped frames)
+
+        Returns:
+            Dict counters của frame queue
+        """
+        return self.frame_queue.get_stats()
+
+    def _on_stream_feedback(self, data: dict) -> None:
+        """Lưu feedback và chuyển cho QualityController (kèm frames bị bỏ ở sender)"""
+        self.last_feedback = data
+        if self.quality is not None:
+            self.quality.on_feedback(data, self.frame_queue.dropped)
+
     def _create_handlers(self) -> list[IEventHandler]:
         """
         Tạo và trả về danh sách các event handlers cho Sender Client.
@@ -31,4 +84,6 @@ class SenderEventRegistry(BaseEventRegistry):
             ConnectHandler(),
             ConnectionConfirmedHandler(),
             DisconnectHandler(),
+            TransferAckHandler(self.uploader.on_ack),
+            StreamFeedbackHandler(self._on_stream_feedback),
         ]
@@ -0,0 +1,246 @@
+"""
+ChunkedUploader - Upload payload lớn lên server theo chunks, resume được
+
+Protocol (sender <-> server):
+    transfer_begin {"id", "stream", "size", "chunk_size", "meta"}
+        -> transfer_ack {"id", "missing": [...], "more", "complete"}
+    transfer_chunk {"id", "index", "data"}
+        -> transfer_ack {"id", "index", "complete"}
+    lỗi: transfer_ack {"id", "error"}
+
+Chunks được đọc từ source khi gửi (file không bao giờ được đọc hết vào
+memory) và tối đa `window` chunks chờ ack cùng lúc. Begin ack chỉ chứa một
+phần danh sách chunks còn thiếu ("more"); gửi hết phần đó thì uploader gửi
+lại transfer_begin để lấy phần tiếp theo. Mỗi chunk là một packet
+riêng, nên events khác (publish, ping/pong) vẫn xen giữa các chunks.
+
+Khi mất kết nối, upload dừng lại; sau khi reconnect `resume()` gửi lại
+transfer_begin cùng ID, server trả về các chunks còn thiếu và upload tiếp
+từ đó (các chunks chưa được ack trước khi mất kết nối được gửi lại).
+
+Usage:
+    result = await uploader.upload("cam-1", "/path/to/video.mp4", meta={"name": "video.mp4"})
+    # trong on_connected của ConnectionSupervisor:
+    await uploader.resume()
+"""
+import asyncio
+import os
+import uuid
+from collections import deque
+
+from socketio import AsyncClient
+from socketio.exceptions import BadNamespaceError
+
+from src.observability.logger import get_logger
+from src.socketio_client.shared.enum.BaseNamespace import Namespace
+from src.socketio_client.sender.enum.SenderEvent import SenderEvent
+from src.socketio_client.sender.service.UploadSettings import UploadSettings
+
+logger = get_logger(__name__)
+
+
+class _Upload:
+    """State của một upload đang chạy"""
+
+    __slots__ = (
+        "id", "stream", "meta", "size", "chunk_size", "chunk_count", "view", "file",
+        "pending", "in_flight", "more", "ready", "wake", "done",
+    )
+
+    def __init__(self, transfer_id: str, stream: str, meta: dict | None, size: int, chunk_size: int):
+        self.id = transfer_id
+        self.stream = stream
+        self.meta = meta
+        self.size = size
+        self.chunk_size = chunk_size
+        self.chunk_count = -(-size // chunk_size)
+        # Source: memoryview (bytes trong memory) hoặc file object
+        self.view: memoryview | None = None
+        self.file = None
+        # Chunks cần gửi, theo danh sách server trả về trong begin ack
+        self.pending: deque[int] = deque()
+        self.in_flight: set[int] = set()
+        # Server còn chunks thiếu ngoài danh sách trong begin ack
+        self.more = False
+        # False cho tới khi nhận begin ack của connection hiện tại
+        self.ready = False
+        self.wake = asyncio.Event()
+        self.done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class ChunkedUploader:
+    """
+    Windowed chunk upload với resume sau reconnect.
+    """
+
+    def __init__(self, sio: AsyncClient, namespace: Namespace, settings: UploadSettings):
+        """
+        Args:
+            sio: SocketIO AsyncClient instance
+            namespace: Namespace để upload
+            settings: Cấu hình chunked upload
+        """
+        self._sio = sio
+        self._namespace = namespace
+        self._settings = settings
+        self._uploads: dict[str, _Upload] = {}
+
+        # Counters
+        self.chunks_sent = 0
+        self.resumes = 0
+
+    @property
+    def active(self) -> int:
+        """Số uploads đang chạy"""
+        return len(self._uploads)
+
+    async def upload(
+        self,
+        stream_id: str,
+        source: bytes | bytearray | memoryview | str | os.PathLike,
+        meta: dict | None = None,
+        transfer_id: str | None = None,
+    ) -> dict:
+        """
+        Upload một payload và chờ server nhận đủ mọi chunk
+
+        Args:
+            stream_id: Stream nhận payload (sender phải được phép publish)
+            source: Bytes, hoặc đường dẫn file (đọc dần từng chunk)
+            meta: Metadata gửi kèm cho receivers (ví dụ tên file, content type)
+            transfer_id: ID của transfer (mặc định tạo mới)
+
+        Returns:
+            Dict gồm id, size, chunks
+
+        Raises:
+            RuntimeError: Nếu server từ chối transfer
+            ValueError: Nếu source rỗng
+        """
+        file = None
+        if isinstance(source, (str, os.PathLike)):
+            file = open(source, "rb")
+            size = os.fstat(file.fileno()).st_size
+        else:
+            size = len(source)
+        if size == 0:
+            if file is not None:
+                file.close()
+            raise ValueError("Không upload payload rỗng")
+
+        upload = _Upload(transfer_id or uuid.uuid4().hex, stream_id, meta, size, self._settings.chunk_size)
+        if file is not None:
+            upload.file = file
+        else:
+            upload.view = memoryview(source).cast("B")
+        self._uploads[upload.id] = upload
+
+        try:
+            await self._begin(upload)
+            while not upload.done.done():
+                upload.wake.clear()
+                await self._send_window(upload)
+                if upload.ready and upload.more and not upload.pending and not upload.in_flight:
+                    # Đã gửi hết phần danh sách của begin ack: lấy phần tiếp theo
+                    upload.ready = upload.more = False
+                    await self._begin(upload)
+                if not upload.done.done():
+                    await upload.wake.wait()
+            return upload.done.result()
+        finally:
+            del self._uploads[upload.id]
+            if upload.file is not None:
+                upload.file.close()
+
+    async def resume(self) -> None:
+        """
+        Resume các uploads đang chạy sau khi reconnect
+
+        Gọi trong on_connected của ConnectionSupervisor.
+        """
+        for upload in list(self._uploads.values()):
+            if upload.done.done():
+                continue
+            upload.ready = False
+            upload.in_flight.clear()
+            self.resumes += 1
+            await self._begin(upload)
+
+    def on_ack(self, data: dict) -> None:
+        """
+        Xử lý transfer_ack từ server
+
+        Args:
+            data: {"id", "missing", "more", "complete"} | {"id", "index", "complete"} | {"id", "error"}
+        """
+        upload = self._uploads.get(data.get("id"))
+        if upload is None or upload.done.done():
+            return
+
+        error = data.get("error")
+        if error:
+            upload.done.set_exception(RuntimeError(f"Transfer {upload.id} failed: {error}"))
+        elif "missing" in data:
+            # Begin ack: danh sách chunks server còn thiếu là nguồn sự thật
+            upload.pending = deque(index for index in data["missing"] if isinstance(index, int))
+            upload.in_flight.clear()
+            upload.more = bool(data.get("more"))
+            upload.ready = True
+        else:
+            upload.in_flight.discard(data.get("index"))
+
+        if data.get("complete") and not upload.done.done():
+            upload.done.set_result({"id": upload.id, "size": upload.size, "chunks": upload.chunk_count})
+        upload.wake.set()
+
+    async def _send_window(self, upload: _Upload) -> None:
+        """Gửi chunks cho tới khi đủ window (không gửi khi đang chờ begin ack)"""
+        window = self._settings.window
+        while upload.ready and upload.pending and len(upload.in_flight) < window and self._sio.connected:
+            index = upload.pending.popleft()
+            upload.in_flight.add(index)
+            data = await self._read_chunk(upload, index)
+            try:
+                await self._sio.emit(
+                    SenderEvent.TRANSFER_CHUNK.value,
+                    {"id": upload.id, "index": index, "data": data},
+                    namespace=self._namespace.value,
+                )
+            except BadNamespaceError:
+                # Mất kết nối: resume() lấy lại danh sách chunks từ server
+                return
+            self.chunks_sent += 1
+
+    async def _begin(self, upload: _Upload) -> None:
+        """Gửi transfer_begin (mới hoặc resume)"""
+        if not self._sio.connected:
+            return
+        try:
+            await self._sio.emit(
+                SenderEvent.TRANSFER_BEGIN.value,
+                {
+                    "id": upload.id,
+                    "stream": upload.stream,
+                    "size": upload.size,
+                    "chunk_size": upload.chunk_size,
+                    "meta": upload.meta,
+                },
+                namespace=self._namespace.value,
+            )
+        except BadNamespaceError:
+            logger.warning("Transfer %s waits for reconnect", upload.id)
+
+    @staticmethod
+    async def _read_chunk(upload: _Upload, index: int) -> bytes:
+        """Đọc chunk `index` từ source"""
+        offset = index * upload.chunk_size
+        length = min(upload.chunk_size, upload.size - offset)
+        if upload.view is not None:
+            return bytes(upload.view[offset:offset + length])
+
+        def read_at() -> bytes:
+            upload.file.seek(offset)
+            return upload.file.read(length)
+
+        # Đọc file là blocking I/O
+        return await asyncio.to_thread(read_at)
@@ -0,0 +1,111 @@
+"""
+EncoderPool - Encode frames ngoài event loop với số lượng in-flight giới hạn
+
+Encode là CPU-bound; chạy trong event loop sẽ chặn ping/pong và emit của
+AsyncClient. Pool submit frame vào executor (thread hoặc process) và trả
+kết quả theo đúng thứ tự submit.
+"""
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from src.socketio_client.sender.service.FrameEncoder import FrameEncoder
+
+
+class EncoderPool:
+    """
+    Bounded encoder pool với in-order delivery.
+
+    Usage:
+        pool = EncoderPool(FrameEncoder("jpeg", 80), mode="thread", workers=4)
+        await pool.submit(frame)        # chờ nếu đã đủ max_in_flight
+        data = await pool.next_result() # kết quả theo thứ tự submit
+        pool.close()
+    """
+
+    MODES = ("thread", "process")
+
+    def __init__(
+        self,
+        encoder: FrameEncoder,
+        mode: str = "thread",
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+    ):
+        """
+        Args:
+            encoder: Encoder thực thi trong worker
+            mode: "thread" (cv2, giải phóng GIL) hoặc "process" (Pillow)
+            workers: Số worker (mặc định = số CPU)
+            max_in_flight: Số frame tối đa đang encode/chờ lấy kết quả
+                           (mặc định = 2 * workers)
+
+        Raises:
+            ValueError: Nếu mode không hợp lệ
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Encoder pool mode không hợp lệ: '{mode}'")
+
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * workers
+
+        self.encoder = encoder
+        self.mode = mode
+        self.max_in_flight = max_in_flight
+
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="encoder")
+            if mode == "thread"
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pending: deque[asyncio.Future] = deque()
+        self._ready = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        """Số frame đã submit nhưng chưa lấy kết quả"""
+        return len(self._pending)
+
+    async def submit(self, frame: np.ndarray) -> None:
+        """
+        Submit một frame để encode, chờ nếu đã đạt max_in_flight
+
+        Args:
+            frame: BGR frame
+        """
+        await self._slots.acquire()
+
+        loop = asyncio.get_running_loop()
+        self._pending.append(loop.run_in_executor(self._executor, self.encoder.encode, frame))
+        self._ready.set()
+
+    async def next_result(self) -> bytes:
+        """
+        Lấy kết quả encode tiếp theo theo thứ tự submit
+
+        Returns:
+            Encoded bytes
+
+        Raises:
+            Exception: Lỗi từ encoder được raise lại tại đây
+        """
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+
+        future = self._pending.popleft()
+        try:
+            return await future
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Hủy các frame đang chờ và shutdown executor"""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
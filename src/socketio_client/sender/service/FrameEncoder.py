@@ -0,0 +1,97 @@
+"""
+FrameEncoder - Encode frame thành JPEG/WebP bytes
+
+Output là `bytes` để SocketIO gửi dưới dạng binary attachment (không base64).
+`cv2.imencode` trả về uint8 array; `tobytes()` là lần copy duy nhất, cần thiết
+vì SocketIO chỉ nhận diện `bytes` là binary attachment.
+
+Encoders chỉ giữ config đơn giản (codec, quality, scale) nên pickle được,
+dùng được với cả ThreadPoolExecutor và ProcessPoolExecutor.
+"""
+from io import BytesIO
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+class FrameEncoder:
+    """Encode BGR frame bằng OpenCV (giải phóng GIL, phù hợp thread pool)"""
+
+    EXTENSIONS = {
+        "jpeg": ".jpg",
+        "webp": ".webp",
+    }
+
+    QUALITY_FLAGS = {
+        "jpeg": cv2.IMWRITE_JPEG_QUALITY,
+        "webp": cv2.IMWRITE_WEBP_QUALITY,
+    }
+
+    def __init__(self, codec: str = "jpeg", quality: int = 80, scale: float = 1.0):
+        """
+        Args:
+            codec: "jpeg" hoặc "webp"
+            quality: Chất lượng encode (1-100)
+            scale: Tỉ lệ resize trước khi encode (1.0 = giữ nguyên)
+
+        Raises:
+            ValueError: Nếu codec không được hỗ trợ
+        """
+        if codec not in self.EXTENSIONS:
+            raise ValueError(f"Codec không được hỗ trợ: '{codec}'")
+
+        self.codec = codec
+        self.quality = quality
+        self.scale = scale
+
+    def encode(self, frame: np.ndarray) -> bytes:
+        """
+        Encode một frame (blocking, CPU-bound)
+
+        Args:
+            frame: BGR frame
+
+        Returns:
+            Encoded bytes
+
+        Raises:
+            RuntimeError: Nếu OpenCV encode thất bại
+        """
+        if self.scale != 1.0:
+            frame = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+
+        ok, buffer = cv2.imencode(
+            self.EXTENSIONS[self.codec],
+            frame,
+            [self.QUALITY_FLAGS[self.codec], self.quality],
+        )
+        if not ok:
+            raise RuntimeError(f"Encode frame thất bại ({self.codec})")
+        return buffer.tobytes()
+
+
+class PillowFrameEncoder(FrameEncoder):
+    """
+    Encode BGR frame bằng Pillow.
+
+    Pillow giữ GIL trong phần lớn resize/encode, nên encoder này
+    nên chạy trong process pool.
+    """
+
+    FORMATS = {
+        "jpeg": "JPEG",
+        "webp": "WEBP",
+    }
+
+    def encode(self, frame: np.ndarray) -> bytes:
+        # BGR -> RGB
+        image = Image.fromarray(np.ascontiguousarray(frame[:, :, ::-1]))
+
+        if self.scale != 1.0:
+            size = (max(1, round(image.width * self.scale)), max(1, round(image.height * self.scale)))
+            image = image.resize(size, Image.Resampling.BILINEAR)
+
+        buffer = BytesIO()
+        image.save(buffer, format=self.FORMATS[self.codec], quality=self.quality)
+        return buffer.getvalue()
@@ -0,0 +1,123 @@
+"""
+FrameSource - Nguồn frame cho Sender Client
+
+Cung cấp frame (BGR numpy array) từ video file, camera hoặc synthetic source.
+`read()` là blocking call, caller phải gọi ngoài event loop.
+"""
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+
+class FrameSource(ABC):
+    """
+    Abstract base class cho các nguồn frame.
+
+    Mỗi lần `read()` trả về một array mới, caller được giữ array đó
+    (ví dụ submit vào encoder pool) mà không sợ bị ghi đè.
+    """
+
+    fps: float = 0.0
+
+    @abstractmethod
+    def read(self) -> np.ndarray | None:
+        """
+        Đọc frame tiếp theo (blocking)
+
+        Returns:
+            BGR frame hoặc None nếu source đã hết
+        """
+        pass
+
+    def close(self) -> None:
+        """Giải phóng resources của source"""
+        pass
+
+    @classmethod
+    def open(cls, source: str, width: int, height: int, fps: float, loop: bool) -> "FrameSource":
+        """
+        Tạo FrameSource phù hợp từ source string
+
+        Args:
+            source: "synthetic", camera index ("0") hoặc đường dẫn video file
+            width: Chiều rộng frame cho synthetic source
+            height: Chiều cao frame cho synthetic source
+            fps: Frame rate cho synthetic source
+            loop: Phát lại video file khi hết
+
+        Returns:
+            FrameSource instance
+        """
+        if source == "synthetic":
+            return SyntheticSource(width, height, fps)
+        if source.isdigit():
+            return VideoCaptureSource(int(source), loop=False)
+        return VideoCaptureSource(source, loop=loop)
+
+
+class SyntheticSource(FrameSource):
+    """Sinh frame gradient có thanh chạy ngang, không cần camera/video"""
+
+    def __init__(self, width: int, height: int, fps: float):
+        """
+        Args:
+            width: Chiều rộng frame
+            height: Chiều cao frame
+            fps: Frame rate danh nghĩa
+        """
+        self.fps = fps
+        self._width = width
+        self._height = height
+        self._index = 0
+
+        # Background chỉ tạo một lần, mỗi frame copy rồi vẽ lên
+        gradient = np.linspace(0, 255, width, dtype=np.uint8)
+        self._background = np.empty((height, width, 3), dtype=np.uint8)
+        self._background[:, :, 0] = gradient
+        self._background[:, :, 1] = gradient[::-1]
+        self._background[:, :, 2] = 128
+
+    def read(self) -> np.ndarray | None:
+        frame = self._background.copy()
+
+        bar_width = max(1, self._width // 16)
+        x = (self._index * 4) % self._width
+        frame[:, x:x + bar_width] = 255
+        cv2.putText(
+            frame, str(self._index), (8, 32),
+            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2,
+        )
+
+        self._index += 1
+        return frame
+
+
+class VideoCaptureSource(FrameSource):
+    """Đọc frame từ video file hoặc camera qua cv2.VideoCapture"""
+
+    def __init__(self, source: str | int, loop: bool):
+        """
+        Args:
+            source: Đường dẫn video file hoặc camera index
+            loop: Phát lại từ đầu khi hết file
+
+        Raises:
+            RuntimeError: Nếu không mở được source
+        """
+        self._capture = cv2.VideoCapture(source)
+        if not self._capture.isOpened():
+            raise RuntimeError(f"Không mở được video source: {source!r}")
+
+        self._loop = loop
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or 0.0
+
+    def read(self) -> np.ndarray | None:
+        ok, frame = self._capture.read()
+        if not ok and self._loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._capture.read()
+        return frame if ok else None
+
+    def close(self) -> None:
+        self._capture.release()
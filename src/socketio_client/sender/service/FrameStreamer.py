@@ -0,0 +1,236 @@
+"""
+FrameStreamer - Capture, encode và publish frames lên server
+
+Pipeline:
+    capture task: FrameSource.read() (thread) -> EncoderPool.submit()
+    pump task:    EncoderPool.next_result() -> LatestFrameQueue.put()
+    emit loop:    LatestFrameQueue.get() -> sio.emit("publish") -> chờ transport drain
+
+Event loop chỉ điều phối; capture và encode chạy trong worker, nên
+ping/pong và emit của AsyncClient không bị chặn.
+
+`sio.emit` chỉ đẩy packet vào queue của engineio, nên emit loop chờ queue đó
+drain trước khi lấy frame tiếp theo. Khi network chậm, frame dồn lại ở
+LatestFrameQueue (bounded, bỏ frame cũ nhất) thay vì trong engineio.
+
+Frame được gửi dưới dạng binary attachment trong payload:
+    {"stream": ..., "seq": ..., "ts": ..., "codec": ..., "data": <bytes>}
+
+Với `trace`, payload có thêm {"trace": {"sent": ...}}: thời điểm emit quy
+đổi sang clock của server (ClockSync), relay ghi thêm timestamps của server.
+
+Với `batcher` (BatchEmitter), các publish events được gộp thành batch packet;
+frame lớn hơn max_bytes của batch vẫn được gửi ngay như event thường.
+
+Với `quality` (QualityController), quality/scale của encoder và frame rate
+capture được cập nhật trước mỗi frame theo feedback của receivers.
+
+Khi mất kết nối (ConnectionSupervisor đang reconnect) pipeline vẫn chạy,
+frames bị bỏ qua thay vì dồn lại và gửi trễ sau khi reconnect.
+"""
+import asyncio
+import time
+
+from socketio import AsyncClient
+from socketio.exceptions import BadNamespaceError
+
+from src.observability.logger import get_logger
+from src.socketio_client.shared.enum.BaseNamespace import Namespace
+from src.socketio_client.sender.enum.SenderEvent import SenderEvent
+from src.socketio_client.sender.service.EncoderPool import EncoderPool
+from src.socketio_client.sender.service.FrameEncoder import FrameEncoder, PillowFrameEncoder
+from src.socketio_client.sender.service.FrameSource import FrameSource
+from src.socketio_client.sender.service.LatestFrameQueue import LatestFrameQueue
+from src.socketio_client.sender.service.QualityController import QualityController
+from src.socketio_client.sender.service.StreamSettings import StreamSettings
+from src.socketio_client.shared.service.BatchEmitter import BatchEmitter
+from src.socketio_client.shared.service.ClockSync import ClockSync
+
+logger = get_logger(__name__)
+
+
+class FrameStreamer:
+    """
+    Stream frames từ một FrameSource lên server theo frame rate mục tiêu.
+    """
+
+    # Sentinel báo capture task đã kết thúc
+    _END = object()
+
+    # Thời gian tối đa (giây) chờ engineio gửi xong packet
+    DRAIN_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        sio: AsyncClient,
+        settings: StreamSettings,
+        namespace: Namespace,
+        frame_queue: LatestFrameQueue,
+        clock: ClockSync | None = None,
+        quality: QualityController | None = None,
+        batcher: BatchEmitter | None = None,
+    ):
+        """
+        Args:
+            sio: SocketIO AsyncClient instance (đã connect)
+            settings: Cấu hình streaming
+            namespace: Namespace để publish
+            frame_queue: Queue giữa encode và emit (thuộc registry)
+            clock: Offset clock với server cho trace header (registry.clock)
+            quality: Adaptive quality controller (registry.quality), None = cố định
+            batcher: Gộp publish events (cùng namespace), None = emit trực tiếp
+        """
+        self._sio = sio
+        self._settings = settings
+        self._namespace = namespace
+        self._queue = frame_queue
+        self._clock = clock if settings.trace else None
+        self._quality = quality
+        self._batcher = batcher
+
+        encoder_class = PillowFrameEncoder if settings.encoder == "pillow" else FrameEncoder
+        self._pool = EncoderPool(
+            encoder_class(settings.codec, settings.quality, settings.scale),
+            mode=settings.pool_mode,
+            workers=settings.pool_workers or None,
+            max_in_flight=settings.max_in_flight or None,
+        )
+
+        self.frames_sent = 0
+        # Frames bỏ qua khi đang reconnect
+        self.frames_dropped = 0
+
+    async def run(self) -> None:
+        """
+        Chạy streaming pipeline cho tới khi source hết frame hoặc task bị cancel
+        """
+        settings = self._settings
+        source = FrameSource.open(
+            settings.source, settings.width, settings.height, settings.fps, settings.loop
+        )
+
+        # Mỗi item báo một frame đã submit, _END khi capture kết thúc
+        submitted: asyncio.Queue = asyncio.Queue()
+        capture_task = asyncio.create_task(self._capture_loop(source, submitted))
+        pump_task = asyncio.create_task(self._pump_loop(submitted))
+
+        try:
+            # _END luôn là item put cuối cùng nên không bao giờ bị drop
+            while (data := await self._queue.get()) is not self._END:
+                # Đang reconnect: bỏ frame, không giữ frame cũ cho lần connect sau
+                if not self._sio.connected:
+                    self.frames_dropped += 1
+                    continue
+                try:
+                    await self._publish(data)
+                except BadNamespaceError:
+                    # Mất kết nối giữa lúc kiểm tra và emit
+                    self.frames_dropped += 1
+                    continue
+                await self._wait_for_transport()
+
+            if self._batcher is not None and self._sio.connected:
+                try:
+                    await self._batcher.flush()
+                except BadNamespaceError:
+                    pass
+
+            # Pump task đã kết thúc (nó put _END). Lỗi encode phải raise trước:
+            # capture task có thể đang chờ semaphore của pool mà không ai
+            # giải phóng nữa, và được cancel trong finally
+            await pump_task
+            # Pump kết thúc bình thường nghĩa là capture cũng đã kết thúc
+            await capture_task
+        finally:
+            capture_task.cancel()
+            pump_task.cancel()
+            source.close()
+            self._pool.close()
+
+    async def _capture_loop(self, source: FrameSource, submitted: asyncio.Queue) -> None:
+        """
+        Capture frames theo frame rate mục tiêu và submit vào encoder pool
+
+        Args:
+            source: Nguồn frame
+            submitted: Queue báo cho emit loop mỗi frame đã submit
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self._settings.fps
+        deadline = loop.time()
+        quality = self._quality
+        encoder = self._pool.encoder
+
+        try:
+            while True:
+                # Capture từ file/camera là blocking I/O
+                frame = await asyncio.to_thread(source.read)
+                if frame is None:
+                    logger.info("Source '%s' ended", self._settings.source)
+                    break
+
+                if quality is not None:
+                    # Encoder đọc quality/scale lúc encode (process pool: lúc pickle khi submit)
+                    encoder.quality, encoder.scale = quality.quality, quality.scale
+                    interval = 1.0 / quality.fps
+
+                # Chờ nếu encoder pool đã đủ max_in_flight
+                await self._pool.submit(frame)
+                submitted.put_nowait(True)
+
+                # Giữ frame rate mục tiêu, không dồn frame khi bị trễ
+                deadline = max(deadline + interval, loop.time())
+                await asyncio.sleep(deadline - loop.time())
+        finally:
+            submitted.put_nowait(self._END)
+
+    async def _pump_loop(self, submitted: asyncio.Queue) -> None:
+        """
+        Chuyển kết quả encode (theo thứ tự) sang LatestFrameQueue
+
+        Args:
+            submitted: Queue báo mỗi frame đã submit vào encoder pool
+        """
+        try:
+            while await submitted.get() is not self._END:
+                self._queue.put(await self._pool.next_result())
+        finally:
+            self._queue.put(self._END)
+
+    async def _wait_for_transport(self) -> None:
+        """
+        Chờ engineio gửi hết các packet đã queue (backpressure từ network)
+        """
+        eio_queue = getattr(self._sio.eio, "queue", None)
+        if eio_queue is None:
+            return
+
+        # Write loop của engineio dừng khi mất kết nối, không chờ mãi
+        try:
+            await asyncio.wait_for(eio_queue.join(), self.DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _publish(self, data: bytes) -> None:
+        """
+        Emit một encoded frame lên server
+
+        Args:
+            data: Encoded frame bytes
+        """
+        now = time.time_ns()
+        payload = {
+            "stream": self._settings.stream_id,
+            "seq": self.frames_sent,
+            "ts": now,
+            "codec": self._settings.codec,
+            "data": data,
+        }
+        if self._clock is not None:
+            payload["trace"] = {"sent": self._clock.to_server(now)}
+
+        if self._batcher is not None:
+            await self._batcher.emit(SenderEvent.PUBLISH.value, payload)
+        else:
+            await self._sio.emit(SenderEvent.PUBLISH.value, payload, namespace=self._namespace.value)
+        self.frames_sent += 1
@@ -0,0 +1,82 @@
+"""
+LatestFrameQueue - Bounded queue giữa capture/encode và emit, frame mới nhất thắng
+
+Khi network/server chậm hơn capture, queue không tăng vô hạn: put() vào queue
+đầy sẽ bỏ frame cũ nhất. Với live video, bỏ frame cũ tốt hơn cộng dồn latency.
+"""
+import asyncio
+from collections import deque
+from typing import Any
+
+
+class LatestFrameQueue:
+    """
+    Drop-oldest bounded queue cho một consumer.
+
+    put() không bao giờ block; get() chờ tới khi có frame.
+    """
+
+    def __init__(self, maxsize: int = 2):
+        """
+        Args:
+            maxsize: Số frame tối đa giữ trong queue
+
+        Raises:
+            ValueError: Nếu maxsize < 1
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize phải >= 1: '{maxsize}'")
+
+        self.maxsize = maxsize
+        self._items: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+        # Counters
+        self.put_count = 0
+        self.dropped = 0
+
+    @property
+    def depth(self) -> int:
+        """Số frame đang chờ emit"""
+        return len(self._items)
+
+    def put(self, item: Any) -> None:
+        """
+        Thêm frame, bỏ frame cũ nhất nếu queue đầy
+
+        Args:
+            item: Frame (hoặc payload) cần emit
+        """
+        if len(self._items) == self.maxsize:
+            self.dropped += 1
+
+        # deque(maxlen) tự bỏ phần tử cũ nhất
+        self._items.append(item)
+        self.put_count += 1
+        self._ready.set()
+
+    async def get(self) -> Any:
+        """
+        Lấy frame cũ nhất còn lại, chờ nếu queue rỗng
+
+        Returns:
+            Frame
+        """
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    def get_stats(self) -> dict:
+        """
+        Snapshot counters của queue
+
+        Returns:
+            Dict gồm depth, maxsize, put_count, dropped
+        """
+        return {
+            "depth": self.depth,
+            "maxsize": self.maxsize,
+            "put_count": self.put_count,
+            "dropped": self.dropped,
+        }
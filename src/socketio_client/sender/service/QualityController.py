@@ -0,0 +1,176 @@
+"""
+QualityController - Điều chỉnh quality, resolution và frame rate theo feedback
+
+Server gửi tổng hợp tình trạng receivers của stream (stream_feedback) sau
+các lần publish, tối đa mỗi RELAY_FEEDBACK_INTERVAL_S giây:
+    {"stream", "receivers", "reporting", "queue", "decode_ms", "drop_rate",
+     "latency_ms", "relay": {"lagging", "depth"}}
+
+Phân loại mỗi feedback:
+- Network nghẽn: relay đang skip frame của receiver (lagging), frame bị bỏ
+  ở LatestFrameQueue của sender, hoặc latency vượt target. Giảm bytes mỗi
+  frame: quality trước, rồi scale, cuối cùng fps.
+- Receiver decode không kịp: drop_rate vượt max_drop_rate. Quality ít ảnh
+  hưởng chi phí decode nên giảm scale trước, rồi fps.
+- Tốt: không có các dấu hiệu trên và latency dưới HEADROOM * target (hoặc
+  không đo latency). Sau `increase_after` feedback tốt liên tiếp tăng lại một
+  bậc theo thứ tự ngược: fps, scale, rồi quality.
+
+Giảm theo tỉ lệ, tăng từng bậc cố định (AIMD) để không dao động. Feedback
+ngay sau một lần giảm phần lớn đo frames trước khi giảm nên bị bỏ qua.
+"""
+from src.observability.logger import get_logger
+from src.socketio_client.sender.service.QualitySettings import QualitySettings
+
+logger = get_logger(__name__)
+
+
+class QualityController:
+    """
+    AIMD controller cho quality/scale/fps của FrameStreamer.
+
+    Usage:
+        controller = QualityController(settings, quality=80, scale=1.0, fps=30.0)
+        controller.on_feedback(data, frame_queue.dropped)
+        encoder.quality, encoder.scale = controller.quality, controller.scale
+    """
+
+    # Hệ số giảm khi nghẽn
+    QUALITY_DECREASE = 0.8
+    SCALE_DECREASE = 0.75
+    FPS_DECREASE = 0.75
+
+    # Bậc tăng khi feedback tốt
+    QUALITY_STEP = 5
+    SCALE_STEP = 0.1
+    FPS_STEP = 2.0
+
+    # Latency dưới HEADROOM * target mới được coi là tốt
+    HEADROOM = 0.7
+
+    def __init__(self, settings: QualitySettings, quality: int, scale: float, fps: float):
+        """
+        Args:
+            settings: Cấu hình adaptive quality
+            quality: Chất lượng encode tối đa (StreamSettings.quality)
+            scale: Tỉ lệ resize tối đa (StreamSettings.scale)
+            fps: Frame rate tối đa (StreamSettings.fps)
+        """
+        self._settings = settings
+        self.max_quality = quality
+        self.max_scale = scale
+        self.max_fps = fps
+
+        self.quality = quality
+        self.scale = scale
+        self.fps = fps
+
+        self._healthy = 0
+        self._cooldown = False
+        # LatestFrameQueue.dropped ở feedback trước
+        self._local_dropped = 0
+
+        # Counters
+        self.feedback = 0
+        self.decreases = 0
+        self.increases = 0
+
+    def on_feedback(self, data: dict, local_dropped: int = 0) -> None:
+        """
+        Điều chỉnh theo một feedback của server
+
+        Args:
+            data: Tổng hợp tình trạng receivers của stream
+            local_dropped: LatestFrameQueue.dropped hiện tại của sender
+        """
+        self.feedback += 1
+        dropped, self._local_dropped = local_dropped - self._local_dropped, local_dropped
+
+        settings = self._settings
+        relay = data.get("relay") if isinstance(data.get("relay"), dict) else {}
+        latency_ms = data.get("latency_ms")
+        drop_rate = data.get("drop_rate") or 0.0
+
+        over_target = isinstance(latency_ms, (int, float)) and latency_ms > settings.target_latency_ms
+        congested = dropped > 0 or (relay.get("lagging") or 0) > 0 or over_target
+        decode_bound = drop_rate > settings.max_drop_rate
+
+        if congested or decode_bound:
+            self._healthy = 0
+            if self._cooldown:
+                self._cooldown = False
+                return
+            changed = self._decrease_decode() if decode_bound and not congested else self._decrease_bytes()
+            if changed:
+                self.decreases += 1
+                self._cooldown = True
+                self._log("Lowering", data)
+            return
+
+        self._cooldown = False
+        if isinstance(latency_ms, (int, float)) and latency_ms > self.HEADROOM * settings.target_latency_ms:
+            # Gần target: giữ nguyên
+            self._healthy = 0
+            return
+
+        self._healthy += 1
+        if self._healthy >= settings.increase_after:
+            self._healthy = 0
+            if self._increase():
+                self.increases += 1
+                self._log("Raising", data)
+
+    def get_stats(self) -> dict:
+        """
+        Mức hiện tại và counters của controller
+
+        Returns:
+            Dict gồm quality, scale, fps, feedback, decreases, increases
+        """
+        return {
+            "quality": self.quality,
+            "scale": self.scale,
+            "fps": self.fps,
+            "feedback": self.feedback,
+            "decreases": self.decreases,
+            "increases": self.increases,
+        }
+
+    def _decrease_bytes(self) -> bool:
+        """Giảm bytes mỗi giây: quality, rồi scale, rồi fps"""
+        settings = self._settings
+        if self.quality > settings.min_quality:
+            self.quality = max(settings.min_quality, int(self.quality * self.QUALITY_DECREASE))
+            return True
+        return self._decrease_decode()
+
+    def _decrease_decode(self) -> bool:
+        """Giảm chi phí decode của receivers: scale, rồi fps"""
+        settings = self._settings
+        if self.scale > settings.min_scale:
+            self.scale = round(max(settings.min_scale, self.scale * self.SCALE_DECREASE), 3)
+            return True
+        if self.fps > settings.min_fps:
+            self.fps = round(max(settings.min_fps, self.fps * self.FPS_DECREASE), 2)
+            return True
+        return False
+
+    def _increase(self) -> bool:
+        """Tăng một bậc: fps, rồi scale, rồi quality"""
+        if self.fps < self.max_fps:
+            self.fps = min(self.max_fps, self.fps + self.FPS_STEP)
+            return True
+        if self.scale < self.max_scale:
+            self.scale = round(min(self.max_scale, self.scale + self.SCALE_STEP), 3)
+            return True
+        if self.quality < self.max_quality:
+            self.quality = min(self.max_quality, self.quality + self.QUALITY_STEP)
+            return True
+        return False
+
+    def _log(self, action: str, data: dict) -> None:
+        logger.info(
+            "%s stream quality to q=%d scale=%.3f fps=%.1f (latency=%s ms, drop_rate=%s, lagging=%s)",
+            action, self.quality, self.scale, self.fps,
+            data.get("latency_ms"), data.get("drop_rate"), (data.get("relay") or {}).get("lagging"),
+        )
@@ -0,0 +1,70 @@
+"""
+QualitySettings - Cấu hình adaptive quality cho Sender Client
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class QualitySettings:
+    """
+    Immutable dataclass chứa cấu hình adaptive quality.
+
+    Quality, scale và fps cấu hình trong StreamSettings là mức tối đa;
+    controller chỉ hạ xuống tới các mức tối thiểu dưới đây.
+
+    Attributes:
+        enabled: Điều chỉnh quality/scale/fps theo feedback của receivers
+        target_latency_ms: End-to-end latency mục tiêu (cần SENDER_TRACE)
+        min_quality: Chất lượng encode tối thiểu (1-100)
+        min_scale: Tỉ lệ resize tối thiểu
+        min_fps: Frame rate tối thiểu
+        max_drop_rate: Tỉ lệ frame bị bỏ ở receiver tối đa trước khi giảm tải decode
+        increase_after: Số feedback tốt liên tiếp trước khi tăng lại một bậc
+    """
+    enabled: bool = False
+    target_latency_ms: float = 200.0
+    min_quality: int = 30
+    min_scale: float = 0.25
+    min_fps: float = 5.0
+    max_drop_rate: float = 0.05
+    increase_after: int = 3
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.target_latency_ms <= 0:
+            raise ConfigInvalidValueError(f"target_latency_ms must be positive: '{self.target_latency_ms}'")
+        if not 1 <= self.min_quality <= 100:
+            raise ConfigInvalidValueError(f"min_quality must be in [1, 100]: '{self.min_quality}'")
+        if not 0 < self.min_scale <= 1.0:
+            raise ConfigInvalidValueError(f"min_scale must be in (0, 1]: '{self.min_scale}'")
+        if self.min_fps <= 0:
+            raise ConfigInvalidValueError(f"min_fps must be positive: '{self.min_fps}'")
+        if not 0 <= self.max_drop_rate < 1.0:
+            raise ConfigInvalidValueError(f"max_drop_rate must be in [0, 1): '{self.max_drop_rate}'")
+        if self.increase_after < 1:
+            raise ConfigInvalidValueError(f"increase_after must be positive: '{self.increase_after}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "QualitySettings":
+        """
+        Tạo QualitySettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            QualitySettings instance
+        """
+        return cls(
+            enabled=config.get_bool("SENDER_ADAPTIVE", cls.enabled),
+            target_latency_ms=config.get_float("SENDER_TARGET_LATENCY_MS", cls.target_latency_ms),
+            min_quality=config.get_int("SENDER_MIN_QUALITY", cls.min_quality),
+            min_scale=config.get_float("SENDER_MIN_SCALE", cls.min_scale),
+            min_fps=config.get_float("SENDER_MIN_FPS", cls.min_fps),
+            max_drop_rate=config.get_float("SENDER_MAX_DROP_RATE", cls.max_drop_rate),
+            increase_after=config.get_int("SENDER_ADAPTIVE_INCREASE_AFTER", cls.increase_after),
+        )
@@ -0,0 +1,97 @@
+"""
+StreamSettings - Cấu hình frame streaming cho Sender Client
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class StreamSettings:
+    """
+    Immutable dataclass chứa cấu hình frame streaming.
+
+    Attributes:
+        stream_id: ID của stream mà sender publish
+        source: "synthetic", đường dẫn video file, hoặc camera index ("0")
+        codec: "jpeg" hoặc "webp"
+        quality: Chất lượng encode (1-100)
+        fps: Frame rate mục tiêu
+        width: Chiều rộng frame (synthetic source)
+        height: Chiều cao frame (synthetic source)
+        loop: Phát lại video file khi hết
+        scale: Tỉ lệ resize trước khi encode
+        encoder: "opencv" hoặc "pillow"
+        pool_mode: "thread" hoặc "process" cho encoder pool
+        pool_workers: Số worker của encoder pool (0 = số CPU)
+        max_in_flight: Số frame encode đồng thời tối đa (0 = 2 * workers)
+        queue_size: Số encoded frame tối đa chờ emit (frame cũ nhất bị bỏ)
+        trace: Gửi kèm trace header để receiver đo latency theo từng hop
+    """
+    stream_id: str = "default"
+    source: str = "synthetic"
+    codec: str = "jpeg"
+    quality: int = 80
+    fps: float = 30.0
+    width: int = 640
+    height: int = 480
+    loop: bool = True
+    scale: float = 1.0
+    encoder: str = "opencv"
+    pool_mode: str = "thread"
+    pool_workers: int = 0
+    max_in_flight: int = 0
+    queue_size: int = 2
+    trace: bool = False
+
+    CODECS = ("jpeg", "webp")
+    ENCODERS = ("opencv", "pillow")
+    POOL_MODES = ("thread", "process")
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.codec not in self.CODECS:
+            raise ConfigInvalidValueError(f"codec must be one of {self.CODECS}: '{self.codec}'")
+        if not 1 <= self.quality <= 100:
+            raise ConfigInvalidValueError(f"quality must be in [1, 100]: '{self.quality}'")
+        if self.fps <= 0:
+            raise ConfigInvalidValueError(f"fps must be positive: '{self.fps}'")
+        if not 0 < self.scale <= 1.0:
+            raise ConfigInvalidValueError(f"scale must be in (0, 1]: '{self.scale}'")
+        if self.encoder not in self.ENCODERS:
+            raise ConfigInvalidValueError(f"encoder must be one of {self.ENCODERS}: '{self.encoder}'")
+        if self.pool_mode not in self.POOL_MODES:
+            raise ConfigInvalidValueError(f"pool_mode must be one of {self.POOL_MODES}: '{self.pool_mode}'")
+        if self.queue_size < 1:
+            raise ConfigInvalidValueError(f"queue_size must be positive: '{self.queue_size}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "StreamSettings":
+        """
+        Tạo StreamSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            StreamSettings instance
+        """
+        return cls(
+            stream_id=config.get_config("SENDER_STREAM_ID", cls.stream_id),
+            source=config.get_config("SENDER_SOURCE", cls.source),
+            codec=config.get_config("SENDER_CODEC", cls.codec).lower(),
+            quality=config.get_int("SENDER_QUALITY", cls.quality),
+            fps=config.get_float("SENDER_FPS", cls.fps),
+            width=config.get_int("SENDER_WIDTH", cls.width),
+            height=config.get_int("SENDER_HEIGHT", cls.height),
+            loop=config.get_bool("SENDER_LOOP", cls.loop),
+            scale=config.get_float("SENDER_SCALE", cls.scale),
+            encoder=config.get_config("SENDER_ENCODER", cls.encoder).lower(),
+            pool_mode=config.get_config("SENDER_ENCODER_POOL", cls.pool_mode).lower(),
+            pool_workers=config.get_int("SENDER_ENCODER_WORKERS", cls.pool_workers),
+            max_in_flight=config.get_int("SENDER_ENCODER_MAX_IN_FLIGHT", cls.max_in_flight),
+            queue_size=config.get_int("SENDER_QUEUE_SIZE", cls.queue_size),
+            trace=config.get_bool("SENDER_TRACE", cls.trace),
+        )
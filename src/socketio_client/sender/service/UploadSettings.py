@@ -0,0 +1,43 @@
+"""
+UploadSettings - Cấu hình chunked upload cho Sender Client
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class UploadSettings:
+    """
+    Immutable dataclass chứa cấu hình chunked upload.
+
+    Attributes:
+        chunk_size: Kích thước mỗi chunk (phải <= TRANSFER_MAX_CHUNK_SIZE của
+                    server và nhỏ hơn max_http_buffer_size)
+        window: Số chunks tối đa đã gửi nhưng chưa được server ack
+    """
+    chunk_size: int = 256 * 1024
+    window: int = 4
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.chunk_size < 1 or self.window < 1:
+            raise ConfigInvalidValueError("chunk_size and window must be positive")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "UploadSettings":
+        """
+        Tạo UploadSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            UploadSettings instance
+        """
+        return cls(
+            chunk_size=config.get_int("SENDER_CHUNK_SIZE", cls.chunk_size),
+            window=config.get_int("SENDER_CHUNK_WINDOW", cls.window),
+        )
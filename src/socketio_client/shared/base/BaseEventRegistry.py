@@ -6,14 +6,26 @@ Trách nhiệm:
 - Đăng ký handlers với SocketIO AsyncClient
 - Tạo wrapper để execute handlers
 - Error handling và logging
+- Đo latency của handlers, phát hiện handler chậm
 """
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
 from socketio import AsyncClient
 
+from src.config import config
+from src.observability import metrics
+from src.observability.latency import SlowCallDetector
+from src.observability.logger import EventSampler, get_logger
 from src.socketio_client.shared.interface.IEventHandler import IEventHandler
+from src.socketio_client.shared.service.ClockSync import ClockSync
 from src.socketio_client.shared.enum.BaseEvent import SocketEvent, BaseEvents
 from src.socketio_client.shared.enum.BaseNamespace import Namespace
 
+logger = get_logger(__name__)
+
 
 class BaseEventRegistry(ABC):
     """
@@ -34,6 +46,9 @@ class BaseEventRegistry(ABC):
         registry = ChatEventRegistry(sio)
     """
 
+    # Role gửi trong auth payload khi connect (server index sessions theo role)
+    ROLE: str | None = None
+
     def __init__(self, sio: AsyncClient):
         """
         Initialize EventRegistry
@@ -43,10 +58,26 @@ class BaseEventRegistry(ABC):
         """
         # Storage: key = (namespace, event_name), value = handler instance
         self._handlers: dict[tuple[str, str], IEventHandler] = {}
+        # Wrapper đã đăng ký với SocketIO, cùng key với _handlers
+        self._wrappers: dict[tuple[str, str], Callable[..., Awaitable]] = {}
         self._sio = sio
 
         # Session ID từ server (được set bởi ConnectionConfirmedHandler)
         self.session_id: str | None = None
+        # Session cũ mà server đã resume cho connection hiện tại (None nếu không resume)
+        self.resumed_from: str | None = None
+        # Set khi nhận CONNECTION_CONFIRMED, ConnectionSupervisor clear trước mỗi lần connect
+        self.session_confirmed = asyncio.Event()
+        # Offset clock server - client, đo lại ở mỗi lần connect
+        self.clock = ClockSync()
+
+        # Sampling cho debug log trên hot path
+        self._log_sampler = EventSampler()
+
+        # Báo handlers chặn event loop lâu hơn HANDLER_SLOW_THRESHOLD_MS
+        self._slow_calls = SlowCallDetector(
+            logger, config.get_float("HANDLER_SLOW_THRESHOLD_MS", 50.0)
+        )
 
         # Get handlers from subclass implementation
         handlers = self._create_handlers()
@@ -103,15 +134,30 @@ class BaseEventRegistry(ABC):
         # Store handler
         self._handlers[key] = handler
 
-        print(
-            f"Registered handler: {handler.__class__.__name__} "
-            f"for {handler.namespace.value}:{handler.event.value}"
+        logger.debug(
+            "Registered handler: %s for %s:%s",
+            handler.__class__.__name__, handler.namespace.value, handler.event.value,
         )
 
         # Nếu SocketIO đã attach, đăng ký handler luôn
         if self._sio is not None:
             self._register_with_socketio(handler)
 
+    # ----------
+    # Public API: Connect
+    # ----------
+
+    def get_auth(self) -> dict:
+        """
+        Auth payload gửi khi connect, server xác thực một lần cho cả connection
+
+        Subclass override để khai báo thêm (ví dụ streams).
+
+        Returns:
+            Dict auth payload (rỗng nếu registry không có ROLE)
+        """
+        return {"role": self.ROLE} if self.ROLE else {}
+
     # ----------
     # Public API: Lookup
     # ----------
@@ -148,6 +194,43 @@ class BaseEventRegistry(ABC):
         """
         return list(self._handlers.values())
 
+    # ----------
+    # Public API: Dispatch
+    # ----------
+
+    async def dispatch(self, namespace: str, event: str, data=None) -> bool:
+        """
+        Chạy handler của một event như khi nhận từ SocketIO
+
+        Dùng cho events được unpack từ batch: đi qua cùng wrapper nên
+        latency và error handling giống event nhận trực tiếp.
+
+        Args:
+            namespace: Namespace của event
+            event: Tên event
+            data: Event data
+
+        Returns:
+            False nếu không có handler cho event
+        """
+        wrapper = self._wrappers.get((namespace, event))
+        if wrapper is None:
+            return False
+        await wrapper(data)
+        return True
+
+    def get_latency_stats(self) -> dict[str, dict]:
+        """
+        Lấy latency percentiles của từng handler đã đăng ký
+
+        Returns:
+            Dict "namespace:event" -> snapshot (count, mean, p50, p90, p99, p999, max tính bằng ms)
+        """
+        return {
+            f"{namespace}:{event}": metrics.HANDLER_DURATION.labels(namespace, event).snapshot()
+            for namespace, event in self._handlers
+        }
+
     # ----------
     # Internal: SocketIO Registration
     # ----------
@@ -164,6 +247,7 @@ class BaseEventRegistry(ABC):
 
         # Tạo wrapper function
         wrapper = self._create_wrapper(handler)
+        self._wrappers[(handler.namespace.value, handler.event.value)] = wrapper
 
         # Register với SocketIO
         if handler.namespace.value == "/":
@@ -171,7 +255,7 @@ class BaseEventRegistry(ABC):
         else:
             self._sio.on(handler.event.value, namespace=handler.namespace.value)(wrapper)
 
-        print(f"Registered with SocketIO: {handler.namespace.value}:{handler.event.value}")
+        logger.debug("Registered with SocketIO: %s:%s", handler.namespace.value, handler.event.value)
 
     def _create_wrapper(self, handler: IEventHandler):
         """
@@ -184,6 +268,17 @@ class BaseEventRegistry(ABC):
             Async wrapper function
         """
 
+        key = (handler.namespace.value, handler.event.value)
+
+        # Resolve metric children một lần, không lookup trên hot path
+        duration = metrics.HANDLER_DURATION.labels(*key)
+        errors = metrics.HANDLER_ERRORS.labels(*key)
+        slow = metrics.SLOW_HANDLERS.labels(*key)
+        slow_calls = self._slow_calls
+        # Duration của batch là tổng duration các events bên trong, vốn đã được
+        # ghi qua dispatch(); ghi thêm sẽ đếm hai lần
+        record_duration = handler.event != BaseEvents.BATCH
+
         async def wrapper(data: dict = {}):
             """
             Wrapper function nhận event từ SocketIO
@@ -191,11 +286,10 @@ class BaseEventRegistry(ABC):
             Args:
                 data: Event data (optional)
             """
+            start = time.monotonic_ns()
             try:
-                print(
-                    f"Handling {handler.event.value} "
-                    f"in {handler.namespace.value}"
-                )
+                if logger.isEnabledFor(logging.DEBUG) and self._log_sampler.should_log(key):
+                    logger.debug("Handling %s in %s", key[1], key[0])
 
                 # Execute handler với session_id hiện tại
                 result = await handler.handle(self._sio, self.session_id, data)
@@ -203,10 +297,15 @@ class BaseEventRegistry(ABC):
                 # CHỈ update session_id nếu handler là CONNECTION_CONFIRMED
                 if handler.event == BaseEvents.CONNECTION_CONFIRMED and result is not None:
                     self.session_id = result
-                    print(f"[Registry] Session ID updated: {result}")
+                    self.resumed_from = data.get("resumed_from") if isinstance(data, dict) else None
+                    if isinstance(data, dict):
+                        self.clock.on_confirmed(data.get("clock"))
+                    self.session_confirmed.set()
+                    logger.info("Session ID updated: %s", result)
 
             except Exception as e:
-                print(f"Error in handler {handler.__class__.__name__}: {e}")
+                errors.inc()
+                logger.exception("Error in handler %s: %s", handler.__class__.__name__, e)
                 # Emit error event to server (optional)
                 await self._sio.emit(
                     "client_error",
@@ -215,4 +314,12 @@ class BaseEventRegistry(ABC):
                 )
                 raise
 
+            finally:
+                elapsed = time.monotonic_ns() - start
+                if record_duration:
+                    duration.record(elapsed)
+                    if elapsed > slow_calls.threshold_ns:
+                        slow.inc()
+                        slow_calls.report(key, elapsed)
+
         return wrapper
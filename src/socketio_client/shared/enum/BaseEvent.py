@@ -48,3 +48,6 @@ class BaseEvents:
     CONNECTION_CONFIRMED = SocketEvent("connection_confirmed")
 
     DISCONNECT = SocketEvent("disconnect")
+
+    # Nhiều events gộp trong một packet: {"events": [[event, data], ...]}
+    BATCH = SocketEvent("batch")
@@ -0,0 +1,148 @@
+"""
+BatchEmitter - Gộp nhiều events nhỏ của client thành một batch packet
+
+Mỗi `sio.emit` là một Socket.IO packet với framing và websocket frame riêng.
+BatchEmitter giữ events của một namespace trong một cửa sổ ngắn và gửi chúng
+thành một event `batch` duy nhất khi đủ số lượng, đủ kích thước hoặc hết
+thời gian chờ. Server unpack và dispatch từng event theo đúng thứ tự.
+
+Sender bật batching qua BatchSettings (CLIENT_BATCH_ENABLED); FrameStreamer
+khi đó publish frames qua emitter thay vì `sio.emit` trực tiếp.
+
+Usage:
+    batcher = BatchEmitter(sio, SenderNamespace.ROOT, max_delay_ms=5.0)
+    await batcher.emit("telemetry", {"cpu": 0.3})
+    ...
+    await batcher.close()
+"""
+import asyncio
+
+from socketio import AsyncClient
+
+from src.observability.logger import get_logger
+from src.observability.metrics import payload_size
+from src.socketio_client.shared.enum.BaseEvent import BaseEvents
+from src.socketio_client.shared.enum.BaseNamespace import Namespace
+
+logger = get_logger(__name__)
+
+
+class BatchEmitter:
+    """
+    Time/size-bounded batching emitter cho một namespace.
+
+    Thứ tự events được giữ nguyên. Batch chỉ có một event được gửi như event
+    thường, nên server không cần unpack.
+    """
+
+    def __init__(
+        self,
+        sio: AsyncClient,
+        namespace: Namespace,
+        max_items: int = 64,
+        max_bytes: int = 64 * 1024,
+        max_delay_ms: float = 5.0,
+    ):
+        """
+        Args:
+            sio: SocketIO AsyncClient instance
+            namespace: Namespace của các events
+            max_items: Số events tối đa trong một batch
+            max_bytes: Kích thước payload ước lượng tối đa của một batch
+            max_delay_ms: Thời gian tối đa một event chờ trong batch
+
+        Raises:
+            ValueError: Nếu giới hạn không hợp lệ
+        """
+        if max_items < 1 or max_bytes < 1 or max_delay_ms < 0:
+            raise ValueError("max_items, max_bytes phải > 0 và max_delay_ms phải >= 0")
+
+        self._sio = sio
+        self._namespace = namespace.value
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._max_delay = max_delay_ms / 1000.0
+
+        self._pending: list[list] = []
+        self._pending_bytes = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Counters
+        self.events_sent = 0
+        self.packets_sent = 0
+
+    @property
+    def pending(self) -> int:
+        """Số events đang chờ trong batch"""
+        return len(self._pending)
+
+    async def emit(self, event: str, data=None) -> None:
+        """
+        Thêm một event vào batch, flush ngay nếu batch đầy
+
+        Args:
+            event: Tên event
+            data: Event data
+        """
+        self._pending.append([event, data])
+        self._pending_bytes += payload_size(data)
+
+        if len(self._pending) >= self.max_items or self._pending_bytes >= self.max_bytes:
+            await self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self._max_delay, self._flush_later)
+
+    async def flush(self) -> None:
+        """Gửi các events đang chờ (nếu có)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            batch = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+
+            if len(batch) == 1:
+                event, data = batch[0]
+                await self._sio.emit(event, data, namespace=self._namespace)
+            else:
+                await self._sio.emit(
+                    BaseEvents.BATCH.value, {"events": batch}, namespace=self._namespace
+                )
+            self.events_sent += len(batch)
+            self.packets_sent += 1
+
+    async def close(self) -> None:
+        """Flush batch cuối cùng và dừng timer"""
+        await self.flush()
+
+    def get_stats(self) -> dict:
+        """
+        Counters của emitter
+
+        Returns:
+            Dict gồm pending, events_sent, packets_sent, events_per_packet
+        """
+        return {
+            "pending": self.pending,
+            "events_sent": self.events_sent,
+            "packets_sent": self.packets_sent,
+            "events_per_packet": self.events_sent / self.packets_sent if self.packets_sent else 0.0,
+        }
+
+    def _flush_later(self) -> None:
+        """Timer callback: flush trong task riêng"""
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        task.add_done_callback(self._log_flush_error)
+
+    @staticmethod
+    def _log_flush_error(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Batch flush failed: %s", task.exception())
@@ -0,0 +1,52 @@
+"""
+BatchSettings - Cấu hình gộp events của client (BatchEmitter)
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """
+    Immutable dataclass chứa cấu hình client batching.
+
+    Attributes:
+        enabled: Gộp các publish events của sender qua BatchEmitter
+        max_items: Số events tối đa trong một batch
+        max_bytes: Kích thước payload ước lượng tối đa của một batch
+        max_delay_ms: Thời gian tối đa một event chờ trong batch
+    """
+    enabled: bool = False
+    max_items: int = 64
+    max_bytes: int = 64 * 1024
+    max_delay_ms: float = 5.0
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.max_items < 1:
+            raise ConfigInvalidValueError(f"max_items must be positive: '{self.max_items}'")
+        if self.max_bytes < 1:
+            raise ConfigInvalidValueError(f"max_bytes must be positive: '{self.max_bytes}'")
+        if self.max_delay_ms < 0:
+            raise ConfigInvalidValueError(f"max_delay_ms must not be negative: '{self.max_delay_ms}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "BatchSettings":
+        """
+        Tạo BatchSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            BatchSettings instance
+        """
+        return cls(
+            enabled=config.get_bool("CLIENT_BATCH_ENABLED", cls.enabled),
+            max_items=config.get_int("CLIENT_BATCH_MAX_ITEMS", cls.max_items),
+            max_bytes=config.get_int("CLIENT_BATCH_MAX_BYTES", cls.max_bytes),
+            max_delay_ms=config.get_float("CLIENT_BATCH_MAX_DELAY_MS", cls.max_delay_ms),
+        )
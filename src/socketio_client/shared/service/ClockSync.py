@@ -0,0 +1,101 @@
+"""
+ClockSync - Ước lượng độ lệch wall clock giữa client và server
+
+Một lần đo (kiểu NTP) đi kèm handshake sẵn có, không thêm event:
+    client gửi t0 trong auth payload của CONNECT packet
+    server ghi t1 khi nhận connect, t2 ngay trước khi emit CONNECTION_CONFIRMED
+    client ghi t3 khi nhận CONNECTION_CONFIRMED
+
+    rtt    = (t3 - t0) - (t2 - t1)
+    offset = ((t1 - t0) + (t2 - t3)) / 2     (server clock - client clock)
+
+Sai số của offset tối đa rtt / 2, nên estimator giữ vài lần đo gần nhất
+(mỗi lần connect/reconnect một lần) và dùng lần có rtt nhỏ nhất.
+
+Usage:
+    auth = {..., "clock": clock.stamp()}       # ngay trước khi gửi CONNECT
+    clock.on_confirmed(data["clock"])          # khi nhận CONNECTION_CONFIRMED
+    server_ns = clock.to_server(time.time_ns())
+"""
+import time
+from collections import deque
+
+
+class ClockSync:
+    """
+    Offset server - client (nanoseconds) từ các lần đo lúc connect.
+    """
+
+    def __init__(self, max_samples: int = 8):
+        """
+        Args:
+            max_samples: Số lần đo gần nhất được giữ
+        """
+        # (rtt_ns, offset_ns)
+        self._samples: deque[tuple[int, int]] = deque(maxlen=max_samples)
+        self._pending_t0: int | None = None
+        self.offset_ns = 0
+        self.rtt_ns: int | None = None
+
+    @property
+    def synced(self) -> bool:
+        """Đã có ít nhất một lần đo"""
+        return self.rtt_ns is not None
+
+    def stamp(self) -> dict:
+        """
+        Bắt đầu một lần đo
+
+        Returns:
+            {"t0": <client wall clock ns>} để gửi trong auth payload
+        """
+        self._pending_t0 = time.time_ns()
+        return {"t0": self._pending_t0}
+
+    def on_confirmed(self, clock) -> bool:
+        """
+        Hoàn tất lần đo với timestamps server gửi về
+
+        Args:
+            clock: {"t0": ..., "t1": ..., "t2": ...} từ CONNECTION_CONFIRMED
+
+        Returns:
+            False nếu data không hợp lệ hoặc không khớp lần đo đang chờ
+        """
+        t3 = time.time_ns()
+        if not isinstance(clock, dict):
+            return False
+        t0, t1, t2 = clock.get("t0"), clock.get("t1"), clock.get("t2")
+        if t0 != self._pending_t0 or not isinstance(t1, int) or not isinstance(t2, int):
+            return False
+        self._pending_t0 = None
+
+        rtt = (t3 - t0) - (t2 - t1)
+        self._samples.append((max(rtt, 0), ((t1 - t0) + (t2 - t3)) // 2))
+        self.rtt_ns, self.offset_ns = min(self._samples)
+        return True
+
+    def to_server(self, local_ns: int) -> int:
+        """
+        Quy đổi timestamp của client sang clock của server
+
+        Args:
+            local_ns: time.time_ns() của client
+
+        Returns:
+            Timestamp tương ứng theo clock của server
+        """
+        return local_ns + self.offset_ns
+
+    def get_stats(self) -> dict:
+        """
+        Kết quả ước lượng hiện tại
+
+        Returns:
+            Dict gồm offset_ms, rtt_ms (None nếu chưa đo), samples
+        """
+        return {
+            "offset_ms": self.offset_ns / 1e6,
+            "rtt_ms": self.rtt_ns / 1e6 if self.rtt_ns is not None else None,
+            "samples": len(self._samples),
+        }
@@ -0,0 +1,171 @@
+"""
+ConnectionSupervisor - Giữ kết nối của client: connect, resume session, reconnect
+
+Vòng lặp:
+    connect (auth={"role", "token", "streams", "session_id": <session cũ>, "clock": {"t0"}})
+    -> chờ CONNECTION_CONFIRMED
+    -> on_connected(resumed) -> chờ tới khi mất kết nối -> backoff -> lặp lại
+
+Reconnect tích hợp của python-socketio bị tắt (reconnection=False) để
+supervisor quản lý backoff và session resumption. Mọi lần reconnect, kể cả
+lần đầu ngay sau khi mất kết nối, đều chờ một delay có jitter.
+
+`stop()` disconnect rồi để `run()` tự trả về. Không cancel task đang chờ
+trong `sio.wait()`: cancel lan sang read loop của engineio, và
+`sio.disconnect()` sau đó raise CancelledError.
+
+Usage:
+    sio = AsyncClient(reconnection=False, ...)
+    supervisor = ConnectionSupervisor(sio, registry, transport, ReconnectPolicy.from_config(config))
+    task = asyncio.create_task(supervisor.run(on_connected))
+    ...
+    await supervisor.stop()
+    await task
+"""
+import asyncio
+from typing import Awaitable, Callable
+
+from socketio import AsyncClient
+from socketio.exceptions import ConnectionError as SocketIOConnectionError
+
+from src.observability.logger import get_logger
+from src.socketio_client.shared.base.BaseEventRegistry import BaseEventRegistry
+from src.socketio_client.shared.service.ReconnectPolicy import ReconnectPolicy
+from src.transport import TransportSettings
+
+logger = get_logger(__name__)
+
+
+class ConnectionSupervisor:
+    """
+    Supervised connection loop cho một AsyncClient.
+    """
+
+    def __init__(
+        self,
+        sio: AsyncClient,
+        registry: BaseEventRegistry,
+        transport: TransportSettings,
+        policy: ReconnectPolicy,
+        auth: dict | None = None,
+    ):
+        """
+        Args:
+            sio: SocketIO AsyncClient instance (reconnection=False)
+            registry: Registry của client, giữ session_id giữa các lần connect
+            transport: URL và transports để connect
+            policy: Backoff policy
+            auth: Thêm vào auth payload của registry (ví dụ token, streams)
+        """
+        self._sio = sio
+        self._registry = registry
+        self._transport = transport
+        self._policy = policy
+        self._auth = auth or {}
+        # Session ID trước lần connect hiện tại (CONNECTION_CONFIRMED có thể
+        # tới và ghi đè registry.session_id trước khi connect() trả về)
+        self._previous_sid: str | None = None
+        # Set bởi stop(): không reconnect nữa
+        self._stopped = asyncio.Event()
+
+        # Counters
+        self.connects = 0
+        self.resumes = 0
+
+    async def run(self, on_connected: Callable[[bool], Awaitable[None]] | None = None) -> None:
+        """
+        Connect và reconnect cho tới khi stop() (hoặc bị cancel)
+
+        Args:
+            on_connected: Callback sau mỗi lần connect, nhận True nếu server
+                          đã resume session cũ
+
+        Raises:
+            SocketIOConnectionError: Nếu vượt max_attempts lần thử liên tiếp
+        """
+        attempt = 0
+        stopped = self._stopped
+        while not stopped.is_set():
+            if self._sio.connected or await self._connect():
+                if stopped.is_set():
+                    # stop() trong lúc đang connect
+                    await self._sio.disconnect()
+                    return
+                attempt = 0
+                resumed = await self._confirm()
+                if on_connected is not None:
+                    await on_connected(resumed)
+
+                # Trả về khi mất kết nối (reconnection=False) hoặc khi stop()
+                await self._sio.wait()
+                if stopped.is_set():
+                    return
+                logger.warning("Connection lost, reconnecting")
+            else:
+                attempt += 1
+                if self._policy.max_attempts and attempt >= self._policy.max_attempts:
+                    raise SocketIOConnectionError(f"Giving up after {attempt} connection attempts")
+
+            delay = self._policy.delay(attempt)
+            logger.info("Reconnecting in %.2fs (attempt %d)", delay, attempt + 1)
+            try:
+                await asyncio.wait_for(stopped.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        """
+        Dừng supervisor: disconnect và không reconnect nữa, run() trả về
+        """
+        self._stopped.set()
+        await self._sio.disconnect()
+
+    async def _connect(self) -> bool:
+        """
+        Một lần connect, gửi session ID cũ để server resume
+
+        Returns:
+            True nếu connect thành công
+        """
+        registry = self._registry
+        registry.session_confirmed.clear()
+        self._previous_sid = registry.session_id
+        auth = {**registry.get_auth(), **self._auth}
+        if self._previous_sid:
+            auth["session_id"] = self._previous_sid
+
+        try:
+            await self._sio.connect(
+                self._transport.url,
+                namespaces=['/'],
+                transports=list(self._transport.transports),
+                # Callable: t0 của ClockSync lấy đúng lúc gửi CONNECT packet,
+                # sau engineio handshake
+                auth=lambda: {**auth, "clock": registry.clock.stamp()},
+            )
+        except SocketIOConnectionError as e:
+            logger.warning("Connect to %s failed: %s", self._transport.url, e)
+            return False
+
+        self.connects += 1
+        return True
+
+    async def _confirm(self) -> bool:
+        """
+        Chờ CONNECTION_CONFIRMED của connection hiện tại
+
+        Returns:
+            True nếu server đã resume session trước đó
+        """
+        registry = self._registry
+        try:
+            await asyncio.wait_for(registry.session_confirmed.wait(), self._policy.confirm_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("No CONNECTION_CONFIRMED within %.1fs", self._policy.confirm_timeout)
+            return False
+
+        previous_sid = self._previous_sid
+        resumed = previous_sid is not None and registry.resumed_from == previous_sid
+        if resumed:
+            self.resumes += 1
+        return resumed
@@ -0,0 +1,69 @@
+"""
+ReconnectPolicy - Cấu hình reconnect của clients (exponential backoff + full jitter)
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+import random
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """
+    Immutable dataclass chứa cấu hình reconnect.
+
+    Delay của lần thử thứ n là random.uniform(0, min(max_delay, base_delay * 2^n))
+    ("full jitter"): khi server restart, hàng nghìn clients reconnect trải đều
+    trên cả cửa sổ thay vì dồn vào cùng thời điểm.
+
+    Attributes:
+        base_delay: Cửa sổ jitter của lần thử đầu tiên (giây)
+        max_delay: Cửa sổ jitter tối đa (giây)
+        max_attempts: Số lần thử liên tiếp tối đa, 0 = không giới hạn
+        confirm_timeout: Thời gian chờ CONNECTION_CONFIRMED sau khi connect (giây)
+    """
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_attempts: int = 0
+    confirm_timeout: float = 5.0
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.base_delay <= 0 or self.max_delay < self.base_delay:
+            raise ConfigInvalidValueError("base_delay must be positive and not exceed max_delay")
+        if self.max_attempts < 0:
+            raise ConfigInvalidValueError(f"max_attempts must not be negative: '{self.max_attempts}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ReconnectPolicy":
+        """
+        Tạo ReconnectPolicy từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            ReconnectPolicy instance
+        """
+        return cls(
+            base_delay=config.get_float("CLIENT_RECONNECT_BASE_DELAY", cls.base_delay),
+            max_delay=config.get_float("CLIENT_RECONNECT_MAX_DELAY", cls.max_delay),
+            max_attempts=config.get_int("CLIENT_RECONNECT_MAX_ATTEMPTS", cls.max_attempts),
+            confirm_timeout=config.get_float("CLIENT_CONFIRM_TIMEOUT", cls.confirm_timeout),
+        )
+
+    def delay(self, attempt: int) -> float:
+        """
+        Delay trước lần thử `attempt` (0 = lần reconnect đầu tiên)
+
+        Args:
+            attempt: Số lần thử thất bại liên tiếp
+
+        Returns:
+            Delay (giây)
+        """
+        # Giới hạn số mũ để không tạo số rất lớn khi mất kết nối lâu
+        window = min(self.max_delay, self.base_delay * (1 << min(attempt, 32)))
+        return random.uniform(0, window)
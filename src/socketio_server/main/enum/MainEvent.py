@@ -14,4 +14,25 @@ class MainEvents(BaseEvents):
     và thêm các events riêng cho chức năng chat.
     """
 
-    pass
\ No newline at end of file
+    # Relay events - receiver đăng ký / hủy đăng ký stream
+    SUBSCRIBE = SocketEvent("subscribe")
+    UNSUBSCRIBE = SocketEvent("unsubscribe")
+
+    # Relay events - sender publish payload, server fan-out tới receivers
+    PUBLISH = SocketEvent("publish")
+    RELAY = SocketEvent("relay")
+
+    # Relay events - receiver reconnect xin lại payload bị lỡ từ một relay_seq
+    REPLAY = SocketEvent("replay")
+
+    # Transfer events - payload lớn được chia chunks, resume được sau reconnect
+    TRANSFER_BEGIN = SocketEvent("transfer_begin")
+    TRANSFER_CHUNK = SocketEvent("transfer_chunk")
+    TRANSFER_ACK = SocketEvent("transfer_ack")
+    TRANSFER_FETCH = SocketEvent("transfer_fetch")
+    TRANSFER_END = SocketEvent("transfer_end")
+    TRANSFER_SYNC = SocketEvent("transfer_sync")
+
+    # Feedback events - receiver report tình trạng, server gửi tổng hợp cho sender
+    FEEDBACK = SocketEvent("feedback")
+    STREAM_FEEDBACK = SocketEvent("stream_feedback")
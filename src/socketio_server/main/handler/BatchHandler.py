@@ -0,0 +1,67 @@
+"""
+BatchHandler - Unpack batch event từ client và dispatch từng event
+
+Client dùng BatchEmitter gộp nhiều events nhỏ thành một packet. Mỗi event
+trong batch được chạy qua registry như event nhận trực tiếp, theo đúng thứ tự.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.base.BaseEventRegistry import BaseEventRegistry
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+
+logger = get_logger(__name__)
+
+
+class BatchHandler(IEventHandler):
+    """Handler xử lý batch event từ client"""
+
+    event = MainEvents.BATCH
+    namespace = MainNamespaces.ROOT
+
+    # Lifecycle events chỉ đến từ SocketIO, client không được gửi trong batch
+    RESERVED_EVENTS = frozenset({
+        MainEvents.BATCH.value,
+        MainEvents.CONNECT.value,
+        MainEvents.DISCONNECT.value,
+    })
+
+    def __init__(self, registry: BaseEventRegistry):
+        """
+        Args:
+            registry: Registry dùng để dispatch các events trong batch
+        """
+        self._registry = registry
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi client gửi một batch
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của client
+            data: {"events": [[event, data], ...]}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        events = data.get("events") if isinstance(data, dict) else None
+        if not isinstance(events, list):
+            logger.warning("Invalid batch payload from %s", sid)
+            return
+
+        namespace = self.namespace.value
+        for item in events:
+            if not isinstance(item, list) or len(item) != 2 or item[0] in self.RESERVED_EVENTS:
+                logger.warning("Invalid batch item from %s", sid)
+                continue
+
+            event, payload = item
+            try:
+                if not await self._registry.dispatch(namespace, event, sid, payload):
+                    logger.warning("No handler for batched event '%s' from %s", event, sid)
+            except Exception:
+                # Wrapper đã log và đếm lỗi; các events còn lại vẫn được xử lý
+                continue
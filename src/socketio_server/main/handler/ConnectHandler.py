@@ -1,13 +1,30 @@
 """
 ConnectHandler - Xử lý khi client connect tới server
 
-Handler cho connect event trên server side
+Handler cho connect event trên server side. Auth payload được xác thực một
+lần ở đây (ConnectAuthorizer); role và quyền publish được cache trong
+Session, receiver được subscribe các streams đã khai báo ngay lúc connect.
+Client reconnect gửi session ID cũ trong auth payload ({"session_id": ...});
+nếu relay còn giữ session đó và session cũ có cùng role và principal (token),
+subscriptions được gắn lại cho sid mới (chỉ các streams sid mới được phép).
+
+Client gửi kèm {"clock": {"t0": ...}} để ước lượng độ lệch clock: handler
+trả lại t0 cùng t1 (lúc nhận connect) và t2 (ngay trước khi emit) trong
+CONNECTION_CONFIRMED (xem ClockSync ở client).
 """
+import time
+
 from socketio import AsyncServer
 
+from src.observability.logger import get_logger
 from src.socketio_server.shared.interface.IEventHandler import IEventHandler
 from src.socketio_server.main.enum.MainEvent import MainEvents
 from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.ConnectAuthorizer import ConnectAuthorizer
+from src.socketio_server.main.service.SessionStore import ROLE_RECEIVER
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
 
 
 class ConnectHandler(IEventHandler):
@@ -16,6 +33,15 @@ class ConnectHandler(IEventHandler):
     event = MainEvents.CONNECT
     namespace = MainNamespaces.ROOT
 
+    def __init__(self, relay: StreamRelay, authorizer: ConnectAuthorizer):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            authorizer: Xác thực auth payload của client
+        """
+        self._relay = relay
+        self._authorizer = authorizer
+
     async def handle(self, sio: AsyncServer, sid: str, data=None):
         """
         Xử lý khi client connect tới server thành công
@@ -23,21 +49,53 @@ class ConnectHandler(IEventHandler):
         Args:
             sio: SocketIO AsyncServer instance
             sid: Socket ID của client
-            data: Optional data từ client
+            data: Auth payload từ client:
+                  {"role": ..., "token": ..., "streams": [...], "session_id": "<sid cũ>",
+                   "clock": {"t0": ...}}
 
         Returns:
             None (fire-and-forget)
+
+        Raises:
+            ConnectionRefusedError: Nếu auth payload không hợp lệ
         """
-        print(f"[Server] Client {sid} connected to {self.namespace.value}")
+        received_ns = time.time_ns()
+        logger.debug("Client %s connected to %s", sid, self.namespace.value)
+
+        auth = data if isinstance(data, dict) else {}
+        grant = self._authorizer.authorize(auth)
+
+        session = self._relay.sessions.add(sid, grant.role)
+        session.publish_streams = grant.publish_streams
+        session.subscribe_streams = grant.subscribe_streams
+        session.principal = grant.principal
+
+        # Resume session cũ nếu client reconnect
+        previous_sid = auth.get("session_id")
+        resumed_from = None
+        if isinstance(previous_sid, str) and previous_sid:
+            streams = await self._relay.resume(sid, previous_sid, session)
+            if streams is not None:
+                resumed_from = session.resumed_from = previous_sid
+                logger.info("Client %s resumed session %s (%d streams)", sid, previous_sid, len(streams))
+
+        # Receiver vào rooms của các streams đã khai báo, không cần subscribe riêng
+        if grant.role == ROLE_RECEIVER:
+            for stream_id in grant.streams:
+                await self._relay.subscribe(sid, stream_id)
 
         # Gửi CONNECTION_CONFIRMED với session ID cho client
+        confirmed = {"sid": sid, "resumed_from": resumed_from}
+        clock = auth.get("clock")
+        if isinstance(clock, dict) and isinstance(clock.get("t0"), int):
+            confirmed["clock"] = {"t0": clock["t0"], "t1": received_ns, "t2": time.time_ns()}
         await sio.emit(
             "connection_confirmed",
-            {"sid": sid},
+            confirmed,
             room=sid,
             namespace=self.namespace.value
         )
-        print(f"[Server] Sent CONNECTION_CONFIRMED to {sid}")
+        logger.debug("Sent CONNECTION_CONFIRMED to %s", sid)
 
         # Optional: Gửi welcome message cho client
         await sio.emit(
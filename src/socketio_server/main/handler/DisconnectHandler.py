@@ -5,9 +5,13 @@ Handler cho disconnect event trên server side
 """
 from socketio import AsyncServer
 
+from src.observability.logger import get_logger
 from src.socketio_server.shared.interface.IEventHandler import IEventHandler
 from src.socketio_server.main.enum.MainEvent import MainEvents
 from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
 
 
 class DisconnectHandler(IEventHandler):
@@ -16,6 +20,13 @@ class DisconnectHandler(IEventHandler):
     event = MainEvents.DISCONNECT
     namespace = MainNamespaces.ROOT
 
+    def __init__(self, relay: StreamRelay):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+        """
+        self._relay = relay
+
     async def handle(self, sio: AsyncServer, sid: str, data=None):
         """
         Xử lý khi client disconnect khỏi server
@@ -28,9 +39,13 @@ class DisconnectHandler(IEventHandler):
         Returns:
             None (fire-and-forget)
         """
-        print(f"[Server] Client {sid} disconnected from {self.namespace.value}")
-
-        # Cleanup nếu cần
-        # - Xóa session
-        # - Notify other clients
-        # - Release resources
+        logger.debug("Client %s disconnected from %s", sid, self.namespace.value)
+
+        # Dọn state của relay (SocketIO tự rời rooms), rồi xóa session
+        self._relay.release(sid)
+        session = self._relay.sessions.remove(sid)
+        if session is not None:
+            logger.debug(
+                "Session %s (%s) closed: %d events, %d published",
+                sid, session.role, session.events_received, session.published,
+            )
@@ -0,0 +1,51 @@
+"""
+FeedbackHandler - Xử lý report tình trạng định kỳ của receiver
+
+Handler cho feedback event trên server side. Report được lưu vào
+FeedbackAggregator của relay và tổng hợp cho sender của các streams mà
+receiver subscribe. Không log mỗi report vì receiver gửi định kỳ.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
+
+
+class FeedbackHandler(IEventHandler):
+    """Handler xử lý feedback event từ receiver"""
+
+    event = MainEvents.FEEDBACK
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+        """
+        self._relay = relay
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver report tình trạng của nó
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"queue": int, "decode_ms": float | None, "drop_rate": float,
+                   "latency_ms": {stream: float}}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        feedback = self._relay.feedback
+        if feedback is None:
+            return
+
+        self._relay.sessions.touch(sid)
+        if not feedback.report(sid, data):
+            logger.warning("Invalid feedback payload from %s: %r", sid, data)
@@ -0,0 +1,54 @@
+"""
+PublishHandler - Xử lý khi sender publish payload lên một stream
+
+Handler cho publish event trên server side. Không log mỗi message vì
+đây là hot path. Quyền publish đã được xác thực lúc connect và cache trong
+session, ở đây chỉ còn một lookup set.
+"""
+from socketio import AsyncServer
+
+from src.observability import metrics
+from src.observability.logger import EventSampler, get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
+
+
+class PublishHandler(IEventHandler):
+    """Handler xử lý publish event từ sender và relay tới receivers"""
+
+    event = MainEvents.PUBLISH
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+        """
+        self._relay = relay
+        # Sender publish sai stream thì mỗi frame đều bị từ chối, chỉ log mẫu
+        self._log_sampler = EventSampler()
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi sender publish payload
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của sender
+            data: {"stream": "<stream_id>", "data": <bytes>, ...}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        stream_id = StreamRelay.parse_stream_id(data)
+        if stream_id is None:
+            return
+
+        if not await self._relay.publish(sid, stream_id, data):
+            metrics.RELAY_PUBLISH_DENIED.inc()
+            if self._log_sampler.should_log(sid):
+                logger.warning("Client %s may not publish stream '%s'", sid, stream_id)
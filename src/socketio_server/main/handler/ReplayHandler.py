@@ -0,0 +1,63 @@
+"""
+ReplayHandler - Xử lý khi receiver reconnect xin lại payload bị lỡ
+
+Handler cho replay event trên server side
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
+
+
+class ReplayHandler(IEventHandler):
+    """Handler xử lý replay event từ receiver"""
+
+    event = MainEvents.REPLAY
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+        """
+        self._relay = relay
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver xin lại các payload có relay_seq > after
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"after": <relay_seq cuối cùng đã nhận>, "epoch": <relay_epoch của seq đó>}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        after = data.get("after") if isinstance(data, dict) else None
+        if not isinstance(after, int) or isinstance(after, bool) or after < 0:
+            logger.warning("Invalid replay payload from %s: %r", sid, data)
+            return
+        epoch = data.get("epoch")
+        if epoch is not None and not isinstance(epoch, str):
+            logger.warning("Invalid replay payload from %s: %r", sid, data)
+            return
+
+        # Tất cả payload bị lỡ đi trong một packet, nên không xen kẽ với
+        # các payload relay sau thời điểm này
+        response = self._relay.replay_since(sid, after, epoch)
+        await sio.emit(
+            self.event.value,
+            response,
+            room=sid,
+            namespace=self.namespace.value,
+        )
+        logger.info(
+            "Replayed %d payloads after seq %d to %s (more=%s, complete=%s)",
+            len(response["items"]), after, sid, response["more"], response["complete"],
+        )
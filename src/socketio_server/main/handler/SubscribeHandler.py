@@ -0,0 +1,61 @@
+"""
+SubscribeHandler - Xử lý khi receiver subscribe một stream
+
+Handler cho subscribe event trên server side. Chỉ session receiver được
+subscribe, trong các streams được cấp lúc connect (ConnectAuthorizer) và
+tối đa `max_streams` streams.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.SessionStore import ROLE_RECEIVER
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
+
+
+class SubscribeHandler(IEventHandler):
+    """Handler xử lý subscribe event từ receiver"""
+
+    event = MainEvents.SUBSCRIBE
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay, max_streams: int):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            max_streams: Số streams tối đa một session được subscribe
+        """
+        self._relay = relay
+        self._max_streams = max_streams
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver muốn nhận payload của một stream
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"stream": "<stream_id>"}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        stream_id = StreamRelay.parse_stream_id(data)
+        if stream_id is None:
+            logger.warning("Invalid subscribe payload from %s: %r", sid, data)
+            return
+
+        session = self._relay.sessions.get(sid)
+        if session is None or session.role != ROLE_RECEIVER or not session.can_subscribe(stream_id):
+            logger.warning("Client %s may not subscribe stream '%s'", sid, stream_id)
+            return
+        if stream_id not in session.streams and len(session.streams) >= self._max_streams:
+            logger.warning("Client %s already subscribes %d streams, ignoring '%s'", sid, len(session.streams), stream_id)
+            return
+
+        await self._relay.subscribe(sid, stream_id)
+        logger.info("Client %s subscribed to stream '%s'", sid, stream_id)
@@ -0,0 +1,90 @@
+"""
+TransferBeginHandler - Xử lý khi sender bắt đầu (hoặc resume) một chunked transfer
+
+Handler cho transfer_begin event trên server side. Transfer mới được báo
+cho receivers của stream; sender luôn nhận lại danh sách chunks còn thiếu
+(toàn bộ với transfer mới, phần chưa nhận với resume), tối đa
+`missing_batch` chunks mỗi ack kèm "more" nếu còn; sender gửi lại
+transfer_begin khi đã gửi hết phần này.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+from src.socketio_server.main.service.TransferStore import TransferStore
+
+logger = get_logger(__name__)
+
+
+class TransferBeginHandler(IEventHandler):
+    """Handler xử lý transfer_begin event từ sender"""
+
+    event = MainEvents.TRANSFER_BEGIN
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay, transfers: TransferStore, missing_batch: int):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            transfers: TransferStore dùng chung của registry
+            missing_batch: Số chunk indices tối đa trong một ack
+        """
+        self._relay = relay
+        self._transfers = transfers
+        self._missing_batch = missing_batch
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi sender bắt đầu hoặc resume transfer
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của sender
+            data: {"id": ..., "stream": ..., "size": ..., "chunk_size": ..., "meta": {...}}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        if not isinstance(data, dict):
+            logger.warning("Invalid transfer_begin payload from %s: %r", sid, data)
+            return
+
+        stream_id = StreamRelay.parse_stream_id(data)
+        session = self._relay.sessions.touch(sid)
+        if stream_id is not None and session is not None and not session.can_publish(stream_id):
+            await self._ack(sio, sid, {"id": data.get("id"), "error": f"may not publish stream '{stream_id}'"})
+            return
+
+        try:
+            transfer, created = self._transfers.begin(
+                sid, data,
+                session.resumed_from if session is not None else None,
+                session.principal if session is not None else None,
+            )
+        except ValueError as e:
+            logger.warning("Rejected transfer from %s: %s", sid, e)
+            await self._ack(sio, sid, {"id": data.get("id"), "error": str(e)})
+            return
+
+        if created:
+            logger.info(
+                "Transfer %s started by %s: %d bytes in %d chunks on '%s'",
+                transfer.id, sid, transfer.size, transfer.chunk_count, transfer.stream,
+            )
+            await self._relay.forward(sid, transfer.stream, MainEvents.TRANSFER_BEGIN, transfer.header())
+        else:
+            logger.info("Transfer %s resumed by %s (%d/%d chunks)", transfer.id, sid, transfer.received, transfer.chunk_count)
+
+        missing = transfer.missing(self._missing_batch + 1)
+        await self._ack(sio, sid, {
+            "id": transfer.id,
+            "missing": missing[:self._missing_batch],
+            "more": len(missing) > self._missing_batch,
+            "complete": transfer.complete,
+        })
+
+    async def _ack(self, sio: AsyncServer, sid: str, data: dict) -> None:
+        await sio.emit(MainEvents.TRANSFER_ACK.value, data, room=sid, namespace=self.namespace.value)
@@ -0,0 +1,89 @@
+"""
+TransferChunkHandler - Xử lý một chunk của chunked transfer từ sender
+
+Handler cho transfer_chunk event trên server side. Chunk được ghi vào spool
+của transfer, forward ngay tới receivers của stream (receiver đang lag bị
+skip và tự lấy lại sau) rồi ack cho sender để sender gửi thêm chunk trong
+window. Khi đủ chunks, receivers nhận transfer_end (cùng header với
+transfer_begin) và lấy lại các chunks còn thiếu nếu có.
+
+Không log mỗi chunk vì đây là hot path.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import EventSampler, get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+from src.socketio_server.main.service.TransferStore import TransferStore
+
+logger = get_logger(__name__)
+
+
+class TransferChunkHandler(IEventHandler):
+    """Handler xử lý transfer_chunk event từ sender"""
+
+    event = MainEvents.TRANSFER_CHUNK
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay, transfers: TransferStore):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            transfers: TransferStore dùng chung của registry
+        """
+        self._relay = relay
+        self._transfers = transfers
+        self._log_sampler = EventSampler()
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi sender gửi một chunk
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của sender
+            data: {"id": ..., "index": <chunk index>, "data": <bytes>}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        if not isinstance(data, dict):
+            return
+        transfer_id, index, chunk = data.get("id"), data.get("index"), data.get("data")
+
+        transfer = self._transfers.get(transfer_id)
+        if transfer is None or transfer.owner != sid:
+            # Transfer hết hạn hoặc sender cũ: sender phải begin lại
+            await self._ack(sio, sid, {"id": transfer_id, "error": "unknown transfer"})
+            return
+
+        self._relay.sessions.touch(sid)
+        try:
+            if not isinstance(index, int) or not isinstance(chunk, (bytes, bytearray)):
+                raise ValueError("index and data are required")
+            written = self._transfers.write(transfer, index, chunk)
+        except ValueError as e:
+            if self._log_sampler.should_log(transfer_id):
+                logger.warning("Invalid chunk of transfer %s from %s: %s", transfer_id, sid, e)
+            await self._ack(sio, sid, {"id": transfer_id, "index": index, "error": str(e)})
+            return
+
+        if written:
+            await self._relay.forward(
+                sid, transfer.stream, MainEvents.TRANSFER_CHUNK,
+                {**transfer.header(), "meta": None, "index": index, "data": chunk},
+                skip_lagging=True,
+            )
+
+        await self._ack(sio, sid, {"id": transfer_id, "index": index, "complete": transfer.complete})
+
+        if written and transfer.complete:
+            logger.info("Transfer %s complete (%d bytes)", transfer_id, transfer.size)
+            await self._relay.forward(
+                sid, transfer.stream, MainEvents.TRANSFER_END, transfer.header()
+            )
+
+    async def _ack(self, sio: AsyncServer, sid: str, data: dict) -> None:
+        await sio.emit(MainEvents.TRANSFER_ACK.value, data, room=sid, namespace=self.namespace.value)
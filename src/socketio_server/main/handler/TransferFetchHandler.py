@@ -0,0 +1,77 @@
+"""
+TransferFetchHandler - Xử lý khi receiver xin lại các chunks bị lỡ
+
+Handler cho transfer_fetch event trên server side. Chunks được đọc từ
+spool của transfer và gửi riêng cho receiver, tối đa `fetch_batch` chunks
+mỗi request; receiver request tiếp khi đã nhận xong batch trước.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+from src.socketio_server.main.service.TransferStore import TransferStore
+
+logger = get_logger(__name__)
+
+
+class TransferFetchHandler(IEventHandler):
+    """Handler xử lý transfer_fetch event từ receiver"""
+
+    event = MainEvents.TRANSFER_FETCH
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay, transfers: TransferStore, fetch_batch: int):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            transfers: TransferStore dùng chung của registry
+            fetch_batch: Số chunks tối đa gửi cho một request
+        """
+        self._relay = relay
+        self._transfers = transfers
+        self._fetch_batch = fetch_batch
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver xin lại chunks của một transfer
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"id": ..., "indices": [<chunk index>, ...]}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        transfer_id = data.get("id") if isinstance(data, dict) else None
+        indices = data.get("indices") if isinstance(data, dict) else None
+        if not isinstance(indices, list):
+            logger.warning("Invalid transfer_fetch payload from %s: %r", sid, data)
+            return
+
+        self._relay.sessions.touch(sid)
+        transfer = self._transfers.get(transfer_id)
+        if transfer is None or transfer.stream not in self._relay.sessions.streams_of(sid):
+            # Receiver bỏ transfer (hết hạn, hoặc không subscribe stream)
+            await sio.emit(
+                MainEvents.TRANSFER_END.value,
+                {"id": transfer_id, "error": "unknown transfer"},
+                room=sid,
+                namespace=self.namespace.value,
+            )
+            return
+
+        header = {**transfer.header(), "meta": None}
+        for index in indices[:self._fetch_batch]:
+            # Chunk chưa nhận từ sender sẽ tới cùng luồng forward bình thường
+            if not isinstance(index, int) or not transfer.has(index):
+                continue
+            await sio.emit(
+                MainEvents.TRANSFER_CHUNK.value,
+                {**header, "index": index, "data": transfer.read(index)},
+                room=sid,
+                namespace=self.namespace.value,
+            )
@@ -0,0 +1,68 @@
+"""
+TransferSyncHandler - Xử lý khi receiver (re)connect hỏi các transfers đã bỏ lỡ
+
+Handler cho transfer_sync event trên server side. Receiver gửi seq của
+transfer cuối cùng nó biết; server gửi lại header của các transfers mới hơn
+trên các streams receiver subscribe (transfer_end nếu đã hoàn tất,
+transfer_begin nếu đang upload), rồi trả về seq hiện tại. Lần connect đầu
+receiver gửi after=None và chỉ nhận seq hiện tại.
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+from src.socketio_server.main.service.TransferStore import TransferStore
+
+logger = get_logger(__name__)
+
+
+class TransferSyncHandler(IEventHandler):
+    """Handler xử lý transfer_sync event từ receiver"""
+
+    event = MainEvents.TRANSFER_SYNC
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay, transfers: TransferStore):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+            transfers: TransferStore dùng chung của registry
+        """
+        self._relay = relay
+        self._transfers = transfers
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver hỏi các transfers sau một seq
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"after": <seq> | None}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        after = data.get("after") if isinstance(data, dict) else None
+        self._relay.sessions.touch(sid)
+
+        if isinstance(after, int) and not isinstance(after, bool):
+            # Seq lớn hơn seq hiện tại: worker đã restart, seq bắt đầu lại
+            if after > self._transfers.last_seq:
+                after = 0
+            transfers = self._transfers.since(after, self._relay.sessions.streams_of(sid))
+            for transfer in transfers:
+                event = MainEvents.TRANSFER_END if transfer.complete else MainEvents.TRANSFER_BEGIN
+                await sio.emit(event.value, transfer.header(), room=sid, namespace=self.namespace.value)
+            if transfers:
+                logger.info("Announced %d transfers after seq %d to %s", len(transfers), after, sid)
+
+        await sio.emit(
+            self.event.value,
+            {"seq": self._transfers.last_seq},
+            room=sid,
+            namespace=self.namespace.value,
+        )
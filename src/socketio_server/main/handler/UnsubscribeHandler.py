@@ -0,0 +1,48 @@
+"""
+UnsubscribeHandler - Xử lý khi receiver hủy subscribe một stream
+
+Handler cho unsubscribe event trên server side
+"""
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+
+logger = get_logger(__name__)
+
+
+class UnsubscribeHandler(IEventHandler):
+    """Handler xử lý unsubscribe event từ receiver"""
+
+    event = MainEvents.UNSUBSCRIBE
+    namespace = MainNamespaces.ROOT
+
+    def __init__(self, relay: StreamRelay):
+        """
+        Args:
+            relay: StreamRelay dùng chung của registry
+        """
+        self._relay = relay
+
+    async def handle(self, sio: AsyncServer, sid: str, data=None):
+        """
+        Xử lý khi receiver không muốn nhận payload của stream nữa
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            sid: Socket ID của receiver
+            data: {"stream": "<stream_id>"}
+
+        Returns:
+            None (fire-and-forget)
+        """
+        stream_id = StreamRelay.parse_stream_id(data)
+        if stream_id is None:
+            logger.warning("Invalid unsubscribe payload from %s: %r", sid, data)
+            return
+
+        await self._relay.unsubscribe(sid, stream_id)
+        logger.info("Client %s unsubscribed from stream '%s'", sid, stream_id)
@@ -4,10 +4,30 @@ MainEventRegistry - Registry cho Main Server
 Kế thừa từ BaseEventRegistry và implement _create_handlers()
 để định nghĩa các handlers riêng cho main server.
 """
+from socketio import AsyncServer
+
 from src.socketio_server.shared.base.BaseEventRegistry import BaseEventRegistry
 from src.socketio_server.shared.interface.IEventHandler import IEventHandler
+from src.socketio_server.main.enum.MainNamespace import MainNamespaces
+from src.socketio_server.main.handler.BatchHandler import BatchHandler
 from src.socketio_server.main.handler.ConnectHandler import ConnectHandler
 from src.socketio_server.main.handler.DisconnectHandler import DisconnectHandler
+from src.socketio_server.main.handler.FeedbackHandler import FeedbackHandler
+from src.socketio_server.main.handler.PublishHandler import PublishHandler
+from src.socketio_server.main.handler.ReplayHandler import ReplayHandler
+from src.socketio_server.main.handler.SubscribeHandler import SubscribeHandler
+from src.socketio_server.main.handler.TransferBeginHandler import TransferBeginHandler
+from src.socketio_server.main.handler.TransferChunkHandler import TransferChunkHandler
+from src.socketio_server.main.handler.TransferFetchHandler import TransferFetchHandler
+from src.socketio_server.main.handler.TransferSyncHandler import TransferSyncHandler
+from src.socketio_server.main.handler.UnsubscribeHandler import UnsubscribeHandler
+from src.socketio_server.main.service.AuthSettings import AuthSettings
+from src.socketio_server.main.service.ConnectAuthorizer import ConnectAuthorizer
+from src.socketio_server.main.service.RelaySettings import RelaySettings
+from src.socketio_server.main.service.SessionStore import SessionStore
+from src.socketio_server.main.service.StreamRelay import StreamRelay
+from src.socketio_server.main.service.TransferSettings import TransferSettings
+from src.socketio_server.main.service.TransferStore import TransferStore
 
 
 class MainEventRegistry(BaseEventRegistry):
@@ -17,6 +37,68 @@ class MainEventRegistry(BaseEventRegistry):
     Kế thừa từ BaseEventRegistry và implement abstract method _create_handlers().
     """
 
+    def __init__(
+        self,
+        sio: AsyncServer,
+        settings: RelaySettings | None = None,
+        auth_settings: AuthSettings | None = None,
+        transfer_settings: TransferSettings | None = None,
+    ):
+        """
+        Initialize MainEventRegistry
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            settings: Cấu hình relay (mặc định nếu None)
+            auth_settings: Cấu hình xác thực connect (mặc định nếu None: không cần token)
+            transfer_settings: Cấu hình chunked transfer (mặc định nếu None)
+        """
+        # Sessions, relay và authorizer phải có trước khi BaseEventRegistry gọi _create_handlers()
+        self.sessions = SessionStore()
+        self.relay = StreamRelay(sio, MainNamespaces.ROOT, settings or RelaySettings(), self.sessions)
+        self.authorizer = ConnectAuthorizer(auth_settings or AuthSettings())
+        self.transfer_settings = transfer_settings or TransferSettings()
+        self.transfers = TransferStore(self.transfer_settings)
+
+        super().__init__(sio)
+
+    def get_presence(self) -> dict:
+        """
+        Số sessions theo role và số subscribers theo stream (không duyệt connections)
+
+        Returns:
+            Dict gồm sessions, roles, streams
+        """
+        return self.sessions.get_presence()
+
+    def get_transfer_stats(self) -> dict:
+        """
+        Counters của chunked transfers
+
+        Returns:
+            Dict gồm active, started, resumed, completed, expired
+        """
+        return self.transfers.get_stats()
+
+    def get_feedback_stats(self) -> dict:
+        """
+        Counters của receiver feedback
+
+        Returns:
+            Dict gồm receivers, reports, invalid, sent (rỗng nếu tắt feedback)
+        """
+        feedback = self.relay.feedback
+        return feedback.get_stats() if feedback is not None else {}
+
+    def get_lagging_receivers(self) -> list[dict]:
+        """
+        Lấy danh sách receivers đang lag (bị skip frame)
+
+        Returns:
+            List dict gồm sid, queue depth, số frame bị drop và thời gian lag
+        """
+        return self.relay.consumers.get_lagging()
+
     def _create_handlers(self) -> list[IEventHandler]:
         """
         Tạo và trả về danh sách các event handlers cho Main Server.
@@ -25,7 +107,16 @@ class MainEventRegistry(BaseEventRegistry):
             List of main server event handlers
         """
         return [
-            ConnectHandler(),
-            DisconnectHandler(),
+            ConnectHandler(self.relay, self.authorizer),
+            DisconnectHandler(self.relay),
+            SubscribeHandler(self.relay, self.authorizer.max_streams),
+            UnsubscribeHandler(self.relay),
+            ReplayHandler(self.relay),
+            PublishHandler(self.relay),
+            FeedbackHandler(self.relay),
+            TransferBeginHandler(self.relay, self.transfers, self.transfer_settings.missing_batch),
+            TransferChunkHandler(self.relay, self.transfers),
+            TransferFetchHandler(self.relay, self.transfers, self.transfer_settings.fetch_batch),
+            TransferSyncHandler(self.relay, self.transfers),
+            BatchHandler(self),
         ]
-    
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+AuthSettings - Cấu hình xác thực connect handshake cho Main Server
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass, field
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class AuthSettings:
+    """
+    Immutable dataclass chứa cấu hình xác thực.
+
+    Token rỗng cho một role nghĩa là role đó không cần token.
+
+    Attributes:
+        sender_tokens: Tokens hợp lệ cho role sender
+        receiver_tokens: Tokens hợp lệ cho role receiver
+        require_role: Từ chối clients không khai báo role sender/receiver
+        max_streams: Số streams tối đa một client khai báo khi connect
+    """
+    sender_tokens: tuple[str, ...] = field(default=())
+    receiver_tokens: tuple[str, ...] = field(default=())
+    require_role: bool = False
+    max_streams: int = 64
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.max_streams < 1:
+            raise ConfigInvalidValueError(f"max_streams must be positive: '{self.max_streams}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "AuthSettings":
+        """
+        Tạo AuthSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            AuthSettings instance
+        """
+        return cls(
+            sender_tokens=cls._tokens(config.get_list("SERVER_SENDER_TOKENS", ",", [])),
+            receiver_tokens=cls._tokens(config.get_list("SERVER_RECEIVER_TOKENS", ",", [])),
+            require_role=config.get_bool("SERVER_REQUIRE_ROLE", cls.require_role),
+            max_streams=config.get_int("SERVER_MAX_CLIENT_STREAMS", cls.max_streams),
+        )
+
+    @staticmethod
+    def _tokens(values: list[str]) -> tuple[str, ...]:
+        return tuple(value.strip() for value in values if value.strip())
@@ -0,0 +1,129 @@
+"""
+ConnectAuthorizer - Xác thực auth payload của client một lần khi connect
+
+Auth payload:
+    {"role": "sender"|"receiver", "token": "...", "streams": ["cam-1", ...]}
+
+Kết quả (ConnectGrant) được cache trong Session: sender chỉ được publish
+các streams đã khai báo (không khai báo = mọi stream), receiver được
+subscribe các streams đã khai báo ngay lúc connect và sau đó chỉ được
+subscribe trong các streams đó (không khai báo = mọi stream). Các event sau đó chỉ
+còn một lookup set, không xác thực lại.
+"""
+import hashlib
+import hmac
+from dataclasses import dataclass
+
+from socketio.exceptions import ConnectionRefusedError
+
+from src.socketio_server.main.service.AuthSettings import AuthSettings
+from src.socketio_server.main.service.SessionStore import ROLE_RECEIVER, ROLE_SENDER, ROLE_UNKNOWN
+
+
+@dataclass(frozen=True)
+class ConnectGrant:
+    """
+    Quyền của một connection sau khi xác thực.
+
+    Attributes:
+        role: Role của client
+        streams: Streams client khai báo khi connect
+        publish_streams: Streams được phép publish, None = mọi stream
+        subscribe_streams: Streams được phép subscribe, None = mọi stream
+        principal: Định danh của credential (sha256 của token), None nếu
+                   không có token; session chỉ được resume bởi cùng principal
+    """
+    role: str
+    streams: tuple[str, ...]
+    publish_streams: frozenset[str] | None
+    subscribe_streams: frozenset[str] | None
+    principal: str | None = None
+
+
+class ConnectAuthorizer:
+    """
+    Validate auth payload theo AuthSettings.
+
+    Usage:
+        grant = authorizer.authorize(auth)  # raise ConnectionRefusedError
+    """
+
+    def __init__(self, settings: AuthSettings):
+        """
+        Args:
+            settings: Cấu hình xác thực
+        """
+        self._settings = settings
+        self._tokens = {
+            ROLE_SENDER: tuple(token.encode() for token in settings.sender_tokens),
+            ROLE_RECEIVER: tuple(token.encode() for token in settings.receiver_tokens),
+        }
+        # Đã cấu hình token thì client không khai báo role cũng bị từ chối
+        self._require_role = settings.require_role or any(self._tokens.values())
+
+    @property
+    def max_streams(self) -> int:
+        """Số streams tối đa của một client"""
+        return self._settings.max_streams
+
+    def authorize(self, auth) -> ConnectGrant:
+        """
+        Xác thực auth payload của một connection
+
+        Args:
+            auth: Auth payload từ client (có thể None)
+
+        Returns:
+            ConnectGrant
+
+        Raises:
+            ConnectionRefusedError: Nếu role, token hoặc streams không hợp lệ
+        """
+        if not isinstance(auth, dict):
+            auth = {}
+
+        role = auth.get("role")
+        if role not in self._tokens:
+            if self._require_role:
+                raise ConnectionRefusedError("role must be 'sender' or 'receiver'")
+            role = ROLE_UNKNOWN
+        elif self._tokens[role] and not self._check_token(role, auth.get("token")):
+            raise ConnectionRefusedError("invalid token")
+
+        streams = self._parse_streams(auth.get("streams"))
+
+        # Chỉ receiver được subscribe
+        subscribe_streams = frozenset()
+        if role == ROLE_SENDER:
+            publish_streams = frozenset(streams) if streams else None
+        elif role == ROLE_RECEIVER:
+            publish_streams = frozenset()
+            subscribe_streams = frozenset(streams) if streams else None
+        else:
+            publish_streams = None
+        token = auth.get("token")
+        principal = hashlib.sha256(token.encode()).hexdigest() if isinstance(token, str) and token else None
+        return ConnectGrant(role, streams, publish_streams, subscribe_streams, principal)
+
+    def _check_token(self, role: str, token) -> bool:
+        if not isinstance(token, str):
+            return False
+        token = token.encode()
+        # So sánh constant-time với mọi token, không dừng sớm
+        matched = False
+        for expected in self._tokens[role]:
+            matched |= hmac.compare_digest(token, expected)
+        return matched
+
+    def _parse_streams(self, streams) -> tuple[str, ...]:
+        if streams is None:
+            return ()
+        if (
+            not isinstance(streams, list)
+            or len(streams) > self._settings.max_streams
+            or not all(isinstance(stream_id, str) and stream_id for stream_id in streams)
+        ):
+            raise ConnectionRefusedError(
+                f"streams must be a list of at most {self._settings.max_streams} stream ids"
+            )
+        return tuple(dict.fromkeys(streams))
@@ -0,0 +1,164 @@
+"""
+ConsumerTracker - Theo dõi outbound queue của từng receiver
+
+Mỗi engineio socket trên server có một outbound queue. Receiver chậm làm
+queue của nó tăng dần trong khi receiver nhanh vẫn theo kịp. Tracker đo
+queue depth của các sid trong room trước khi fan-out; sid vượt ngưỡng bị skip
+frame (frame kế tiếp mà nó nhận luôn là frame mới nhất), nên memory của
+server không tăng vô hạn vì một receiver chậm.
+
+Đo queue depth tốn O(receivers của room), nên kết quả được cache theo room
+và chỉ đo lại sau `refresh_interval` giây; các publish trong khoảng đó chỉ
+đọc danh sách sid đang lag đã cache.
+"""
+import time
+
+from socketio import AsyncServer
+
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConsumerStats:
+    """Counters outbound của một sid"""
+
+    __slots__ = ("depth", "max_depth", "dropped", "lagging_since")
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.dropped = 0
+        # time.monotonic() lúc bắt đầu lag, None nếu đang theo kịp
+        self.lagging_since: float | None = None
+
+
+class ConsumerTracker:
+    """
+    Per-sid outbound queue accounting cho relay.
+
+    Usage:
+        skip = tracker.collect_lagging(sio, "/", room)
+        await sio.emit(event, data, to=room, skip_sid=skip + [sender_sid])
+    """
+
+    def __init__(self, max_pending_packets: int = 8, refresh_interval: float = 0.0):
+        """
+        Args:
+            max_pending_packets: Số engineio packet tối đa đang chờ gửi cho
+                                 một sid trước khi sid đó bị skip frame
+            refresh_interval: Thời gian (giây) dùng lại kết quả đo của một room,
+                              0 = đo mỗi lần fan-out
+        """
+        self.max_pending_packets = max_pending_packets
+        self.refresh_interval = refresh_interval
+        self._stats: dict[str, ConsumerStats] = {}
+        # (namespace, room) -> (time.monotonic() lúc đo, các sid đang lag)
+        self._rooms: dict[tuple[str, str], tuple[float, tuple[str, ...]]] = {}
+
+    def collect_lagging(self, sio: AsyncServer, namespace: str, room: str) -> list[str]:
+        """
+        Các sid đang lag trong room, đo lại nếu kết quả cache đã cũ
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            namespace: Namespace của room
+            room: Room sắp được fan-out
+
+        Returns:
+            List sid cần skip cho lần emit này (caller được phép sửa)
+        """
+        key = (namespace, room)
+        now = time.monotonic()
+        cached = self._rooms.get(key)
+        if cached is not None and now - cached[0] < self.refresh_interval:
+            # O(số sid đang lag), không chạm tới các receiver theo kịp
+            for sid in cached[1]:
+                stats = self._stats.get(sid)
+                if stats is not None:
+                    stats.dropped += 1
+            return list(cached[1])
+
+        lagging, measured = self._measure(sio, namespace, room, now)
+        if measured:
+            self._rooms[key] = (now, tuple(lagging))
+        else:
+            # Room rỗng: không giữ cache
+            self._rooms.pop(key, None)
+        return lagging
+
+    def _measure(self, sio: AsyncServer, namespace: str, room: str, now: float) -> tuple[list[str], int]:
+        """Đo queue depth của các sid trong room: (các sid đang lag, số sid đã đo)"""
+        lagging: list[str] = []
+        measured = 0
+        sockets = sio.eio.sockets
+
+        for sid, eio_sid in sio.manager.get_participants(namespace, room):
+            socket = sockets.get(eio_sid)
+            if socket is None:
+                continue
+            measured += 1
+
+            stats = self._stats.get(sid)
+            if stats is None:
+                stats = self._stats[sid] = ConsumerStats()
+
+            depth = socket.queue.qsize()
+            stats.depth = depth
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+
+            if depth > self.max_pending_packets:
+                stats.dropped += 1
+                if stats.lagging_since is None:
+                    stats.lagging_since = now
+                    logger.warning("Receiver %s is lagging (%d packets pending), dropping frames", sid, depth)
+                lagging.append(sid)
+            elif stats.lagging_since is not None:
+                logger.info("Receiver %s caught up after %d dropped frames", sid, stats.dropped)
+                stats.lagging_since = None
+
+        return lagging, measured
+
+    def release(self, sid: str) -> None:
+        """
+        Xóa counters của sid khi disconnect
+
+        Args:
+            sid: Socket ID
+        """
+        self._stats.pop(sid, None)
+
+    def get_stats(self, sid: str) -> ConsumerStats | None:
+        """
+        Lấy counters của một sid
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            ConsumerStats hoặc None nếu sid chưa nhận frame nào
+        """
+        return self._stats.get(sid)
+
+    def get_lagging(self) -> list[dict]:
+        """
+        Danh sách các sid đang lag, lag lâu nhất trước
+
+        Returns:
+            List dict gồm sid, depth, max_depth, dropped, lagging_for (giây)
+        """
+        now = time.monotonic()
+        lagging = [
+            {
+                "sid": sid,
+                "depth": stats.depth,
+                "max_depth": stats.max_depth,
+                "dropped": stats.dropped,
+                "lagging_for": now - stats.lagging_since,
+            }
+            for sid, stats in self._stats.items()
+            if stats.lagging_since is not None
+        ]
+        lagging.sort(key=lambda item: item["lagging_for"], reverse=True)
+        return lagging
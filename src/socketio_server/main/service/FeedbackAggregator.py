@@ -0,0 +1,194 @@
+"""
+FeedbackAggregator - Tổng hợp tình trạng receivers của một stream cho sender
+
+Receiver gửi report định kỳ (feedback event):
+    {"queue": int, "decode_ms": float | None, "drop_rate": float,
+     "latency_ms": {stream: float}}
+
+Report thuộc về receiver (không theo stream): decode pool và queue của
+receiver dùng chung cho mọi stream nó subscribe. Chỉ latency là theo stream.
+
+Khi sender publish, relay hỏi `due()` và gửi `summarize()` cho sender tối đa
+mỗi `interval` giây một lần: receiver tệ nhất của stream (queue, decode time,
+drop rate, latency lớn nhất) cộng với tình trạng outbound của relay
+(ConsumerTracker). Tình trạng relay luôn có, kể cả khi receivers không gửi
+report. Không có timer riêng: stream không còn publish thì không cần feedback.
+"""
+import time
+
+from src.socketio_server.main.service.ConsumerTracker import ConsumerTracker
+
+
+class ReceiverReport:
+    """Report gần nhất của một receiver"""
+
+    __slots__ = ("queue", "decode_ms", "drop_rate", "latency_ms", "received_at")
+
+    def __init__(self, queue: int, decode_ms: float | None, drop_rate: float,
+                 latency_ms: dict[str, float], received_at: float):
+        self.queue = queue
+        self.decode_ms = decode_ms
+        self.drop_rate = drop_rate
+        self.latency_ms = latency_ms
+        # time.monotonic()
+        self.received_at = received_at
+
+
+class FeedbackAggregator:
+    """
+    sid -> ReceiverReport, tổng hợp theo stream với rate limit.
+
+    Usage:
+        aggregator.report(sid, data)
+        if aggregator.due(stream_id):
+            summary = aggregator.summarize(stream_id, sessions.subscribers(stream_id), consumers)
+    """
+
+    def __init__(self, interval: float, ttl: float):
+        """
+        Args:
+            interval: Khoảng thời gian (giây) tối thiểu giữa hai summary của một stream
+            ttl: Report cũ hơn ngưỡng này (giây) bị bỏ qua
+        """
+        self._interval = interval
+        self._ttl = ttl
+        self._reports: dict[str, ReceiverReport] = {}
+        # stream -> time.monotonic() của summary gần nhất
+        self._last_sent: dict[str, float] = {}
+
+        # Counters
+        self.reports = 0
+        self.invalid = 0
+        self.sent = 0
+
+    def report(self, sid: str, data) -> bool:
+        """
+        Lưu report của receiver (thay report trước đó)
+
+        Args:
+            sid: Socket ID của receiver
+            data: {"queue", "decode_ms", "drop_rate", "latency_ms"}
+
+        Returns:
+            False nếu report không hợp lệ
+        """
+        if not isinstance(data, dict):
+            self.invalid += 1
+            return False
+
+        queue, decode_ms = data.get("queue", 0), data.get("decode_ms")
+        drop_rate, latency_ms = data.get("drop_rate", 0.0), data.get("latency_ms") or {}
+        if (
+            not isinstance(queue, int)
+            or not (decode_ms is None or isinstance(decode_ms, (int, float)))
+            or not isinstance(drop_rate, (int, float))
+            or not isinstance(latency_ms, dict)
+        ):
+            self.invalid += 1
+            return False
+
+        latency_ms = {
+            stream_id: float(value)
+            for stream_id, value in latency_ms.items()
+            if isinstance(stream_id, str) and isinstance(value, (int, float))
+        }
+        self._reports[sid] = ReceiverReport(
+            max(queue, 0),
+            None if decode_ms is None else max(float(decode_ms), 0.0),
+            min(max(float(drop_rate), 0.0), 1.0),
+            latency_ms,
+            time.monotonic(),
+        )
+        self.reports += 1
+        return True
+
+    def release(self, sid: str) -> None:
+        """
+        Xóa report của sid khi disconnect
+
+        Args:
+            sid: Socket ID
+        """
+        self._reports.pop(sid, None)
+
+    def due(self, stream_id: str) -> bool:
+        """
+        Đã tới lúc gửi summary của stream (đánh dấu đã gửi nếu True)
+
+        Args:
+            stream_id: ID của stream
+
+        Returns:
+            True nếu summary gần nhất cũ hơn interval
+        """
+        now = time.monotonic()
+        if now - self._last_sent.get(stream_id, float("-inf")) < self._interval:
+            return False
+        self._last_sent[stream_id] = now
+        self.sent += 1
+        return True
+
+    def summarize(self, stream_id: str, subscribers: frozenset[str], consumers: ConsumerTracker) -> dict:
+        """
+        Tổng hợp tình trạng các receivers của stream
+
+        Args:
+            stream_id: ID của stream
+            subscribers: Các sid đang subscribe stream
+            consumers: Outbound accounting của relay
+
+        Returns:
+            {"stream", "receivers", "reporting", "queue", "decode_ms",
+             "drop_rate", "latency_ms", "relay": {"lagging", "depth"}};
+            decode_ms/latency_ms là None nếu không receiver nào đo được
+        """
+        deadline = time.monotonic() - self._ttl
+        reporting = 0
+        queue, drop_rate = 0, 0.0
+        decode_ms: float | None = None
+        latency_ms: float | None = None
+        lagging, depth = 0, 0
+
+        for sid in subscribers:
+            stats = consumers.get_stats(sid)
+            if stats is not None:
+                depth = max(depth, stats.depth)
+                if stats.lagging_since is not None:
+                    lagging += 1
+
+            report = self._reports.get(sid)
+            if report is None or report.received_at < deadline:
+                continue
+            reporting += 1
+            queue = max(queue, report.queue)
+            drop_rate = max(drop_rate, report.drop_rate)
+            if report.decode_ms is not None:
+                decode_ms = report.decode_ms if decode_ms is None else max(decode_ms, report.decode_ms)
+            value = report.latency_ms.get(stream_id)
+            if value is not None:
+                latency_ms = value if latency_ms is None else max(latency_ms, value)
+
+        return {
+            "stream": stream_id,
+            "receivers": len(subscribers),
+            "reporting": reporting,
+            "queue": queue,
+            "decode_ms": decode_ms,
+            "drop_rate": drop_rate,
+            "latency_ms": latency_ms,
+            "relay": {"lagging": lagging, "depth": depth},
+        }
+
+    def get_stats(self) -> dict:
+        """
+        Counters của aggregator
+
+        Returns:
+            Dict gồm receivers (đang có report), reports, invalid, sent
+        """
+        return {
+            "receivers": len(self._reports),
+            "reports": self.reports,
+            "invalid": self.invalid,
+            "sent": self.sent,
+        }
@@ -0,0 +1,84 @@
+"""
+RelaySettings - Cấu hình relay cho Main Server
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class RelaySettings:
+    """
+    Immutable dataclass chứa cấu hình relay.
+
+    Attributes:
+        max_pending_packets: Số packet tối đa chờ gửi cho một receiver
+                             trước khi receiver đó bị skip frame
+        lag_check_interval: Khoảng thời gian (giây) giữa hai lần đo queue depth
+                            receivers của một room, 0 = đo mỗi lần publish
+        resume_ttl: Thời gian (giây) giữ subscriptions của sid đã disconnect
+                    để client reconnect có thể resume
+        max_detached: Số sessions đã disconnect tối đa được giữ để resume
+        replay_max_items: Số payload tối đa giữ để replay, 0 = tắt replay
+        replay_max_bytes: Tổng kích thước tối đa của các payload giữ để replay
+        replay_batch_bytes: Kích thước tối đa của một replay response
+                            (phải nhỏ hơn max_http_buffer_size của client)
+        feedback_interval: Khoảng thời gian (giây) tối thiểu giữa hai lần gửi
+                           feedback của một stream cho sender, 0 = tắt feedback
+        feedback_ttl: Report của receiver cũ hơn ngưỡng này (giây) bị bỏ qua
+    """
+    max_pending_packets: int = 8
+    lag_check_interval: float = 0.05
+    resume_ttl: float = 30.0
+    max_detached: int = 10000
+    replay_max_items: int = 1024
+    replay_max_bytes: int = 64 * 1024 * 1024
+    replay_batch_bytes: int = 512 * 1024
+    feedback_interval: float = 1.0
+    feedback_ttl: float = 5.0
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.max_pending_packets < 1:
+            raise ConfigInvalidValueError(
+                f"max_pending_packets must be positive: '{self.max_pending_packets}'"
+            )
+        if self.lag_check_interval < 0:
+            raise ConfigInvalidValueError(
+                f"lag_check_interval must not be negative: '{self.lag_check_interval}'"
+            )
+        if self.resume_ttl < 0 or self.max_detached < 0:
+            raise ConfigInvalidValueError("resume_ttl and max_detached must not be negative")
+        if self.replay_max_items < 0 or self.replay_max_bytes < 1 or self.replay_batch_bytes < 1:
+            raise ConfigInvalidValueError(
+                "replay_max_items must not be negative, replay_max_bytes and replay_batch_bytes must be positive"
+            )
+        if self.feedback_interval < 0 or self.feedback_ttl <= 0:
+            raise ConfigInvalidValueError(
+                "feedback_interval must not be negative and feedback_ttl must be positive"
+            )
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RelaySettings":
+        """
+        Tạo RelaySettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            RelaySettings instance
+        """
+        return cls(
+            max_pending_packets=config.get_int("RELAY_MAX_PENDING_PACKETS", cls.max_pending_packets),
+            lag_check_interval=config.get_float("RELAY_LAG_CHECK_INTERVAL_S", cls.lag_check_interval),
+            resume_ttl=config.get_float("RELAY_RESUME_TTL_S", cls.resume_ttl),
+            max_detached=config.get_int("RELAY_MAX_DETACHED_SESSIONS", cls.max_detached),
+            replay_max_items=config.get_int("RELAY_REPLAY_MAX_ITEMS", cls.replay_max_items),
+            replay_max_bytes=config.get_int("RELAY_REPLAY_MAX_BYTES", cls.replay_max_bytes),
+            replay_batch_bytes=config.get_int("RELAY_REPLAY_BATCH_BYTES", cls.replay_batch_bytes),
+            feedback_interval=config.get_float("RELAY_FEEDBACK_INTERVAL_S", cls.feedback_interval),
+            feedback_ttl=config.get_float("RELAY_FEEDBACK_TTL_S", cls.feedback_ttl),
+        )
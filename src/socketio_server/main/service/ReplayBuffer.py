@@ -0,0 +1,124 @@
+"""
+ReplayBuffer - Ring buffer các payload đã relay để receiver reconnect lấy lại
+
+Mỗi payload được gán một sequence number tăng dần trên toàn relay
+(`relay_seq`). Buffer giữ các payload gần nhất theo thứ tự seq, giới hạn cả
+số lượng lẫn tổng kích thước; payload cũ nhất bị bỏ khi vượt giới hạn.
+
+Payload được giữ bằng reference (cùng object đã emit), không copy. Buffer
+dùng chung cho mọi session: replay của một session là các entries có
+seq > seq cuối cùng session đó đã nhận và thuộc các streams session đó
+subscribe. Chi phí publish không phụ thuộc số receivers, chi phí replay
+tỉ lệ với số entries bị lỡ.
+
+Seq chỉ có nghĩa trong một buffer: mỗi worker process (và mỗi lần chạy) có
+`epoch` ngẫu nhiên riêng, seq của epoch khác không thể so sánh được.
+"""
+import secrets
+from collections import deque
+
+from src.observability.metrics import payload_size
+
+
+class ReplayBuffer:
+    """
+    Bounded ring buffer (seq, stream_id, size, payload) theo thứ tự seq.
+
+    Usage:
+        seq = buffer.append("cam-1", payload)
+        items, more = buffer.since(last_seq, {"cam-1"}, max_bytes=512 * 1024)
+    """
+
+    def __init__(self, max_items: int, max_bytes: int):
+        """
+        Args:
+            max_items: Số payload tối đa được giữ
+            max_bytes: Tổng kích thước ước lượng tối đa của các payload
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+
+        self._entries: deque[tuple[int, str, int, dict]] = deque()
+        self._bytes = 0
+        self.last_seq = 0
+        # ID của seq space này
+        self.epoch = secrets.token_hex(8)
+
+        # Counters
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def first_seq(self) -> int:
+        """Seq nhỏ nhất còn trong buffer (last_seq + 1 nếu buffer rỗng)"""
+        return self._entries[0][0] if self._entries else self.last_seq + 1
+
+    @property
+    def size_bytes(self) -> int:
+        """Tổng kích thước ước lượng của các payload đang giữ"""
+        return self._bytes
+
+    def append(self, stream_id: str, data: dict) -> int:
+        """
+        Gán seq cho payload và giữ lại để replay
+
+        Args:
+            stream_id: Stream của payload
+            data: Payload đã (hoặc sắp) relay
+
+        Returns:
+            Seq của payload
+        """
+        self.last_seq += 1
+        size = payload_size(data)
+
+        self._entries.append((self.last_seq, stream_id, size, data))
+        self._bytes += size
+
+        entries = self._entries
+        while entries and (len(entries) > self.max_items or self._bytes > self.max_bytes):
+            self._bytes -= entries.popleft()[2]
+            self.evicted += 1
+
+        return self.last_seq
+
+    def since(self, after: int, streams: set[str], max_bytes: int) -> tuple[list[dict], bool]:
+        """
+        Các payload có seq > after thuộc streams, theo thứ tự seq
+
+        Args:
+            after: Seq cuối cùng client đã nhận
+            streams: Streams mà session subscribe
+            max_bytes: Kích thước tối đa của kết quả; luôn trả về ít nhất
+                       một payload nếu có
+
+        Returns:
+            (payloads, more) - more=True nếu còn payload sau kết quả bị cắt
+        """
+        if after >= self.last_seq or not streams:
+            return [], False
+
+        # Duyệt ngược từ entry mới nhất: chỉ chạm vào các entries bị lỡ
+        missed = []
+        for entry in reversed(self._entries):
+            if entry[0] <= after:
+                break
+            if entry[1] in streams:
+                missed.append(entry)
+        missed.reverse()
+
+        items = []
+        total = 0
+        for _, _, size, data in missed:
+            if items and total + size > max_bytes:
+                return items, True
+            items.append(data)
+            total += size
+        return items, False
+
+    def clear(self) -> None:
+        """Xóa mọi payload (seq vẫn tiếp tục tăng)"""
+        self._entries.clear()
+        self._bytes = 0
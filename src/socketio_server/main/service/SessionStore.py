@@ -0,0 +1,272 @@
+"""
+SessionStore - State của các clients đang connect tới worker hiện tại
+
+Mỗi sid có một Session record (`__slots__`, không có __dict__) gồm role,
+streams đã subscribe, counters và thời điểm hoạt động cuối. Store giữ thêm
+index theo role và theo stream, nên lookup một sid, đếm clients theo role
+hay lấy subscribers của một stream đều không phải duyệt toàn bộ connections.
+
+Session được tạo trong ConnectHandler và xóa trong DisconnectHandler.
+Với nhiều workers, mỗi worker chỉ biết sessions connect tới chính nó.
+"""
+import time
+
+from src.observability import metrics
+
+ROLE_SENDER = "sender"
+ROLE_RECEIVER = "receiver"
+ROLE_UNKNOWN = "unknown"
+ROLES = (ROLE_SENDER, ROLE_RECEIVER, ROLE_UNKNOWN)
+
+
+class Session:
+    """State của một sid"""
+
+    __slots__ = (
+        "sid", "role", "streams", "connected_at", "last_seen",
+        "events_received", "published", "resumed_from", "publish_streams", "subscribe_streams",
+        "principal",
+    )
+
+    def __init__(self, sid: str, role: str, now: float):
+        self.sid = sid
+        self.role = role
+        self.streams: set[str] = set()
+        # time.monotonic()
+        self.connected_at = now
+        self.last_seen = now
+        self.events_received = 0
+        self.published = 0
+        # Session cũ mà sid này đã resume (nếu có)
+        self.resumed_from: str | None = None
+        # Streams được phép publish (cache từ ConnectAuthorizer), None = mọi stream
+        self.publish_streams: frozenset[str] | None = None
+        # Streams được phép subscribe (cache từ ConnectAuthorizer), None = mọi stream
+        self.subscribe_streams: frozenset[str] | None = frozenset()
+        # sha256 của token lúc connect (ConnectGrant.principal)
+        self.principal: str | None = None
+
+    def can_publish(self, stream_id: str) -> bool:
+        """Quyền publish stream, đã xác thực lúc connect"""
+        return self.publish_streams is None or stream_id in self.publish_streams
+
+    def can_subscribe(self, stream_id: str) -> bool:
+        """Quyền subscribe stream, đã xác thực lúc connect"""
+        return self.subscribe_streams is None or stream_id in self.subscribe_streams
+
+    def to_dict(self) -> dict:
+        """Snapshot của session (thời gian tính bằng giây)"""
+        now = time.monotonic()
+        return {
+            "sid": self.sid,
+            "role": self.role,
+            "streams": sorted(self.streams),
+            "connected_s": round(now - self.connected_at, 3),
+            "idle_s": round(now - self.last_seen, 3),
+            "events_received": self.events_received,
+            "published": self.published,
+            "resumed_from": self.resumed_from,
+        }
+
+
+class SessionStore:
+    """
+    sid -> Session, với index theo role và theo stream.
+
+    Usage:
+        session = store.add(sid, ROLE_RECEIVER)
+        store.join(sid, "cam-1")
+        store.count(ROLE_RECEIVER), store.subscribers("cam-1")
+        store.remove(sid)
+    """
+
+    def __init__(self):
+        self._sessions: dict[str, Session] = {}
+        self._by_role: dict[str, set[str]] = {role: set() for role in ROLES}
+        self._by_stream: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, sid: str) -> bool:
+        return sid in self._sessions
+
+    # ----------
+    # Public API: Lifecycle
+    # ----------
+
+    def add(self, sid: str, role: str = ROLE_UNKNOWN) -> Session:
+        """
+        Tạo session cho sid vừa connect
+
+        Args:
+            sid: Socket ID
+            role: Role của client (ROLES), role lạ được lưu là ROLE_UNKNOWN
+
+        Returns:
+            Session mới (session cũ cùng sid, nếu có, bị thay thế)
+        """
+        if sid in self._sessions:
+            self.remove(sid)
+        if role not in self._by_role:
+            role = ROLE_UNKNOWN
+
+        session = Session(sid, role, time.monotonic())
+        self._sessions[sid] = session
+        self._by_role[role].add(sid)
+        metrics.RELAY_SESSIONS.labels(role).inc()
+        return session
+
+    def remove(self, sid: str) -> Session | None:
+        """
+        Xóa session của sid vừa disconnect, cùng các index
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Session đã xóa, None nếu không có
+        """
+        session = self._sessions.pop(sid, None)
+        if session is None:
+            return None
+
+        self._by_role[session.role].discard(sid)
+        metrics.RELAY_SESSIONS.labels(session.role).dec()
+        for stream_id in session.streams:
+            self._discard_subscriber(stream_id, sid)
+        return session
+
+    def get(self, sid: str) -> Session | None:
+        """
+        Lấy session của sid
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Session hoặc None
+        """
+        return self._sessions.get(sid)
+
+    def touch(self, sid: str) -> Session | None:
+        """
+        Ghi nhận một event từ sid (counter + last_seen)
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Session hoặc None nếu sid không có session
+        """
+        session = self._sessions.get(sid)
+        if session is not None:
+            session.events_received += 1
+            session.last_seen = time.monotonic()
+        return session
+
+    # ----------
+    # Public API: Subscriptions
+    # ----------
+
+    def join(self, sid: str, stream_id: str) -> None:
+        """
+        Ghi nhận sid subscribe stream
+
+        Args:
+            sid: Socket ID
+            stream_id: ID của stream
+        """
+        session = self._sessions.get(sid)
+        if session is None:
+            return
+        session.streams.add(stream_id)
+        self._by_stream.setdefault(stream_id, set()).add(sid)
+
+    def leave(self, sid: str, stream_id: str) -> None:
+        """
+        Ghi nhận sid hủy subscribe stream
+
+        Args:
+            sid: Socket ID
+            stream_id: ID của stream
+        """
+        session = self._sessions.get(sid)
+        if session is None:
+            return
+        session.streams.discard(stream_id)
+        self._discard_subscriber(stream_id, sid)
+
+    def streams_of(self, sid: str) -> set[str]:
+        """
+        Streams mà sid đang subscribe (set của session, không copy)
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Set stream IDs (rỗng nếu sid không có session)
+        """
+        session = self._sessions.get(sid)
+        return session.streams if session is not None else set()
+
+    def subscribers(self, stream_id: str) -> frozenset[str]:
+        """
+        Các sid đang subscribe stream
+
+        Args:
+            stream_id: ID của stream
+
+        Returns:
+            Frozenset sids
+        """
+        return frozenset(self._by_stream.get(stream_id, ()))
+
+    # ----------
+    # Public API: Presence
+    # ----------
+
+    def count(self, role: str) -> int:
+        """
+        Số sessions của một role
+
+        Args:
+            role: Role
+
+        Returns:
+            Số sessions
+        """
+        return len(self._by_role.get(role, ()))
+
+    def sids(self, role: str) -> frozenset[str]:
+        """
+        Các sid của một role
+
+        Args:
+            role: Role
+
+        Returns:
+            Frozenset sids
+        """
+        return frozenset(self._by_role.get(role, ()))
+
+    def get_presence(self) -> dict:
+        """
+        Tổng quan sessions của worker
+
+        Returns:
+            Dict gồm số sessions theo role và số subscribers theo stream
+        """
+        return {
+            "sessions": len(self._sessions),
+            "roles": {role: len(sids) for role, sids in self._by_role.items()},
+            "streams": {stream_id: len(sids) for stream_id, sids in self._by_stream.items()},
+        }
+
+    def _discard_subscriber(self, stream_id: str, sid: str) -> None:
+        sids = self._by_stream.get(stream_id)
+        if sids is None:
+            return
+        sids.discard(sid)
+        if not sids:
+            del self._by_stream[stream_id]
@@ -0,0 +1,359 @@
+"""
+StreamRelay - Relay payload từ sender tới các receiver đã subscribe
+
+Mỗi stream tương ứng với một SocketIO room. Receiver subscribe = enter room,
+sender publish = một lần `sio.emit(..., to=room)` duy nhất. SocketIO manager
+encode packet một lần rồi gửi cùng packet đó cho mọi participant trong room,
+nên chi phí fan-out không tăng theo số receiver và payload không bị copy
+cho từng subscriber.
+
+Receiver chậm (outbound queue vượt ngưỡng) bị skip frame thông qua
+ConsumerTracker, vẫn trong cùng một lần emit.
+
+Subscriptions của sid đã disconnect được giữ `resume_ttl` giây, cùng role và
+principal (hash của token) của session; client reconnect với session ID cũ
+và cùng role/principal sẽ được gắn lại vào các streams đó.
+Subscriptions của sid đang connect nằm trong SessionStore.
+
+Mỗi payload được đánh `relay_seq` và giữ trong ReplayBuffer; receiver
+reconnect gửi seq cuối cùng đã nhận để lấy lại các payload bị lỡ. Seq và
+buffer là state của từng worker process, nên payload còn được đánh
+`relay_epoch` của buffer; replay với epoch khác trả về complete=False.
+
+Payload có trace header ({"trace": {"sent": ...}}, sender bật tùy chọn) được
+relay ghi thêm `srv_recv` (lúc bắt đầu publish) và `srv_emit` (ngay trước
+emit) theo wall clock của server, để receiver tách latency theo từng hop.
+`srv_emit` là lúc payload được giao cho manager; thời gian chờ trong
+OutboundBatcher tính vào hop server -> receiver.
+
+Receivers gửi report tình trạng (queue, decode time, drop rate, latency) vào
+FeedbackAggregator; sau mỗi publish, sender nhận tổng hợp của stream (kèm
+tình trạng outbound của relay) tối đa mỗi `feedback_interval` giây.
+
+Các events khác tới room của stream (ví dụ chunked transfer) đi qua
+`forward()`: không đánh relay_seq và không giữ trong ReplayBuffer.
+"""
+import time
+
+from socketio import AsyncServer
+
+from src.socketio_server.shared.enum.BaseEvent import SocketEvent
+from src.socketio_server.shared.enum.BaseNamespace import Namespace
+from src.socketio_server.main.enum.MainEvent import MainEvents
+from src.socketio_server.main.service.ConsumerTracker import ConsumerTracker
+from src.socketio_server.main.service.FeedbackAggregator import FeedbackAggregator
+from src.socketio_server.main.service.RelaySettings import RelaySettings
+from src.socketio_server.main.service.ReplayBuffer import ReplayBuffer
+from src.socketio_server.main.service.SessionStore import Session, SessionStore
+
+
+class StreamRelay:
+    """
+    Quản lý stream rooms và fan-out payload cho một namespace.
+
+    Payload format (sender -> server -> receivers):
+        {"stream": "cam-1", "data": <bytes>, ...}
+
+    Payload được forward nguyên vẹn (cùng object) tới room của stream.
+    """
+
+    ROOM_PREFIX = "stream:"
+
+    # Key của sequence number mà relay thêm vào payload
+    SEQ_KEY = "relay_seq"
+    # Key của epoch (seq space của worker) mà relay thêm vào payload
+    EPOCH_KEY = "relay_epoch"
+    # Key của trace header (optional) trong payload
+    TRACE_KEY = "trace"
+
+    def __init__(
+        self,
+        sio: AsyncServer,
+        namespace: Namespace,
+        settings: RelaySettings,
+        sessions: SessionStore,
+    ):
+        """
+        Initialize StreamRelay
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            namespace: Namespace mà relay hoạt động
+            settings: Cấu hình relay
+            sessions: SessionStore dùng chung của registry
+        """
+        self._sio = sio
+        self._namespace = namespace
+        self.sessions = sessions
+
+        # Outbound accounting của từng receiver
+        self.consumers = ConsumerTracker(settings.max_pending_packets, settings.lag_check_interval)
+
+        # Sessions đã disconnect chờ resume: sid -> (expires_at, streams, role, principal).
+        # Insertion order = thứ tự hết hạn, nên dọn từ đầu dict
+        self._resume_ttl = settings.resume_ttl
+        self._max_detached = settings.max_detached
+        self._detached: dict[str, tuple[float, set[str], str, str | None]] = {}
+
+        # Payload gần nhất cho receivers reconnect, None nếu tắt replay
+        self.replay: ReplayBuffer | None = None
+        if settings.replay_max_items > 0:
+            self.replay = ReplayBuffer(settings.replay_max_items, settings.replay_max_bytes)
+        self._replay_batch_bytes = settings.replay_batch_bytes
+
+        # Report của receivers tổng hợp cho sender, None nếu tắt feedback
+        self.feedback: FeedbackAggregator | None = None
+        if settings.feedback_interval > 0:
+            self.feedback = FeedbackAggregator(settings.feedback_interval, settings.feedback_ttl)
+
+    @classmethod
+    def room_for(cls, stream_id: str) -> str:
+        """
+        Tên room tương ứng với stream
+
+        Args:
+            stream_id: ID của stream
+
+        Returns:
+            Tên SocketIO room
+        """
+        return cls.ROOM_PREFIX + stream_id
+
+    @staticmethod
+    def parse_stream_id(data) -> str | None:
+        """
+        Lấy stream ID từ event data
+
+        Args:
+            data: Event data từ client
+
+        Returns:
+            Stream ID hoặc None nếu data không hợp lệ
+        """
+        if not isinstance(data, dict):
+            return None
+        stream_id = data.get("stream")
+        if not isinstance(stream_id, str) or not stream_id:
+            return None
+        return stream_id
+
+    # ----------
+    # Public API: Subscriptions
+    # ----------
+
+    async def subscribe(self, sid: str, stream_id: str) -> None:
+        """
+        Đăng ký sid nhận payload của stream
+
+        Args:
+            sid: Socket ID của receiver
+            stream_id: ID của stream
+        """
+        await self._sio.enter_room(sid, self.room_for(stream_id), namespace=self._namespace.value)
+        self.sessions.join(sid, stream_id)
+        self.sessions.touch(sid)
+
+    async def unsubscribe(self, sid: str, stream_id: str) -> None:
+        """
+        Hủy đăng ký sid khỏi stream
+
+        Args:
+            sid: Socket ID của receiver
+            stream_id: ID của stream
+        """
+        await self._sio.leave_room(sid, self.room_for(stream_id), namespace=self._namespace.value)
+        self.sessions.leave(sid, stream_id)
+        self.sessions.touch(sid)
+
+    def release(self, sid: str) -> set[str]:
+        """
+        Dọn state relay của sid khi disconnect, trước khi session bị xóa.
+
+        SocketIO tự rời rooms khi disconnect, method này chỉ dọn state của relay.
+        Subscriptions được giữ lại để resume trong `resume_ttl` giây.
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Các stream mà sid đã subscribe
+        """
+        self.consumers.release(sid)
+        if self.feedback is not None:
+            self.feedback.release(sid)
+        session = self.sessions.get(sid)
+        streams = set(session.streams) if session is not None else set()
+        self._expire_detached()
+        # Giữ cả session không subscribe stream nào (sender), để sender
+        # reconnect được nhận là cùng client (resumed_from)
+        if session is not None and self._max_detached > 0 and self._resume_ttl > 0:
+            if len(self._detached) >= self._max_detached:
+                # Bỏ session cũ nhất
+                self._detached.pop(next(iter(self._detached)))
+            self._detached[sid] = (time.monotonic() + self._resume_ttl, streams, session.role, session.principal)
+        return streams
+
+    async def resume(self, sid: str, previous_sid: str, session: Session) -> set[str] | None:
+        """
+        Gắn subscriptions của session cũ cho sid mới
+
+        Session cũ chỉ được resume bởi connection có cùng role và principal;
+        chỉ các streams mà session mới được phép subscribe được gắn lại.
+
+        Args:
+            sid: Socket ID mới
+            previous_sid: Session ID mà client nhận được trước khi mất kết nối
+            session: Session của sid mới (đã xác thực)
+
+        Returns:
+            Các stream đã resume, hoặc None nếu session cũ không còn (hết hạn
+            hoặc nằm ở worker khác) hoặc thuộc client khác - client phải tự
+            subscribe lại
+        """
+        self._expire_detached()
+        detached = self._detached.get(previous_sid)
+        if detached is None:
+            return None
+
+        _, streams, role, principal = detached
+        if role != session.role or principal != session.principal:
+            # Không bỏ session cũ: client thật vẫn resume được
+            return None
+        del self._detached[previous_sid]
+
+        streams = {stream_id for stream_id in streams if session.can_subscribe(stream_id)}
+        for stream_id in streams:
+            await self.subscribe(sid, stream_id)
+        return streams
+
+    def _expire_detached(self) -> None:
+        """Dọn các sessions đã hết hạn resume"""
+        now = time.monotonic()
+        detached = self._detached
+        while detached:
+            sid = next(iter(detached))
+            if detached[sid][0] > now:
+                break
+            del detached[sid]
+
+    def replay_since(self, sid: str, after: int, epoch: str | None) -> dict:
+        """
+        Các payload bị lỡ của sid kể từ seq `after`
+
+        Args:
+            sid: Socket ID của receiver (sau khi resume/subscribe lại)
+            after: `relay_seq` cuối cùng receiver đã nhận
+            epoch: `relay_epoch` của payload đó
+
+        Returns:
+            {"items": [payload, ...], "more": bool, "complete": bool, "epoch": str | None};
+            complete=False nếu một phần payload đã bị bỏ khỏi buffer hoặc
+            epoch thuộc worker/lần chạy khác (receiver phải resync toàn bộ),
+            more=True nếu receiver cần request tiếp từ seq của item cuối
+        """
+        replay = self.replay
+        if replay is None:
+            return {"items": [], "more": False, "complete": False, "epoch": None}
+
+        self.sessions.touch(sid)
+        if epoch != replay.epoch:
+            return {"items": [], "more": False, "complete": False, "epoch": replay.epoch}
+
+        items, more = replay.since(after, self.sessions.streams_of(sid), self._replay_batch_bytes)
+        complete = replay.first_seq - 1 <= after <= replay.last_seq
+        return {"items": items, "more": more, "complete": complete, "epoch": replay.epoch}
+
+    def get_subscriptions(self, sid: str) -> set[str]:
+        """
+        Lấy các stream mà sid đang subscribe
+
+        Args:
+            sid: Socket ID
+
+        Returns:
+            Set các stream ID
+        """
+        return set(self.sessions.streams_of(sid))
+
+    # ----------
+    # Public API: Fan-out
+    # ----------
+
+    async def publish(self, sid: str, stream_id: str, data: dict) -> bool:
+        """
+        Fan-out payload tới tất cả receivers của stream bằng một lần emit
+
+        Args:
+            sid: Socket ID của sender (không nhận lại payload của chính nó)
+            stream_id: ID của stream
+            data: Payload từ sender, forward nguyên vẹn
+
+        Returns:
+            False nếu session không được phép publish stream
+        """
+        trace = data.get(self.TRACE_KEY)
+        if isinstance(trace, dict):
+            trace["srv_recv"] = time.time_ns()
+
+        session = self.sessions.touch(sid)
+        if session is not None and not session.can_publish(stream_id):
+            return False
+
+        room = self.room_for(stream_id)
+
+        if self.replay is not None:
+            data[self.SEQ_KEY] = self.replay.append(stream_id, data)
+            data[self.EPOCH_KEY] = self.replay.epoch
+
+        # Skip các receiver đang lag, và sender nếu chính nó cũng subscribe stream.
+        # Sender không nằm trong room thì không thêm vào skip_sid, để các
+        # publish từ nhiều senders có cùng skip_sid và gộp được (OutboundBatcher)
+        skip_sids = self.consumers.collect_lagging(self._sio, self._namespace.value, room)
+        if session is not None:
+            session.published += 1
+            if stream_id in session.streams:
+                skip_sids.append(sid)
+
+        if isinstance(trace, dict):
+            trace["srv_emit"] = time.time_ns()
+        await self._sio.emit(
+            MainEvents.RELAY.value,
+            data,
+            to=room,
+            skip_sid=skip_sids,
+            namespace=self._namespace.value,
+        )
+
+        if self.feedback is not None and self.feedback.due(stream_id):
+            await self._send_feedback(sid, stream_id)
+        return True
+
+    async def _send_feedback(self, sid: str, stream_id: str) -> None:
+        """Gửi tổng hợp tình trạng receivers của stream cho sender"""
+        summary = self.feedback.summarize(
+            stream_id, self.sessions.subscribers(stream_id) - {sid}, self.consumers
+        )
+        await self._sio.emit(
+            MainEvents.STREAM_FEEDBACK.value,
+            summary,
+            room=sid,
+            namespace=self._namespace.value,
+        )
+
+    async def forward(self, sid: str, stream_id: str, event: SocketEvent, data, skip_lagging: bool = False) -> None:
+        """
+        Emit một event khác RELAY tới receivers của stream
+
+        Args:
+            sid: Socket ID của client gửi (không nhận lại event của chính nó)
+            stream_id: ID của stream
+            event: Event emit tới room
+            data: Event data
+            skip_lagging: Skip các receiver đang lag (receiver phải tự lấy lại data bị skip)
+        """
+        room = self.room_for(stream_id)
+        skip_sids = self.consumers.collect_lagging(self._sio, self._namespace.value, room) if skip_lagging else []
+        if stream_id in self.sessions.streams_of(sid):
+            skip_sids.append(sid)
+
+        await self._sio.emit(event.value, data, to=room, skip_sid=skip_sids, namespace=self._namespace.value)
@@ -0,0 +1,73 @@
+"""
+TransferSettings - Cấu hình chunked transfer cho Main Server
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class TransferSettings:
+    """
+    Immutable dataclass chứa cấu hình chunked transfer.
+
+    Attributes:
+        max_chunk_size: Kích thước chunk tối đa sender được dùng
+                        (phải nhỏ hơn max_http_buffer_size)
+        max_size: Kích thước tối đa của một transfer
+        max_chunks: Số chunks tối đa của một transfer (giới hạn bitmap và
+                    chunk_size nhỏ nhất: size / max_chunks)
+        spool_memory: Transfer nhỏ hơn ngưỡng này được giữ trong memory,
+                      lớn hơn thì spool xuống temp file
+        ttl: Thời gian (giây) giữ transfer không có hoạt động, để sender
+             resume upload và receiver lấy lại chunks bị lỡ (sender không
+             có token chỉ resume được trong RELAY_RESUME_TTL_S)
+        max_active: Số transfers tối đa được giữ cùng lúc
+        fetch_batch: Số chunks tối đa gửi lại cho một request của receiver
+        missing_batch: Số chunk indices tối đa trong một ack cho sender; sender
+                       gửi lại transfer_begin để lấy phần tiếp theo
+    """
+    max_chunk_size: int = 512 * 1024
+    max_size: int = 1024 * 1024 * 1024
+    max_chunks: int = 16384
+    spool_memory: int = 8 * 1024 * 1024
+    ttl: float = 300.0
+    max_active: int = 64
+    fetch_batch: int = 8
+    missing_batch: int = 4096
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if (
+            self.max_chunk_size < 1 or self.max_size < 1 or self.max_chunks < 1
+            or self.max_active < 1 or self.fetch_batch < 1 or self.missing_batch < 1
+        ):
+            raise ConfigInvalidValueError(
+                "max_chunk_size, max_size, max_chunks, max_active, fetch_batch and missing_batch must be positive"
+            )
+        if self.spool_memory < 0 or self.ttl < 0:
+            raise ConfigInvalidValueError("spool_memory and ttl must not be negative")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TransferSettings":
+        """
+        Tạo TransferSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            TransferSettings instance
+        """
+        return cls(
+            max_chunk_size=config.get_int("TRANSFER_MAX_CHUNK_SIZE", cls.max_chunk_size),
+            max_size=config.get_int("TRANSFER_MAX_SIZE", cls.max_size),
+            max_chunks=config.get_int("TRANSFER_MAX_CHUNKS", cls.max_chunks),
+            spool_memory=config.get_int("TRANSFER_SPOOL_MEMORY", cls.spool_memory),
+            ttl=config.get_float("TRANSFER_TTL_S", cls.ttl),
+            max_active=config.get_int("TRANSFER_MAX_ACTIVE", cls.max_active),
+            fetch_batch=config.get_int("TRANSFER_FETCH_BATCH", cls.fetch_batch),
+            missing_batch=config.get_int("TRANSFER_MISSING_BATCH", cls.missing_batch),
+        )
@@ -0,0 +1,316 @@
+"""
+TransferStore - State của các chunked transfers (payload lớn) trên server
+
+Sender chia payload thành chunks cố định (`chunk_size`, chunk cuối có thể
+ngắn hơn), chunk `i` nằm ở offset `i * chunk_size`. Mỗi transfer giữ một
+bitmap các chunks đã nhận và ghi data vào SpooledTemporaryFile: transfer nhỏ
+nằm trong memory, transfer lớn được spool xuống disk, nên server không bao
+giờ phải giữ cả payload lớn trong memory.
+
+Nhờ bitmap và spool:
+- Sender reconnect gửi lại `transfer_begin` cùng ID và chỉ gửi các chunks
+  còn thiếu (resume upload). Chỉ owner, session đã resume session của owner
+  (resumed_from), hoặc connection cùng principal (hash của token) với owner
+  được tiếp tục transfer. Session resume chỉ kéo dài RELAY_RESUME_TTL_S, nên
+  sender không có token chỉ resume được transfer trong khoảng đó; sender có
+  token resume được tới khi transfer hết `ttl`.
+- Receiver bị lỡ chunks (reconnect, join giữa chừng, bị skip vì lag) lấy
+  lại các chunks đó từ spool.
+- Mỗi transfer có `seq` tăng dần; receiver reconnect hỏi các transfers có
+  seq lớn hơn transfer cuối cùng nó biết, kể cả transfers bắt đầu và kết
+  thúc trong lúc nó mất kết nối.
+
+Transfer được giữ `ttl` giây kể từ hoạt động cuối, kể cả sau khi hoàn tất.
+Với nhiều workers, transfer là state của worker mà sender connect tới.
+"""
+import time
+from tempfile import SpooledTemporaryFile
+
+from src.socketio_server.main.service.TransferSettings import TransferSettings
+
+
+class Transfer:
+    """State của một transfer"""
+
+    __slots__ = (
+        "id", "seq", "stream", "owner", "principal", "size", "chunk_size", "chunk_count", "meta",
+        "_bitmap", "received", "_spool", "last_active",
+    )
+
+    def __init__(self, transfer_id: str, seq: int, stream: str, owner: str, principal: str | None,
+                 size: int, chunk_size: int, meta: dict | None, spool_memory: int):
+        self.id = transfer_id
+        self.seq = seq
+        self.stream = stream
+        # sid của sender đang upload (đổi khi sender reconnect và resume)
+        self.owner = owner
+        # Principal lúc connect của sender bắt đầu transfer (Session.principal)
+        self.principal = principal
+        self.size = size
+        self.chunk_size = chunk_size
+        self.chunk_count = -(-size // chunk_size)
+        self.meta = meta
+        self._bitmap = bytearray(self.chunk_count)
+        self.received = 0
+        self._spool = SpooledTemporaryFile(max_size=spool_memory)
+        self.last_active = time.monotonic()
+
+    @property
+    def complete(self) -> bool:
+        """Đã nhận đủ mọi chunk"""
+        return self.received == self.chunk_count
+
+    def header(self) -> dict:
+        """Mô tả transfer gửi cho receivers (không có data)"""
+        return {
+            "id": self.id,
+            "seq": self.seq,
+            "stream": self.stream,
+            "size": self.size,
+            "chunk_size": self.chunk_size,
+            "meta": self.meta,
+        }
+
+    def chunk_length(self, index: int) -> int:
+        """Kích thước của chunk `index`"""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+    def has(self, index: int) -> bool:
+        """Chunk `index` đã được nhận"""
+        return 0 <= index < self.chunk_count and self._bitmap[index] == 1
+
+    def missing(self, limit: int | None = None) -> list[int]:
+        """
+        Các chunks chưa nhận, theo thứ tự
+
+        Args:
+            limit: Số chunks tối đa trả về (None = tất cả)
+
+        Returns:
+            List chunk indices
+        """
+        result = []
+        index = self._bitmap.find(0)
+        while index != -1 and (limit is None or len(result) < limit):
+            result.append(index)
+            index = self._bitmap.find(0, index + 1)
+        return result
+
+    def write(self, index: int, data: bytes) -> bool:
+        """
+        Ghi một chunk vào spool
+
+        Args:
+            index: Chunk index
+            data: Data của chunk
+
+        Returns:
+            False nếu chunk đã được nhận trước đó (gửi lại sau resume)
+
+        Raises:
+            ValueError: Nếu index hoặc kích thước chunk không hợp lệ
+        """
+        if not 0 <= index < self.chunk_count:
+            raise ValueError(f"chunk index {index} out of range [0, {self.chunk_count})")
+        if len(data) != self.chunk_length(index):
+            raise ValueError(f"chunk {index} has {len(data)} bytes, expected {self.chunk_length(index)}")
+
+        self.last_active = time.monotonic()
+        if self._bitmap[index]:
+            return False
+
+        self._spool.seek(index * self.chunk_size)
+        self._spool.write(data)
+        self._bitmap[index] = 1
+        self.received += 1
+        return True
+
+    def read(self, index: int) -> bytes:
+        """
+        Đọc lại một chunk đã nhận từ spool
+
+        Args:
+            index: Chunk index (phải đã nhận, xem has())
+
+        Returns:
+            Data của chunk
+        """
+        self.last_active = time.monotonic()
+        self._spool.seek(index * self.chunk_size)
+        return self._spool.read(self.chunk_length(index))
+
+    def close(self) -> None:
+        """Giải phóng spool (xóa temp file nếu đã spool xuống disk)"""
+        self._spool.close()
+
+
+class TransferStore:
+    """
+    transfer ID -> Transfer, giới hạn số lượng và hết hạn theo ttl.
+
+    Usage:
+        transfer, created = store.begin(sid, data)
+        if store.write(transfer, index, chunk) and transfer.complete: ...
+        transfer.missing()
+    """
+
+    def __init__(self, settings: TransferSettings):
+        """
+        Args:
+            settings: Cấu hình chunked transfer
+        """
+        self._settings = settings
+        self._transfers: dict[str, Transfer] = {}
+        # Seq của transfer mới nhất
+        self.last_seq = 0
+
+        # Counters
+        self.started = 0
+        self.resumed = 0
+        self.completed = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._transfers)
+
+    def begin(
+        self, sid: str, data: dict, resumed_from: str | None = None, principal: str | None = None
+    ) -> tuple[Transfer, bool]:
+        """
+        Bắt đầu transfer mới, hoặc resume transfer cùng ID
+
+        Args:
+            sid: Socket ID của sender
+            data: {"id": str, "stream": str, "size": int, "chunk_size": int, "meta": dict | None}
+            resumed_from: Session cũ mà sid đã resume (Session.resumed_from)
+            principal: Principal lúc connect của sid (Session.principal)
+
+        Returns:
+            (transfer, created) - created=False nếu đây là resume
+
+        Raises:
+            ValueError: Nếu data không hợp lệ, không khớp transfer cùng ID,
+                        transfer thuộc sender khác, hoặc đã đủ max_active transfers
+        """
+        settings = self._settings
+        transfer_id, stream_id = data.get("id"), data.get("stream")
+        size, chunk_size, meta = data.get("size"), data.get("chunk_size"), data.get("meta")
+        if not isinstance(transfer_id, str) or not transfer_id or not isinstance(stream_id, str) or not stream_id:
+            raise ValueError("id and stream are required")
+        if not isinstance(size, int) or not isinstance(chunk_size, int) or size < 1 or chunk_size < 1:
+            raise ValueError("size and chunk_size must be positive integers")
+        if size > settings.max_size or chunk_size > settings.max_chunk_size:
+            raise ValueError(
+                f"size must be <= {settings.max_size} and chunk_size <= {settings.max_chunk_size}"
+            )
+        if -(-size // chunk_size) > settings.max_chunks:
+            raise ValueError(
+                f"at most {settings.max_chunks} chunks per transfer (chunk_size >= {-(-size // settings.max_chunks)})"
+            )
+        if meta is not None and not isinstance(meta, dict):
+            raise ValueError("meta must be a dict")
+
+        self.expire()
+        transfer = self._transfers.get(transfer_id)
+        if transfer is not None:
+            if (transfer.stream, transfer.size, transfer.chunk_size) != (stream_id, size, chunk_size):
+                raise ValueError(f"transfer '{transfer_id}' already exists with a different layout")
+            if not (
+                transfer.owner == sid
+                or (resumed_from is not None and transfer.owner == resumed_from)
+                or (principal is not None and transfer.principal == principal)
+            ):
+                raise ValueError(f"transfer '{transfer_id}' belongs to another sender")
+            transfer.owner = sid
+            transfer.last_active = time.monotonic()
+            self.resumed += 1
+            return transfer, False
+
+        if len(self._transfers) >= settings.max_active:
+            raise ValueError(f"too many active transfers ({settings.max_active})")
+
+        self.last_seq += 1
+        transfer = Transfer(
+            transfer_id, self.last_seq, stream_id, sid, principal, size, chunk_size, meta, settings.spool_memory
+        )
+        self._transfers[transfer_id] = transfer
+        self.started += 1
+        return transfer, True
+
+    def write(self, transfer: Transfer, index: int, data: bytes) -> bool:
+        """
+        Ghi một chunk của transfer (xem Transfer.write), đếm transfer hoàn tất
+
+        Returns:
+            False nếu chunk đã được nhận trước đó
+
+        Raises:
+            ValueError: Nếu index hoặc kích thước chunk không hợp lệ
+        """
+        written = transfer.write(index, data)
+        if written and transfer.complete:
+            self.completed += 1
+        return written
+
+    def get(self, transfer_id) -> Transfer | None:
+        """
+        Lấy transfer còn hiệu lực
+
+        Args:
+            transfer_id: ID của transfer
+
+        Returns:
+            Transfer hoặc None nếu không có / đã hết hạn
+        """
+        transfer = self._transfers.get(transfer_id)
+        if transfer is not None and time.monotonic() - transfer.last_active > self._settings.ttl:
+            self._remove(transfer_id)
+            self.expired += 1
+            return None
+        return transfer
+
+    def since(self, after: int, streams: set[str]) -> list[Transfer]:
+        """
+        Các transfers có seq > after thuộc streams, theo thứ tự seq
+
+        Args:
+            after: Seq của transfer cuối cùng receiver biết
+            streams: Streams mà receiver subscribe
+
+        Returns:
+            List transfers (đang upload hoặc đã hoàn tất)
+        """
+        self.expire()
+        return [t for t in self._transfers.values() if t.seq > after and t.stream in streams]
+
+    def expire(self) -> None:
+        """Dọn các transfers không hoạt động quá ttl"""
+        deadline = time.monotonic() - self._settings.ttl
+        for transfer_id in [tid for tid, t in self._transfers.items() if t.last_active < deadline]:
+            self._remove(transfer_id)
+            self.expired += 1
+
+    def close(self) -> None:
+        """Giải phóng mọi transfer"""
+        for transfer_id in list(self._transfers):
+            self._remove(transfer_id)
+
+    def get_stats(self) -> dict:
+        """
+        Counters của store
+
+        Returns:
+            Dict gồm active, started, resumed, completed, expired
+        """
+        return {
+            "active": len(self._transfers),
+            "started": self.started,
+            "resumed": self.resumed,
+            "completed": self.completed,
+            "expired": self.expired,
+        }
+
+    def _remove(self, transfer_id: str) -> None:
+        transfer = self._transfers.pop(transfer_id, None)
+        if transfer is not None:
+            transfer.close()
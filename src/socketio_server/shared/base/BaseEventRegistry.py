@@ -6,14 +6,26 @@ Trách nhiệm:
 - Đăng ký handlers với SocketIO AsyncServer
 - Tạo wrapper để execute handlers
 - Error handling và logging
+- Instrumentation (metrics) cho events nhận/emit
+- Đo latency của handlers, phát hiện handler chậm
 """
+import logging
+import time
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
 from socketio import AsyncServer
+from socketio.exceptions import ConnectionRefusedError
 
+from src.config import config
+from src.observability import metrics
+from src.observability.latency import SlowCallDetector
+from src.observability.logger import EventSampler, get_logger
 from src.socketio_server.shared.interface.IEventHandler import IEventHandler
-from src.socketio_server.shared.enum.BaseEvent import SocketEvent
+from src.socketio_server.shared.enum.BaseEvent import BaseEvents, SocketEvent
 from src.socketio_server.shared.enum.BaseNamespace import Namespace
 
+logger = get_logger(__name__)
+
 
 class BaseEventRegistry(ABC):
     """
@@ -43,8 +55,21 @@ class BaseEventRegistry(ABC):
         """
         # Storage: key = (namespace, event_name), value = handler instance
         self._handlers: dict[tuple[str, str], IEventHandler] = {}
+        # Wrapper đã đăng ký với SocketIO, cùng key với _handlers
+        self._wrappers: dict[tuple[str, str], Callable[..., Awaitable]] = {}
         self._sio = sio
 
+        # Sampling cho debug log trên hot path
+        self._log_sampler = EventSampler()
+
+        # Báo handlers chặn event loop lâu hơn HANDLER_SLOW_THRESHOLD_MS
+        self._slow_calls = SlowCallDetector(
+            logger, config.get_float("HANDLER_SLOW_THRESHOLD_MS", 50.0)
+        )
+
+        # Đếm events/bytes emit qua sio.emit
+        self._instrument_emit()
+
         # Get handlers from subclass implementation
         handlers = self._create_handlers()
 
@@ -100,9 +125,9 @@ class BaseEventRegistry(ABC):
         # Store handler
         self._handlers[key] = handler
 
-        print(
-            f"Registered handler: {handler.__class__.__name__} "
-            f"for {handler.namespace.value}:{handler.event.value}"
+        logger.debug(
+            "Registered handler: %s for %s:%s",
+            handler.__class__.__name__, handler.namespace.value, handler.event.value,
         )
 
         # Nếu SocketIO đã attach, đăng ký handler luôn
@@ -145,6 +170,44 @@ class BaseEventRegistry(ABC):
         """
         return list(self._handlers.values())
 
+    # ----------
+    # Public API: Dispatch
+    # ----------
+
+    async def dispatch(self, namespace: str, event: str, sid: str, data=None) -> bool:
+        """
+        Chạy handler của một event như khi nhận từ SocketIO
+
+        Dùng cho events được unpack từ batch: đi qua cùng wrapper nên
+        metrics, latency và error handling giống event nhận trực tiếp.
+
+        Args:
+            namespace: Namespace của event
+            event: Tên event
+            sid: Socket ID
+            data: Event data
+
+        Returns:
+            False nếu không có handler cho event
+        """
+        wrapper = self._wrappers.get((namespace, event))
+        if wrapper is None:
+            return False
+        await wrapper(sid, data)
+        return True
+
+    def get_latency_stats(self) -> dict[str, dict]:
+        """
+        Lấy latency percentiles của từng handler đã đăng ký
+
+        Returns:
+            Dict "namespace:event" -> snapshot (count, mean, p50, p90, p99, p999, max tính bằng ms)
+        """
+        return {
+            f"{namespace}:{event}": metrics.HANDLER_DURATION.labels(namespace, event).snapshot()
+            for namespace, event in self._handlers
+        }
+
     # ----------
     # Internal: SocketIO Registration
     # ----------
@@ -161,6 +224,7 @@ class BaseEventRegistry(ABC):
 
         # Tạo wrapper function
         wrapper = self._create_wrapper(handler)
+        self._wrappers[(handler.namespace.value, handler.event.value)] = wrapper
 
         # Register với SocketIO
         if handler.namespace.value == "/":
@@ -168,7 +232,27 @@ class BaseEventRegistry(ABC):
         else:
             self._sio.on(handler.event.value, namespace=handler.namespace.value)(wrapper)
 
-        print(f"Registered with SocketIO: {handler.namespace.value}:{handler.event.value}")
+        logger.debug("Registered with SocketIO: %s:%s", handler.namespace.value, handler.event.value)
+
+    def _instrument_emit(self) -> None:
+        """
+        Bọc `sio.emit` để đếm events và bytes emit theo (namespace, event)
+
+        Chỉ bọc một lần cho mỗi AsyncServer, kể cả khi có nhiều registries.
+        """
+        if getattr(self._sio, "_metrics_instrumented", False):
+            return
+
+        emit = self._sio.emit
+
+        async def instrumented_emit(event, data=None, *args, namespace=None, **kwargs):
+            labels = (namespace or "/", event)
+            metrics.EVENTS_EMITTED.labels(*labels).inc()
+            metrics.BYTES_EMITTED.labels(*labels).inc(metrics.payload_size(data))
+            return await emit(event, data, *args, namespace=namespace, **kwargs)
+
+        self._sio.emit = instrumented_emit
+        self._sio._metrics_instrumented = True
 
     def _create_wrapper(self, handler: IEventHandler):
         """
@@ -181,21 +265,75 @@ class BaseEventRegistry(ABC):
             Async wrapper function
         """
 
-        async def wrapper(sid: str, data=None):
+        key = (handler.namespace.value, handler.event.value)
+
+        # Resolve metric children một lần, không lookup trên hot path
+        received = metrics.EVENTS_RECEIVED.labels(*key)
+        received_bytes = metrics.BYTES_RECEIVED.labels(*key)
+        duration = metrics.HANDLER_DURATION.labels(*key)
+        slow = metrics.SLOW_HANDLERS.labels(*key)
+        slow_calls = self._slow_calls
+        errors = metrics.HANDLER_ERRORS.labels(*key)
+        connected = metrics.CONNECTED_CLIENTS.labels(key[0])
+        refused = metrics.CONNECTIONS_REFUSED.labels(key[0])
+
+        # connect/disconnect nhận environ/reason, không phải payload từ client
+        is_connect = handler.event == BaseEvents.CONNECT
+        is_disconnect = handler.event == BaseEvents.DISCONNECT
+        count_bytes = not (is_connect or is_disconnect)
+        # Duration của batch là tổng duration các events bên trong, vốn đã được
+        # ghi qua dispatch(); ghi thêm sẽ đếm hai lần
+        record_duration = handler.event != BaseEvents.BATCH
+
+        async def wrapper(sid: str, data=None, auth=None):
             """
             Wrapper function nhận event từ SocketIO
 
             Args:
                 sid: Socket ID
-                data: Event data (optional)
+                data: Event data (optional), WSGI environ với connect
+                auth: Auth payload của client (chỉ có với connect)
             """
+            if is_connect:
+                # Connect handler nhận auth payload của client làm data;
+                # environ vẫn lấy được qua sio.get_environ(sid)
+                data = auth
+
+            received.inc()
+            if count_bytes:
+                received_bytes.inc(metrics.payload_size(data))
+
+            start = time.monotonic_ns()
             try:
+                if logger.isEnabledFor(logging.DEBUG) and self._log_sampler.should_log(key):
+                    logger.debug("Handling %s in %s from %s", key[1], key[0], sid)
+
                 # Execute handler
                 await handler.handle(self._sio, sid, data)
 
+                if is_connect:
+                    connected.inc()
+                elif is_disconnect:
+                    connected.dec()
+
+            except ConnectionRefusedError as e:
+                # Connect handler từ chối client, không phải lỗi của handler
+                refused.inc()
+                logger.warning("Refused connection %s: %s", sid, e)
+                raise
+
             except Exception as e:
-                print(f"Error in handler {handler.__class__.__name__}: {e}")
+                errors.inc()
+                logger.exception("Error in handler %s: %s", handler.__class__.__name__, e)
                 # Emit error event to client
                 raise
 
+            finally:
+                elapsed = time.monotonic_ns() - start
+                if record_duration:
+                    duration.record(elapsed)
+                    if elapsed > slow_calls.threshold_ns:
+                        slow.inc()
+                        slow_calls.report(key, elapsed)
+
         return wrapper
@@ -0,0 +1,95 @@
+"""
+AsyncLocalManager - SocketIO client manager dùng LocalBroker làm pub/sub backend
+
+Mỗi server worker dùng một manager. Emit/enter_room/disconnect... được xử lý
+ở worker hiện tại rồi publish qua broker, các worker khác áp dụng cho
+clients của chúng (logic do `socketio.AsyncPubSubManager` đảm nhiệm), nên
+sender và receiver nằm ở hai worker khác nhau vẫn thấy events của nhau.
+
+Usage:
+    manager = AsyncLocalManager("local:///tmp/socketio-broker.sock")
+    sio = AsyncServer(client_manager=manager, ...)
+"""
+import asyncio
+from urllib.parse import urlparse
+
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.broker.LocalBroker import encode_frame, read_frame
+
+logger = get_logger(__name__)
+
+
+class AsyncLocalManager(AsyncPubSubManager):
+    """
+    Client manager kết nối tới LocalBroker qua Unix domain socket.
+
+    Một kết nối dùng chung cho publish và listen; broker không gửi lại frame
+    cho chính worker đã publish.
+    """
+
+    name = "asynclocal"
+
+    # Thời gian chờ tối đa giữa hai lần reconnect tới broker (giây)
+    MAX_RETRY_SLEEP = 5.0
+
+    def __init__(self, url: str, channel: str = "socketio", write_only: bool = False, json=None):
+        """
+        Args:
+            url: Broker URL dạng local:///path/to/broker.sock
+            channel: Tên channel (broker chỉ phục vụ một channel)
+            write_only: True nếu chỉ emit, không nhận events từ workers khác
+            json: Module-like object có dumps/loads (mặc định stdlib json)
+        """
+        super().__init__(channel=channel, write_only=write_only, logger=logger, json=json)
+        self.path = urlparse(url).path
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        """Mở kết nối tới broker nếu chưa có"""
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+            logger.info("Connected to local broker at %s", self.path)
+
+    def _reset(self) -> None:
+        """Bỏ kết nối hiện tại để lần dùng sau kết nối lại"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _publish(self, data):
+        for retries_left in range(1, -1, -1):  # 2 attempts
+            try:
+                await self._connect()
+                self._writer.write(encode_frame(self.json.dumps(data).encode()))
+                await self._writer.drain()
+                return
+            except (OSError, ConnectionError) as exc:
+                self._reset()
+                if retries_left > 0:
+                    logger.error("Cannot publish to local broker (%s), retrying", exc)
+                else:
+                    logger.error("Cannot publish to local broker (%s), giving up", exc)
+
+    async def _listen(self):
+        retry_sleep = 0.1
+        while True:
+            reader = None
+            try:
+                await self._connect()
+                reader = self._reader
+                retry_sleep = 0.1
+                while True:
+                    yield await read_frame(reader)
+            except (OSError, ConnectionError, asyncio.IncompleteReadError) as exc:
+                # Publish có thể đã mở kết nối mới, chỉ bỏ kết nối đang đọc
+                if reader is None or reader is self._reader:
+                    self._reset()
+                logger.error("Cannot receive from local broker (%s), retrying in %.1fs", exc, retry_sleep)
+                await asyncio.sleep(retry_sleep)
+                retry_sleep = min(retry_sleep * 2, self.MAX_RETRY_SLEEP)
@@ -0,0 +1,100 @@
+"""
+BrokerSettings - Cấu hình pub/sub broker cho server chạy nhiều workers
+
+Đọc từ environment thông qua `src.config.Config`. URL scheme quyết định
+client manager:
+    (trống)            -> manager mặc định, một process
+    local:///path.sock -> AsyncLocalManager (LocalBroker trong repo)
+    redis://...        -> socketio.AsyncRedisManager
+    amqp://...         -> socketio.AsyncAioPikaManager
+"""
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from socketio import AsyncManager
+
+from src.config import Config, ConfigInvalidValueError
+from src.socketio_server.shared.broker.AsyncLocalManager import AsyncLocalManager
+
+LOCAL_SCHEME = "local"
+SUPPORTED_SCHEMES = (LOCAL_SCHEME, "redis", "rediss", "amqp")
+
+
+@dataclass(frozen=True)
+class BrokerSettings:
+    """
+    Immutable dataclass chứa cấu hình broker.
+
+    Attributes:
+        url: Broker URL, trống nếu server chạy một process
+        channel: Tên channel dùng chung giữa các workers
+    """
+    url: str = ""
+    channel: str = "socketio"
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.url and self.scheme not in SUPPORTED_SCHEMES:
+            raise ConfigInvalidValueError(f"unsupported broker url: '{self.url}'")
+        if self.scheme == LOCAL_SCHEME and not self.local_path:
+            raise ConfigInvalidValueError(f"local broker url needs a socket path: '{self.url}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "BrokerSettings":
+        """
+        Tạo BrokerSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            BrokerSettings instance
+        """
+        return cls(
+            url=config.get_config("SERVER_BROKER_URL", cls.url),
+            channel=config.get_config("SERVER_BROKER_CHANNEL", cls.channel),
+        )
+
+    @classmethod
+    def local(cls, path: str) -> "BrokerSettings":
+        """
+        BrokerSettings cho LocalBroker tại một Unix socket
+
+        Args:
+            path: Đường dẫn Unix socket
+
+        Returns:
+            BrokerSettings instance
+        """
+        return cls(url=f"{LOCAL_SCHEME}://{path}")
+
+    @property
+    def scheme(self) -> str:
+        return urlparse(self.url).scheme
+
+    @property
+    def local_path(self) -> str:
+        """Đường dẫn Unix socket của LocalBroker (chỉ với scheme local)"""
+        return urlparse(self.url).path
+
+    def create_client_manager(self, json=None) -> AsyncManager | None:
+        """
+        Tạo client manager cho AsyncServer
+
+        Args:
+            json: Module-like object có dumps/loads để encode messages giữa
+                  workers (mặc định stdlib json)
+
+        Returns:
+            Client manager, hoặc None để AsyncServer dùng manager mặc định
+        """
+        if not self.url:
+            return None
+        if self.scheme == LOCAL_SCHEME:
+            return AsyncLocalManager(self.url, channel=self.channel, json=json)
+        if self.scheme == "amqp":
+            from socketio import AsyncAioPikaManager
+            return AsyncAioPikaManager(self.url, channel=self.channel, json=json)
+
+        from socketio import AsyncRedisManager
+        return AsyncRedisManager(self.url, channel=self.channel, json=json)
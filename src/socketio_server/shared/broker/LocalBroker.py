@@ -0,0 +1,162 @@
+"""
+LocalBroker - Message broker nội bộ cho nhiều server workers trên một máy
+
+Thay thế Redis khi chạy multi-worker trên cùng host: một process riêng lắng
+nghe trên Unix domain socket, mỗi worker (AsyncLocalManager) giữ một kết nối.
+Frame nhận từ một worker được forward nguyên vẹn tới mọi worker còn lại.
+
+Wire format: mỗi message là một frame `<uint32 big-endian length><payload>`.
+Broker không decode payload.
+
+Usage:
+    process = LocalBroker.spawn("/tmp/socketio-broker.sock")
+    ...
+    process.terminate()
+"""
+import asyncio
+import multiprocessing
+import os
+import struct
+
+from src.config import config
+from src.observability.logger import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+FRAME_HEADER = struct.Struct(">I")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """
+    Đọc một frame từ stream
+
+    Args:
+        reader: StreamReader của kết nối
+
+    Returns:
+        Payload của frame
+
+    Raises:
+        asyncio.IncompleteReadError: Kết nối bị đóng giữa chừng
+    """
+    header = await reader.readexactly(FRAME_HEADER.size)
+    (length,) = FRAME_HEADER.unpack(header)
+    return await reader.readexactly(length)
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """
+    Đóng gói payload thành một frame
+
+    Args:
+        payload: Dữ liệu cần gửi
+
+    Returns:
+        Header + payload
+    """
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+class LocalBroker:
+    """
+    Fan-out broker trên Unix domain socket.
+
+    Mỗi frame chỉ được encode một lần ở worker gửi; broker ghi cùng bytes đó
+    vào writer của từng worker khác.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Đường dẫn Unix socket
+        """
+        self._path = path
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        """Bind Unix socket và bắt đầu nhận kết nối từ workers"""
+        # Socket file cũ của lần chạy trước
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+        self._server = await asyncio.start_unix_server(self._handle_worker, path=self._path)
+        logger.info("Local broker listening on %s", self._path)
+
+    async def serve_forever(self) -> None:
+        """Start broker và chạy cho tới khi bị cancel"""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Đóng mọi kết nối và xóa socket file"""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+    async def _handle_worker(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Đọc frames từ một worker và forward tới các worker còn lại"""
+        self._writers.add(writer)
+        logger.info("Worker connected to broker (%d connected)", len(self._writers))
+        try:
+            while True:
+                payload = await read_frame(reader)
+                await self._forward(writer, encode_frame(payload))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            logger.info("Worker disconnected from broker (%d connected)", len(self._writers))
+
+    async def _forward(self, origin: asyncio.StreamWriter, frame: bytes) -> None:
+        """Ghi frame vào mọi worker khác rồi chờ các buffer được flush"""
+        targets = [writer for writer in self._writers if writer is not origin]
+        for writer in targets:
+            writer.write(frame)
+        # Backpressure: worker gửi chờ tới khi các worker nhận đọc kịp
+        results = await asyncio.gather(*(writer.drain() for writer in targets), return_exceptions=True)
+        for writer, result in zip(targets, results):
+            if isinstance(result, Exception):
+                self._writers.discard(writer)
+                writer.close()
+
+    @classmethod
+    def run(cls, path: str) -> None:
+        """
+        Chạy broker (blocking) - target của broker process
+
+        Args:
+            path: Đường dẫn Unix socket
+        """
+        setup_logging(config)
+        try:
+            asyncio.run(cls(path).serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    @classmethod
+    def spawn(cls, path: str) -> multiprocessing.Process:
+        """
+        Start broker trong process riêng
+
+        Dùng start method "spawn" để process broker có logging listener
+        riêng thay vì kế thừa thread đã chết sau fork.
+
+        Args:
+            path: Đường dẫn Unix socket
+
+        Returns:
+            Broker process (daemon)
+        """
+        context = multiprocessing.get_context("spawn")
+        process = context.Process(target=cls.run, args=(path,), name="socketio-broker", daemon=True)
+        process.start()
+        return process
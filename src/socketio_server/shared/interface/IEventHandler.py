@@ -47,7 +47,7 @@ class IEventHandler(ABC):
         Args:
             sio: SocketIO AsyncServer instance
             sid: Socket ID
-            data: Optional event data from client
+            data: Optional event data from client (với connect: auth payload)
 
         Returns:
             None: Fire-and-forget, không cần response
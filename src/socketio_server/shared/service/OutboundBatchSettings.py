@@ -0,0 +1,51 @@
+"""
+OutboundBatchSettings - Cấu hình gộp outbound events của server
+
+Đọc từ environment thông qua `src.config.Config`.
+"""
+from dataclasses import dataclass, field
+
+from src.config import Config, ConfigInvalidValueError
+
+
+@dataclass(frozen=True)
+class OutboundBatchSettings:
+    """
+    Immutable dataclass chứa cấu hình outbound batching.
+
+    Attributes:
+        enabled: Bật/tắt outbound batching
+        events: Các events được gộp (events khác emit ngay như cũ)
+        tick_ms: Thời gian gom events của một room trước khi emit
+        max_items: Số events tối đa trong một batch, đủ thì emit ngay
+    """
+    enabled: bool = False
+    events: tuple[str, ...] = field(default=("relay",))
+    tick_ms: float = 2.0
+    max_items: int = 32
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if self.tick_ms < 0:
+            raise ConfigInvalidValueError(f"tick_ms must not be negative: '{self.tick_ms}'")
+        if self.max_items < 1:
+            raise ConfigInvalidValueError(f"max_items must be positive: '{self.max_items}'")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "OutboundBatchSettings":
+        """
+        Tạo OutboundBatchSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            OutboundBatchSettings instance
+        """
+        events = config.get_list("SERVER_BATCH_EVENTS", ",", list(cls.events))
+        return cls(
+            enabled=config.get_bool("SERVER_BATCH_ENABLED", cls.enabled),
+            events=tuple(event.strip() for event in events if event.strip()),
+            tick_ms=config.get_float("SERVER_BATCH_TICK_MS", cls.tick_ms),
+            max_items=config.get_int("SERVER_BATCH_MAX_ITEMS", cls.max_items),
+        )
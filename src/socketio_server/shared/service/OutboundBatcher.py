@@ -0,0 +1,181 @@
+"""
+OutboundBatcher - Gộp outbound events cùng room trong một tick thành một packet
+
+Khi nhiều senders cùng publish tới một receiver room, mỗi payload là một
+emit, một packet và một websocket frame cho từng receiver. OutboundBatcher
+bọc `sio.emit`: events được cấu hình (ví dụ "relay") gửi tới room được giữ
+lại trong `tick_ms`, rồi emit thành một event `batch` duy nhất
+({"events": [[event, data], ...]}) cho room đó. Handlers vẫn gọi
+`sio.emit(...)` như cũ.
+
+Mỗi (namespace, room) có một danh sách chờ duy nhất, nên thứ tự mọi events
+tới room được giữ nguyên:
+- Event được gộp có skip_sid khác các events đang chờ: các events đang chờ
+  được emit trước, event mới bắt đầu danh sách mới.
+- Event không được gộp (hoặc có callback) tới room: các events đang chờ của
+  room được emit trước, rồi mới tới event đó.
+- Emit không có room (broadcast) hoặc tới nhiều rooms: mọi events đang chờ
+  được emit trước.
+
+Danh sách chờ được lấy ra ngay lúc gọi (không await) và emit dưới một lock
+FIFO, nên thứ tự emit trên wire đúng bằng thứ tự gọi `sio.emit`.
+
+Usage:
+    OutboundBatcher.install(sio, OutboundBatchSettings.from_config(config))
+    registry = ServerRegistry(sio)   # sau install để metrics đếm từng event
+"""
+import asyncio
+
+from socketio import AsyncServer
+
+from src.observability import metrics
+from src.observability.logger import get_logger
+from src.socketio_server.shared.enum.BaseEvent import BaseEvents
+from src.socketio_server.shared.service.OutboundBatchSettings import OutboundBatchSettings
+
+logger = get_logger(__name__)
+
+
+class OutboundBatcher:
+    """
+    Per-room outbound coalescing cho AsyncServer.
+    """
+
+    def __init__(self, sio: AsyncServer, settings: OutboundBatchSettings):
+        """
+        Args:
+            sio: SocketIO AsyncServer instance
+            settings: Cấu hình outbound batching
+        """
+        self._sio = sio
+        self._events = frozenset(settings.events)
+        self._tick = settings.tick_ms / 1000.0
+        self.max_items = settings.max_items
+
+        # (namespace, room) -> (skip_sid, skip key, [[event, data], ...])
+        self._groups: dict[tuple, tuple] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # Giữ thứ tự giữa các lần flush
+        self._flush_lock = asyncio.Lock()
+
+        # emit gốc, gán bởi install()
+        self._emit = sio.emit
+
+    @classmethod
+    def install(cls, sio: AsyncServer, settings: OutboundBatchSettings) -> "OutboundBatcher | None":
+        """
+        Bọc `sio.emit` bằng batcher nếu được bật
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            settings: Cấu hình outbound batching
+
+        Returns:
+            OutboundBatcher, hoặc None nếu batching bị tắt
+        """
+        if not settings.enabled:
+            return None
+
+        batcher = cls(sio, settings)
+        sio.emit = batcher.emit
+        return batcher
+
+    @property
+    def pending(self) -> int:
+        """Số events đang chờ trong mọi nhóm"""
+        return sum(len(items) for _, _, items in self._groups.values())
+
+    async def emit(self, event, data=None, to=None, room=None, skip_sid=None, namespace=None, **kwargs):
+        """
+        Thay thế `sio.emit`: gộp events được cấu hình, còn lại emit ngay
+        (sau các events đang chờ của cùng room)
+
+        Signature giống `AsyncServer.emit`.
+        """
+        target = to if to is not None else room
+        namespace = namespace or "/"
+        if not isinstance(target, str):
+            # Broadcast hoặc nhiều rooms: emit mọi events đang chờ trước
+            await self._send_before(self._take_all(), event, data, target, skip_sid, namespace, kwargs)
+            return
+
+        key = (namespace, target)
+        if event not in self._events or kwargs:
+            group = self._groups.pop(key, None)
+            if group is None and not self._flush_lock.locked():
+                return await self._emit(event, data, to=target, skip_sid=skip_sid, namespace=namespace, **kwargs)
+            await self._send_before([(key, group)] if group else [], event, data, target, skip_sid, namespace, kwargs)
+            return
+
+        if skip_sid is None or isinstance(skip_sid, str):
+            skip_key = skip_sid
+        else:
+            skip_key = tuple(sorted(skip_sid))
+
+        ready = []
+        group = self._groups.get(key)
+        if group is not None and group[1] != skip_key:
+            # skip_sid khác: emit các events đang chờ trước event mới
+            ready.append((key, self._groups.pop(key)))
+            group = None
+        if group is None:
+            group = self._groups[key] = (skip_sid, skip_key, [])
+        group[2].append([event, data])
+        if len(group[2]) >= self.max_items:
+            ready.append((key, self._groups.pop(key)))
+
+        if key in self._groups and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._tick, self._flush_later)
+        if ready:
+            async with self._flush_lock:
+                for ready_key, ready_group in ready:
+                    await self._send(ready_key, ready_group)
+
+    async def flush(self) -> None:
+        """Emit mọi nhóm đang chờ"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        groups = self._take_all()
+        async with self._flush_lock:
+            for key, group in groups:
+                await self._send(key, group)
+
+    def _take_all(self) -> list[tuple]:
+        """Lấy ra mọi nhóm đang chờ, theo thứ tự tạo"""
+        groups = list(self._groups.items())
+        self._groups.clear()
+        return groups
+
+    async def _send_before(self, groups: list[tuple], event, data, target, skip_sid, namespace, kwargs):
+        """Emit các nhóm đã lấy ra, rồi emit event không gộp"""
+        async with self._flush_lock:
+            for key, group in groups:
+                await self._send(key, group)
+            await self._emit(event, data, to=target, skip_sid=skip_sid, namespace=namespace, **kwargs)
+
+    async def _send(self, key: tuple, group: tuple) -> None:
+        """Emit một nhóm: một event thường hoặc một batch (gọi trong _flush_lock)"""
+        namespace, room = key
+        skip_sid, _, items = group
+        if len(items) == 1:
+            event, data = items[0]
+            await self._emit(event, data, to=room, skip_sid=skip_sid, namespace=namespace)
+        else:
+            await self._emit(
+                BaseEvents.BATCH.value, {"events": items}, to=room, skip_sid=skip_sid, namespace=namespace
+            )
+        metrics.OUTBOUND_BATCHES.labels(namespace).inc()
+        metrics.OUTBOUND_BATCHED_EVENTS.labels(namespace).inc(len(items))
+
+    def _flush_later(self) -> None:
+        """Timer callback: flush trong task riêng"""
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        task.add_done_callback(self._log_flush_error)
+
+    @staticmethod
+    def _log_flush_error(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Outbound batch flush failed: %s", task.exception())
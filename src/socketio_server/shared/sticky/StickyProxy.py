@@ -0,0 +1,138 @@
+"""
+StickyProxy - Front-end asyncio proxy phân phối connections tới server workers
+
+Mỗi worker lắng nghe trên Unix socket riêng. Proxy đọc request head của mỗi
+TCP connection, lấy `sid` từ query string và route tới worker đã tạo sid đó
+(WorkerSid); request không có sid (handshake, /metrics) được chia round-robin.
+
+- WebSocket upgrade: sau khi route, proxy chỉ chuyển bytes hai chiều
+- HTTP thường (polling): request được gửi với `Connection: close`, nên mỗi
+  TCP connection chỉ mang một request và không thể bị dùng lại cho sid khác
+"""
+import asyncio
+import itertools
+from urllib.parse import parse_qs, urlsplit
+
+from src.observability.logger import get_logger
+from src.socketio_server.shared.sticky.WorkerSid import WorkerSid
+
+logger = get_logger(__name__)
+
+# Giới hạn request head để client không giữ memory vô hạn
+MAX_HEAD_SIZE = 64 * 1024
+PIPE_CHUNK_SIZE = 64 * 1024
+
+BAD_GATEWAY = b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+
+
+class StickyProxy:
+    """
+    Sticky-session proxy cho Socket.IO trên nhiều worker processes.
+
+    Usage:
+        proxy = StickyProxy(["/tmp/worker-0.sock", "/tmp/worker-1.sock"])
+        await proxy.serve_forever("0.0.0.0", 5000)
+    """
+
+    def __init__(self, worker_paths: list[str]):
+        """
+        Args:
+            worker_paths: Unix socket của từng worker, theo worker index
+        """
+        self._worker_paths = worker_paths
+        self._next_worker = itertools.cycle(range(len(worker_paths)))
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        """
+        Lắng nghe trên host:port và proxy cho tới khi bị cancel
+
+        Args:
+            host: Host bind
+            port: Port bind
+        """
+        server = await asyncio.start_server(self._handle_client, host=host, port=port, limit=MAX_HEAD_SIZE)
+        logger.info("Sticky proxy listening on %s:%d for %d workers", host, port, len(self._worker_paths))
+        async with server:
+            await server.serve_forever()
+
+    def select_worker(self, target: str) -> int:
+        """
+        Chọn worker cho một request
+
+        Args:
+            target: Request target (path + query string)
+
+        Returns:
+            Worker index
+        """
+        sids = parse_qs(urlsplit(target).query).get("sid")
+        if sids:
+            worker = WorkerSid.worker_of(sids[0])
+            if worker is not None and worker < len(self._worker_paths):
+                return worker
+        return next(self._next_worker)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Route một client connection tới worker rồi chuyển bytes hai chiều"""
+        upstream_writer = None
+        try:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+
+            request_line, _, header_block = head.decode("latin-1").partition("\r\n")
+            parts = request_line.split(" ")
+            if len(parts) != 3:
+                return
+
+            headers = [line for line in header_block.split("\r\n") if line]
+            upgrade = any(line.lower().startswith("upgrade:") for line in headers)
+            if not upgrade:
+                # Một request mỗi connection: keep-alive không được mang sid khác
+                headers = [line for line in headers if not line.lower().startswith("connection:")]
+                headers.append("Connection: close")
+            head = ("\r\n".join([request_line, *headers]) + "\r\n\r\n").encode("latin-1")
+
+            worker = self.select_worker(parts[1])
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_unix_connection(
+                    self._worker_paths[worker]
+                )
+            except OSError as exc:
+                logger.error("Worker %d unavailable: %s", worker, exc)
+                writer.write(BAD_GATEWAY)
+                await writer.drain()
+                return
+
+            upstream_writer.write(head)
+            await self._pipe_both(reader, writer, upstream_reader, upstream_writer)
+        except ConnectionError:
+            pass
+        finally:
+            if upstream_writer is not None:
+                upstream_writer.close()
+            writer.close()
+
+    async def _pipe_both(self, client_reader, client_writer, upstream_reader, upstream_writer) -> None:
+        """Chuyển bytes hai chiều, dừng khi một phía đóng"""
+        tasks = [
+            asyncio.create_task(self._pipe(client_reader, upstream_writer)),
+            asyncio.create_task(self._pipe(upstream_reader, client_writer)),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Copy bytes từ reader sang writer tới EOF"""
+        while True:
+            data = await reader.read(PIPE_CHUNK_SIZE)
+            if not data:
+                return
+            writer.write(data)
+            await writer.drain()
@@ -0,0 +1,54 @@
+"""
+WorkerSid - Gắn worker index vào engineio sid
+
+Polling transport gửi nhiều HTTP requests cho cùng một sid, tất cả phải tới
+đúng process đã tạo session. Mỗi worker sinh sid dạng `<worker>.<random>`,
+nên front-end proxy route theo sid mà không cần giữ bảng sid -> worker.
+"""
+from socketio import AsyncServer
+
+
+class WorkerSid:
+    """
+    Encode/decode worker index trong engineio sid.
+
+    Usage:
+        WorkerSid.install(sio, worker_id=2)   # trong worker process
+        WorkerSid.worker_of("2.AbC...")       # -> 2 (trong proxy)
+    """
+
+    SEPARATOR = "."
+
+    @classmethod
+    def install(cls, sio: AsyncServer, worker_id: int) -> None:
+        """
+        Thay generator sid của engineio server để prefix worker index
+
+        Args:
+            sio: SocketIO AsyncServer instance
+            worker_id: Index của worker process hiện tại
+        """
+        eio = sio.eio
+        generate_id = eio.generate_id
+        prefix = f"{worker_id}{cls.SEPARATOR}"
+
+        def generate_worker_id() -> str:
+            return prefix + generate_id()
+
+        eio.generate_id = generate_worker_id
+
+    @classmethod
+    def worker_of(cls, sid: str) -> int | None:
+        """
+        Worker index trong sid
+
+        Args:
+            sid: engineio sid (query param `sid`)
+
+        Returns:
+            Worker index, hoặc None nếu sid không có prefix hợp lệ
+        """
+        prefix, separator, _ = sid.partition(cls.SEPARATOR)
+        if not separator or not prefix.isdigit():
+            return None
+        return int(prefix)
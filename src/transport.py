@@ -0,0 +1,151 @@
+"""
+transport - Transport policy dùng chung cho server và clients
+
+Đọc từ environment thông qua `src.config.Config`. Mặc định giữ hành vi của
+python-socketio (polling handshake rồi upgrade lên websocket);
+SOCKETIO_TRANSPORTS=websocket bỏ polling handshake, mỗi lần connect chỉ còn
+một websocket upgrade request.
+
+Usage:
+    transport = TransportSettings.from_config(config)
+    sio = AsyncServer(async_mode='asgi', **transport.server_options())
+    sio = AsyncClient(**transport.client_options())
+    await sio.connect(transport.url, transports=transport.transports)
+"""
+from dataclasses import dataclass, field
+
+from src.config import Config, ConfigInvalidValueError
+
+VALID_TRANSPORTS = ("polling", "websocket")
+
+# zlib window bits của permessage-deflate (aiohttp `compress`)
+WEBSOCKET_DEFLATE_WBITS = 15
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """
+    Immutable dataclass chứa transport policy.
+
+    Attributes:
+        url: Server URL mà clients connect tới
+        host: Host server bind
+        port: Port server bind
+        transports: Transports cho phép, theo thứ tự ưu tiên
+        ping_interval: Chu kỳ ping của server (giây)
+        ping_timeout: Thời gian chờ pong trước khi đóng connection (giây)
+        max_http_buffer_size: Kích thước message tối đa (bytes)
+        http_compression: Nén gzip/deflate cho polling responses
+        compression_threshold: Chỉ nén polling responses lớn hơn ngưỡng (bytes)
+        websocket_compression: permessage-deflate cho websocket frames
+        ws_max_size: Kích thước websocket message tối đa server nhận (uvicorn)
+        ws_ping_interval: Chu kỳ websocket ping của uvicorn (giây), 0 = tắt
+                          (engineio vẫn ping theo ping_interval)
+        ws_max_msg_size: Kích thước websocket message tối đa client nhận
+                         (aiohttp), 0 = không giới hạn
+    """
+    url: str = "http://localhost:5000"
+    host: str = "0.0.0.0"
+    port: int = 5000
+    transports: tuple[str, ...] = field(default=VALID_TRANSPORTS)
+    ping_interval: float = 25.0
+    ping_timeout: float = 20.0
+    max_http_buffer_size: int = 1_000_000
+    http_compression: bool = True
+    compression_threshold: int = 1024
+    # Payload chủ yếu là ảnh đã nén, deflate chỉ tốn CPU
+    websocket_compression: bool = False
+    # Mặc định của uvicorn và aiohttp
+    ws_max_size: int = 16 * 1024 * 1024
+    ws_ping_interval: float = 20.0
+    ws_max_msg_size: int = 4 * 1024 * 1024
+
+    def __post_init__(self):
+        """Validate các giá trị cấu hình"""
+        if not self.transports or any(name not in VALID_TRANSPORTS for name in self.transports):
+            raise ConfigInvalidValueError(f"transports must be a subset of {VALID_TRANSPORTS}: '{self.transports}'")
+        if self.ping_interval <= 0 or self.ping_timeout <= 0:
+            raise ConfigInvalidValueError("ping_interval and ping_timeout must be positive")
+        if self.max_http_buffer_size < 1:
+            raise ConfigInvalidValueError(f"max_http_buffer_size must be positive: '{self.max_http_buffer_size}'")
+        if self.ws_max_size < 1:
+            raise ConfigInvalidValueError(f"ws_max_size must be positive: '{self.ws_max_size}'")
+        if self.ws_ping_interval < 0 or self.ws_max_msg_size < 0:
+            raise ConfigInvalidValueError("ws_ping_interval and ws_max_msg_size must not be negative")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TransportSettings":
+        """
+        Tạo TransportSettings từ Config
+
+        Args:
+            config: Config instance
+
+        Returns:
+            TransportSettings instance
+        """
+        transports = config.get_list("SOCKETIO_TRANSPORTS", ",", list(VALID_TRANSPORTS))
+        return cls(
+            url=config.get_config("SOCKETIO_URL", cls.url),
+            host=config.get_config("SERVER_HOST", cls.host),
+            port=config.get_int("SERVER_PORT", cls.port),
+            transports=tuple(name.strip() for name in transports if name.strip()),
+            ping_interval=config.get_float("SOCKETIO_PING_INTERVAL", cls.ping_interval),
+            ping_timeout=config.get_float("SOCKETIO_PING_TIMEOUT", cls.ping_timeout),
+            max_http_buffer_size=config.get_int("SOCKETIO_MAX_HTTP_BUFFER_SIZE", cls.max_http_buffer_size),
+            http_compression=config.get_bool("SOCKETIO_HTTP_COMPRESSION", cls.http_compression),
+            compression_threshold=config.get_int("SOCKETIO_COMPRESSION_THRESHOLD", cls.compression_threshold),
+            websocket_compression=config.get_bool("SOCKETIO_WEBSOCKET_COMPRESSION", cls.websocket_compression),
+            ws_max_size=config.get_int("SOCKETIO_WS_MAX_SIZE", cls.ws_max_size),
+            ws_ping_interval=config.get_float("SOCKETIO_WS_PING_INTERVAL", cls.ws_ping_interval),
+            ws_max_msg_size=config.get_int("SOCKETIO_WS_MAX_MSG_SIZE", cls.ws_max_msg_size),
+        )
+
+    @property
+    def websocket_only(self) -> bool:
+        return self.transports == ("websocket",)
+
+    def server_options(self) -> dict:
+        """
+        Keyword arguments cho AsyncServer
+
+        Returns:
+            Dict options transport của engineio server
+        """
+        return {
+            "transports": list(self.transports),
+            "ping_interval": self.ping_interval,
+            "ping_timeout": self.ping_timeout,
+            "max_http_buffer_size": self.max_http_buffer_size,
+            "http_compression": self.http_compression,
+            "compression_threshold": self.compression_threshold,
+            # Không có polling thì không có upgrade
+            "allow_upgrades": not self.websocket_only,
+        }
+
+    def uvicorn_options(self) -> dict:
+        """
+        Keyword arguments cho uvicorn (websocket server nằm ở uvicorn)
+
+        Returns:
+            Dict options websocket của uvicorn
+        """
+        return {
+            "ws_max_size": self.ws_max_size,
+            "ws_ping_interval": self.ws_ping_interval or None,
+            "ws_per_message_deflate": self.websocket_compression,
+        }
+
+    def client_options(self) -> dict:
+        """
+        Keyword arguments cho AsyncClient
+
+        Returns:
+            Dict options websocket của engineio client (aiohttp ws_connect)
+        """
+        return {
+            "websocket_extra_options": {
+                "compress": WEBSOCKET_DEFLATE_WBITS if self.websocket_compression else 0,
+                "max_msg_size": self.ws_max_msg_size,
+            },
+        }